@@ -0,0 +1,9 @@
+'''
+Benchmarks for types-linq. They only need the standard library and run from the repository root:
+
+    python -m benchmarks run --sizes 1e3,1e5    # time every operator on every source
+    python -m benchmarks commits main HEAD      # catch regressions between two revisions
+    python -m benchmarks.speedup
+
+See `python -m benchmarks --help` for the other commands and options.
+'''
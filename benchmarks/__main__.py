@@ -0,0 +1,165 @@
+'''
+Times the operators of Enumerable and MoreEnumerable on several sources and sizes.
+
+    python -m benchmarks run [--sizes 1e3,1e4,1e5] [--sources list,generator] [--filter REGEX]
+                             [--repeat R] [--no-memory] [--json PATH] [--target DIR]
+    python -m benchmarks compare OLD.json NEW.json [--threshold 1.2]
+    python -m benchmarks commits OLD_REV NEW_REV [--threshold 1.2] [run options]
+    python -m benchmarks list
+
+`run` prints the time per source element and the peak memory of each case, and can save them to
+a JSON file. `compare` compares two saved runs, and `commits` checks out two revisions in
+temporary git worktrees and runs the same suite, the one in this directory, on both. Both exit
+with status 1 if a case became slower, or used more memory, by more than the threshold ratio.
+'''
+from __future__ import annotations
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from typing import List
+
+
+def _sizes(text: str) -> List[int]:
+    return [int(float(s)) for s in text.split(',')]
+
+
+def _add_run_options(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('--sizes', type=_sizes, default=[1000, 10_000, 100_000],
+        help='comma-separated source sizes, e.g. 1e3,1e7')
+    parser.add_argument('--sources', default='list,range,generator,cached,ordered',
+        help='comma-separated source kinds')
+    parser.add_argument('--filter', help='only run the cases whose name matches this regex')
+    parser.add_argument('--repeat', type=int, default=5, help='measurements per case; the best is kept')
+    parser.add_argument('--no-memory', action='store_true', help='do not measure peak memory')
+
+
+def _run_arguments(args: argparse.Namespace) -> List[str]:
+    argv = ['--sizes', ','.join(map(str, args.sizes)), '--sources', args.sources,
+        '--repeat', str(args.repeat)]
+    if args.filter is not None:
+        argv += ['--filter', args.filter]
+    if args.no_memory:
+        argv.append('--no-memory')
+    return argv
+
+
+def _run(args: argparse.Namespace) -> int:
+    if args.target is not None:
+        # must happen before types_linq is imported
+        sys.path.insert(0, os.path.abspath(args.target))
+    import types_linq
+    from . import runner
+    from .suite import SOURCES
+
+    sources = args.sources.split(',')
+    unknown = [s for s in sources if s not in SOURCES]
+    if unknown:
+        print(f'unknown sources: {", ".join(unknown)}', file=sys.stderr)
+        return 2
+    print(f'types_linq: {os.path.dirname(types_linq.__file__)}')
+    print(runner.format_header())
+    results = runner.run(args.sizes, sources, args.filter, args.repeat, not args.no_memory,
+        lambda r: print(runner.format_result(r), flush=True))
+    if args.json is not None:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=1)
+    return 0
+
+
+def _report(lines: List[str], regressions: List[str]) -> int:
+    print('\n'.join(lines))
+    if regressions:
+        print(f'{len(regressions)} regressions: {", ".join(regressions)}')
+        return 1
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    from . import runner
+
+    with open(args.old) as f:
+        old = json.load(f)
+    with open(args.new) as f:
+        new = json.load(f)
+    return _report(*runner.compare(old, new, args.threshold))
+
+
+def _git(*argv: str) -> str:
+    return subprocess.run(['git', *argv], check=True, stdout=subprocess.PIPE,
+        universal_newlines=True).stdout.strip()
+
+
+def _commits(args: argparse.Namespace) -> int:
+    from . import runner
+
+    # the suite always comes from this directory, so that both revisions run the same cases
+    suite_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for i, rev in enumerate((args.old, args.new)):
+            worktree = os.path.join(tmp, f'rev{i}')
+            output = os.path.join(tmp, f'rev{i}.json')
+            _git('worktree', 'add', '--detach', worktree, rev)
+            try:
+                print(f'{rev} ({_git("-C", worktree, "rev-parse", "--short", "HEAD")})', flush=True)
+                subprocess.run([sys.executable, '-m', 'benchmarks', 'run', '--target', worktree,
+                    '--json', output, *_run_arguments(args)], cwd=suite_root, check=True)
+            finally:
+                _git('worktree', 'remove', '--force', worktree)
+            with open(output) as f:
+                results.append(json.load(f))
+    return _report(*runner.compare(results[0], results[1], args.threshold))
+
+
+def _list(args: argparse.Namespace) -> int:
+    from .suite import CASES, SOURCES, missing_operators
+
+    for case in CASES:
+        print(case.name)
+    print(f'{len(CASES)} cases; sources: {", ".join(SOURCES)}')
+    missing = missing_operators()
+    if missing:
+        print(f'operators without a case: {", ".join(missing)}')
+        return 1
+    return 0
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+
+    run_parser = commands.add_parser('run', help='time the cases')
+    _add_run_options(run_parser)
+    run_parser.add_argument('--json', help='save the results to this file')
+    run_parser.add_argument('--target', help='import types_linq from this directory')
+    run_parser.set_defaults(func=_run)
+
+    compare_parser = commands.add_parser('compare', help='compare two saved runs')
+    compare_parser.add_argument('old')
+    compare_parser.add_argument('new')
+    compare_parser.add_argument('--threshold', type=float, default=1.2,
+        help='ratio above which a case is a regression')
+    compare_parser.set_defaults(func=_compare)
+
+    commits_parser = commands.add_parser('commits', help='run on two git revisions and compare')
+    commits_parser.add_argument('old')
+    commits_parser.add_argument('new')
+    commits_parser.add_argument('--threshold', type=float, default=1.2,
+        help='ratio above which a case is a regression')
+    _add_run_options(commits_parser)
+    commits_parser.set_defaults(func=_commits)
+
+    list_parser = commands.add_parser('list', help='list the cases')
+    list_parser.set_defaults(func=_list)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,156 @@
+'''
+Times the cases of `benchmarks.suite` and compares the results of two runs.
+'''
+from __future__ import annotations
+from collections import deque
+import gc
+import re
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .suite import CASES, SOURCES, Case, operator_name
+
+
+# one row of a run: operator, source ('-' for static constructors), size, ns per element,
+# peak memory in bytes (None if not measured), and the error message if the case failed
+Result = Dict[str, Any]
+
+# peak memory growth below this many bytes is not reported as a regression, whatever the ratio
+_min_memory_growth = 4096
+
+
+def _consume(query: Any) -> None:
+    # runs the query to the end. iter() so that Enumerable.__len__ is not called
+    if isinstance(query, Iterable):
+        deque(iter(query), maxlen=0)  # type: ignore
+
+
+def _best_time(func: Callable[[], None], repeat: int) -> float:
+    # seconds per call, the best of repeat measurements. each measurement calls func enough
+    # times to take at least 0.2 seconds, like `python -m timeit`. the calibration run counts
+    # as the first measurement
+    timer = timeit.Timer(func)
+    number, first = timer.autorange()
+    return min([first, *timer.repeat(repeat - 1, number)]) / number
+
+
+def _peak_memory(func: Callable[[], None]) -> int:
+    # bytes allocated at the peak of one call, not counting what existed before
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def _measure(
+    case: Case,
+    source: Callable[[], Any],
+    size: int,
+    repeat: int,
+    memory: bool,
+) -> Optional[Result]:
+    # returns None if the source does not have the operator of the case
+    result: Result = {'operator': case.name, 'size': size, 'ns_per_element': None,
+        'peak_bytes': None, 'error': None}
+    try:
+        # the source is built once, so that e.g. filling the cache of a cached source is not timed
+        src = source()
+        if case.uses_source and not hasattr(src, operator_name(case.name)):
+            return None
+        def run():
+            _consume(case.query(src, size))
+        run()  # warm-up, and checks that the case works with this version of types-linq
+        result['ns_per_element'] = _best_time(run, repeat) / max(size, 1) * 1e9
+        if memory:
+            result['peak_bytes'] = _peak_memory(run)
+    except Exception as e:
+        result['error'] = f'{type(e).__name__}: {e}'
+    return result
+
+
+def run(
+    sizes: List[int],
+    sources: List[str],
+    pattern: Optional[str] = None,
+    repeat: int = 5,
+    memory: bool = True,
+    report: Callable[[Result], None] = lambda _: None,
+) -> List[Result]:
+    '''
+    Times every case whose name matches the regex pattern on each source and size. report is
+    called with each result as soon as it is measured.
+    '''
+    cases = [c for c in CASES if pattern is None or re.search(pattern, c.name)]
+    results: List[Result] = []
+    for size in sizes:
+        data = list(range(size))
+        for case in cases:
+            if case.uses_source:
+                runs = [(name, lambda f=SOURCES[name]: f(data)) for name in sources]
+            else:
+                runs = [('-', lambda: None)]
+            for source_name, source in runs:
+                result = _measure(case, source, size, repeat, memory)
+                if result is None:
+                    continue
+                result['source'] = source_name
+                report(result)
+                results.append(result)
+    return results
+
+
+def format_header() -> str:
+    return f'{"operator":<27}{"source":<11}{"size":>10}{"ns/elem":>12}{"peak KiB":>12}'
+
+
+def format_result(result: Result) -> str:
+    head = f'{result["operator"]:<27}{result["source"]:<11}{result["size"]:>10}'
+    if result['error'] is not None:
+        return f'{head}  {result["error"]}'
+    peak = result['peak_bytes']
+    peak_text = '-' if peak is None else f'{peak / 1024:.1f}'
+    return f'{head}{result["ns_per_element"]:>12.1f}{peak_text:>12}'
+
+
+def _key(result: Result) -> Tuple[str, str, int]:
+    return result['operator'], result['source'], result['size']
+
+
+def compare(
+    old: List[Result],
+    new: List[Result],
+    threshold: float,
+) -> Tuple[List[str], List[str]]:
+    '''
+    Compares the cases measured in both runs. Returns the report lines, and the cases that became
+    slower, or used more peak memory, by more than the threshold ratio.
+    '''
+    old_by_key = {_key(r): r for r in old}
+    lines = [f'{"operator":<27}{"source":<11}{"size":>10}{"old ns":>10}{"new ns":>10}{"time":>8}'
+        f'{"memory":>8}']
+    regressions: List[str] = []
+    for result in new:
+        key = _key(result)
+        before = old_by_key.get(key)
+        if before is None or before['error'] is not None or result['error'] is not None:
+            continue
+        time_ratio = result['ns_per_element'] / before['ns_per_element']
+        memory_ratio = None
+        memory_grew = False
+        if before['peak_bytes'] and result['peak_bytes'] is not None:
+            memory_ratio = result['peak_bytes'] / before['peak_bytes']
+            memory_grew = memory_ratio > threshold and \
+                result['peak_bytes'] - before['peak_bytes'] >= _min_memory_growth
+        flag = ''
+        if time_ratio > threshold or memory_grew:
+            flag = '  REGRESSION'
+            regressions.append('{}/{}/{}'.format(*key))
+        memory_text = '-' if memory_ratio is None else f'{memory_ratio:.2f}x'
+        lines.append(f'{key[0]:<27}{key[1]:<11}{key[2]:>10}{before["ns_per_element"]:>10.1f}'
+            f'{result["ns_per_element"]:>10.1f}{time_ratio:>7.2f}x{memory_text:>8}{flag}')
+    return lines, regressions
@@ -0,0 +1,152 @@
+'''
+Checks that the operators backed by builtin iterators stay faster than the equivalent hand-written
+generators, which is how they were implemented before.
+
+    python -m benchmarks.speedup [--size N] [--repeat R] [--min-speedup X]
+
+Exits with status 1 if an operator is less than X times as fast as its generator. By default X is
+1.2, and lower for operators whose time is mostly spent calling the user's function.
+'''
+from __future__ import annotations
+import argparse
+import sys
+from itertools import islice
+import timeit
+from typing import Any, Callable, Iterable, Iterator, List, Tuple
+
+from types_linq import Enumerable
+from types_linq.more import MoreEnumerable
+
+
+def _source(size: int) -> Callable[[], Iterator[int]]:
+    # a non-sequence source, so that no operator can use a view
+    return lambda: iter(range(size))
+
+
+def _take_while(it: Iterable[Any], predicate: Callable[[Any], bool]) -> Iterator[Any]:
+    for elem in it:
+        if not predicate(elem):
+            break
+        yield elem
+
+
+def _skip_while(it: Iterable[Any], predicate: Callable[[Any], bool]) -> Iterator[Any]:
+    iterator = iter(it)
+    for elem in iterator:
+        if not predicate(elem):
+            yield elem
+            break
+    yield from iterator
+
+
+def _flatten(it: Iterable[Any], collection_selector: Callable[[Any], Iterable[Any]]) -> Iterator[Any]:
+    for elem in it:
+        yield from collection_selector(elem)
+
+
+def _zip2(it: Iterable[Any], other: Iterable[Any], result_selector: Callable[..., Any]) -> Iterator[Any]:
+    for tup in zip(it, other):
+        yield result_selector(*tup)
+
+
+def _scan(it: Iterable[Any], seed: Any, transformation: Callable[[Any, Any], Any]) -> Iterator[Any]:
+    yield seed
+    for elem in it:
+        seed = transformation(seed, elem)
+        yield seed
+
+
+def _cycle(it: Iterable[Any]) -> Iterator[Any]:
+    memo: List[Any] = []
+    for elem in it:
+        memo.append(elem)
+        yield elem
+    while True:
+        yield from memo
+
+
+def _take(it: Iterable[Any], count: int) -> Iterator[Any]:
+    for i, elem in enumerate(it):
+        if i >= count:
+            break
+        yield elem
+
+
+_Case = Tuple[str, float, Callable[[], Iterable[Any]], Callable[[], Iterable[Any]]]
+
+
+def _cases(size: int) -> List[_Case]:
+    # (name, default minimum speedup, operator, generator). both produce the same elements
+    src = _source(size)
+    sub = (1, 2)
+    below_size = size.__gt__
+    return [
+        ('select', 1.1, lambda: Enumerable(src).select(abs), lambda: (abs(x) for x in src())),
+        ('where', 1.1, lambda: Enumerable(src).where(bool), lambda: (x for x in src() if x)),
+        ('take', 1.2, lambda: Enumerable(src).take(size // 2), lambda: _take(src(), size // 2)),
+        ('concat', 1.2, lambda: Enumerable(src).concat(src()),
+            lambda: (x for it in (src(), src()) for x in it)),
+        ('take_while', 1.1, lambda: Enumerable(src).take_while(below_size),
+            lambda: _take_while(src(), below_size)),
+        ('skip_while', 1.2, lambda: Enumerable(src).skip_while(bool), lambda: _skip_while(src(), bool)),
+        ('select_many', 1.0, lambda: Enumerable(src).select_many(lambda _: sub),
+            lambda: _flatten(src(), lambda _: sub)),
+        ('zip2', 1.0, lambda: Enumerable(src).zip2(src(), max), lambda: _zip2(src(), src(), max)),
+        ('every', 1.2, lambda: Enumerable(src).every(3),
+            lambda: (x for i, x in enumerate(src()) if i % 3 == 0)),
+        ('enumerate', 1.2, lambda: MoreEnumerable(src).enumerate(),
+            lambda: ((i, x) for i, x in enumerate(src()))),
+        ('scan', 1.0, lambda: MoreEnumerable(src).scan(0, max), lambda: _scan(src(), 0, max)),
+        ('cycle', 1.2, lambda: MoreEnumerable(src).cycle().take(3 * size),
+            lambda: islice(_cycle(src()), 3 * size)),
+    ]
+
+
+def _consume(iterable: Iterable[Any]) -> None:
+    for _ in iterable:
+        pass
+
+
+def _best_times(
+    operator: Callable[[], Iterable[Any]],
+    generator: Callable[[], Iterable[Any]],
+    repeat: int,
+) -> Tuple[float, float]:
+    # alternates the runs so that both see the same background load
+    op_time = gen_time = float('inf')
+    for _ in range(repeat):
+        op_time = min(op_time, timeit.timeit(lambda: _consume(operator()), number=1))
+        gen_time = min(gen_time, timeit.timeit(lambda: _consume(generator()), number=1))
+    return op_time, gen_time
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.speedup', description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size', type=int, default=200_000, help='number of source elements')
+    parser.add_argument('--repeat', type=int, default=9, help='runs per measurement; the best is kept')
+    parser.add_argument('--min-speedup', type=float, help='fail below this ratio for every operator')
+    args = parser.parse_args(argv)
+
+    failed: List[str] = []
+    print(f'{"operator":<24}{"operator":>12}{"generator":>12}{"speedup":>10}')
+    for name, min_speedup, operator, generator in _cases(args.size):
+        if args.min_speedup is not None:
+            min_speedup = args.min_speedup
+        # iter() so that list() does not call len() which would enumerate the operator twice
+        assert [*iter(operator())] == [*generator()], name
+        op_time, gen_time = _best_times(operator, generator, args.repeat)
+        speedup = gen_time / op_time
+        flag = ''
+        if speedup < min_speedup:
+            failed.append(name)
+            flag = '  FAIL'
+        print(f'{name:<24}{op_time * 1e3:>10.2f}ms{gen_time * 1e3:>10.2f}ms{speedup:>9.2f}x{flag}')
+    if failed:
+        print(f'slower than required: {", ".join(failed)}')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,249 @@
+'''
+The operators timed by `python -m benchmarks run`, and the sources they run on.
+
+Each case is a function of a source enumerable and the source size. It returns the query, which
+the runner enumerates to the end if it is iterable. Cases of static constructors ignore the source.
+The ordered source is an OrderedEnumerable, so the cases of MoreEnumerable operators do not run on
+it, and the cases of its own methods such as `then_by()` only run on it.
+'''
+from __future__ import annotations
+from operator import add
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Set, Tuple
+
+from types_linq import Enumerable
+from types_linq.more import MoreEnumerable
+from types_linq.ordered_enumerable import OrderedEnumerable
+
+
+def _ident(x: Any) -> Any:
+    return x
+
+
+def _key(x: Any) -> Any:
+    return x % 100
+
+
+def _noop(*_: Any) -> None:
+    return None
+
+
+def _make_source(data: List[int]) -> MoreEnumerable[int]:
+    return MoreEnumerable(data)
+
+
+def _range_source(data: List[int]) -> MoreEnumerable[int]:
+    return MoreEnumerable(range(len(data)))
+
+
+def _generator_source(data: List[int]) -> MoreEnumerable[int]:
+    return MoreEnumerable(lambda: (x for x in data))
+
+
+def _cached_source(data: List[int]) -> MoreEnumerable[int]:
+    cached = MoreEnumerable(lambda: (x for x in data)).as_cached()
+    for _ in cached:
+        pass
+    return cached.as_more()
+
+
+def _ordered_source(data: List[int]) -> OrderedEnumerable[int, int]:
+    # the sort is part of the measured time; the values are already in order. not wrapped in
+    # as_more(), so that the heap selection, indexing and then_by() of OrderedEnumerable are timed
+    return Enumerable(data).order_by(_ident)
+
+
+SOURCES: Dict[str, Callable[[List[int]], Enumerable[int]]] = {
+    'list': _make_source,
+    'range': _range_source,
+    'generator': _generator_source,
+    'cached': _cached_source,
+    'ordered': _ordered_source,
+}
+
+
+class Case(NamedTuple):
+    name: str
+    # the source is a MoreEnumerable, or an OrderedEnumerable for the ordered source
+    query: Callable[[Any, int], Any]
+    # False for static constructors, which run once per size instead of once per source
+    uses_source: bool = True
+
+
+def _tree(n: int) -> Callable[[int], List[int]]:
+    # children of a complete binary tree with n nodes
+    return lambda x: [c for c in (2 * x + 1, 2 * x + 2) if c < n]
+
+
+def _pairs(n: int) -> List[Tuple[int, int]]:
+    return [(k, k) for k in range(0, n, 10)]
+
+
+def _replay(cached: Enumerable[int], times: int) -> None:
+    # fills the cache, then enumerates it again from the start
+    for _ in range(times + 1):
+        for _ in cached:
+            pass
+
+
+_steps = (2, 10, 100, 1000)
+
+
+CASES: List[Case] = [
+    Case('aggregate', lambda q, n: q.aggregate(add)),
+    Case('aggregate(seed)', lambda q, n: q.aggregate(0, add)),
+    Case('aggregate_by', lambda q, n: q.aggregate_by(_key, 0, add)),
+    Case('aggregate_by2', lambda q, n: q.aggregate_by2(_key, lambda _: 0, add)),
+    Case('aggregate_many', lambda q, n: q.aggregate_many((0, add), (0, max))),
+    Case('all', lambda q, n: q.all(lambda x: x >= 0)),
+    Case('any', lambda q, n: q.any(lambda x: x < 0)),
+    Case('append', lambda q, n: q.append(-1)),
+    Case('as_cached', lambda q, n: q.as_cached()),
+    # the storage of the cache: filling it, then replaying it twice from the list, or from the
+    # ring buffer once half of the values were evicted
+    Case('as_cached(replay)', lambda q, n: _replay(q.as_cached(), 2)),
+    Case('as_cached(cache_capacity)', lambda q, n: _replay(q.as_cached(cache_capacity=n // 2 + 1), 2)),
+    Case('as_more', lambda q, n: q.as_more()),
+    Case('as_numeric', lambda q, n: q.as_numeric().sum()),
+    Case('as_parallel', lambda q, n: q.as_parallel().select(abs)),
+    Case('average', lambda q, n: q.average()),
+    Case('average2', lambda q, n: q.average2(None)),
+    Case('cast', lambda q, n: q.cast(int)),
+    Case('chunk', lambda q, n: q.chunk(100)),
+    Case('concat', lambda q, n: q.concat(range(n))),
+    Case('contains', lambda q, n: q.contains(n - 1)),
+    Case('count', lambda q, n: q.count()),
+    Case('count(predicate)', lambda q, n: q.count(lambda x: x % 2 == 0)),
+    Case('count_by', lambda q, n: q.count_by(_key)),
+    Case('create_ordered_enumerable', lambda q, n: q.create_ordered_enumerable(_key, None, False)),
+    Case('default_if_empty', lambda q, n: q.default_if_empty(0)),
+    Case('distinct', lambda q, n: q.distinct()),
+    Case('distinct(unhashable)', lambda q, n: q.select(lambda x: [x % 1000]).distinct()),
+    Case('distinct_by', lambda q, n: q.distinct_by(_key)),
+    Case('element_at', lambda q, n: q.element_at(n // 2)),
+    Case('elements_in', lambda q, n: q.elements_in(n // 4, 3 * n // 4)),
+    Case('empty', lambda q, n: Enumerable.empty(), uses_source=False),
+    Case('every', lambda q, n: q.every(3)),
+    # every() against the where2() filter it replaces, for a sweep of steps
+    *(Case(f'every({step})', lambda q, n, step=step: q.every(step)) for step in _steps),
+    *(Case(f'where2(i % {step} == 0)', lambda q, n, step=step: q.where2(lambda x, i: i % step == 0))
+        for step in _steps),
+    *(Case(f'elements_in(::{step})', lambda q, n, step=step: q.elements_in(slice(None, None, step)))
+        for step in _steps),
+    Case('except1', lambda q, n: q.except1(range(0, n, 2))),
+    Case('except_by', lambda q, n: q.except_by(range(0, n, 2), _ident)),
+    Case('first', lambda q, n: q.first(lambda x: x == n - 1)),
+    Case('first2', lambda q, n: q.first2(lambda x: x < 0, None)),
+    Case('full_outer_join', lambda q, n: q.full_outer_join(_pairs(n), _ident, lambda p: p[0],
+        lambda x, p: x)),
+    Case('group_by', lambda q, n: q.group_by(_key, _ident)),
+    Case('group_by2', lambda q, n: q.group_by2(_key)),
+    # the key lookups of ComposeMap, with 1000 groups of hashable and unhashable keys
+    Case('group_by2(int keys)', lambda q, n: q.group_by2(lambda x: x % 1000)),
+    Case('group_by2(tuple keys)', lambda q, n: q.group_by2(lambda x: (x % 1000, 0))),
+    Case('group_by2(list keys)', lambda q, n: q.group_by2(lambda x: [x % 1000])),
+    Case('group_join', lambda q, n: q.group_join(_pairs(n), _ident, lambda p: p[0],
+        lambda x, ps: x)),
+    Case('index', lambda q, n: q.index(n - 1)),
+    Case('intersect', lambda q, n: q.intersect(range(0, n, 2))),
+    Case('intersect_by', lambda q, n: q.intersect_by(range(0, n, 2), _ident)),
+    Case('join', lambda q, n: q.join(_pairs(n), _ident, lambda p: p[0], lambda x, p: x)),
+    Case('last', lambda q, n: q.last()),
+    Case('last2', lambda q, n: q.last2(lambda x: x < 0, None)),
+    Case('left_join', lambda q, n: q.left_join(_pairs(n), _ident, lambda p: p[0], lambda x, p: x)),
+    Case('max', lambda q, n: q.max()),
+    Case('max2', lambda q, n: q.max2(None)),
+    Case('max_by', lambda q, n: q.max_by(_key)),
+    Case('min', lambda q, n: q.min()),
+    Case('min2', lambda q, n: q.min2(None)),
+    Case('min_by', lambda q, n: q.min_by(_key)),
+    Case('of_type', lambda q, n: q.of_type(int)),
+    Case('order_by', lambda q, n: q.order_by(_key)),
+    Case('order_by.then_by', lambda q, n: q.order_by(_key).then_by(_ident)),
+    Case('order_by_descending', lambda q, n: q.order_by_descending(_ident)),
+    Case('prepend', lambda q, n: q.prepend(-1)),
+    Case('range', lambda q, n: Enumerable.range(0, n), uses_source=False),
+    Case('repeat', lambda q, n: Enumerable.repeat(0, n), uses_source=False),
+    Case('reverse', lambda q, n: q.reverse()),
+    Case('select', lambda q, n: q.select(abs)),
+    Case('select2', lambda q, n: q.select2(lambda x, i: i)),
+    Case('select_batch', lambda q, n: q.select_batch(_ident)),
+    Case('select_many', lambda q, n: q.select_many(lambda x: (x, x))),
+    Case('select_many(result)', lambda q, n: q.select_many(lambda x: (x, x), lambda x, y: y)),
+    Case('select_many2', lambda q, n: q.select_many2(lambda x, i: (x, i))),
+    Case('sequence_equal', lambda q, n: q.sequence_equal(range(n))),
+    Case('single', lambda q, n: q.single(lambda x: x == n - 1)),
+    Case('single2', lambda q, n: q.single2(lambda x: x < 0, None)),
+    Case('skip', lambda q, n: q.skip(n // 2)),
+    Case('skip_last', lambda q, n: q.skip_last(n // 2)),
+    Case('skip_while', lambda q, n: q.skip_while(lambda x: x < n // 2)),
+    Case('skip_while2', lambda q, n: q.skip_while2(lambda x, i: i < n // 2)),
+    Case('stats', lambda q, n: q.stats()),
+    Case('sum', lambda q, n: q.sum()),
+    Case('sum2', lambda q, n: q.sum2(0)),
+    Case('take', lambda q, n: q.take(n // 2)),
+    Case('take_last', lambda q, n: q.take_last(n // 2)),
+    Case('take_while', lambda q, n: q.take_while(lambda x: x < n // 2)),
+    Case('take_while2', lambda q, n: q.take_while2(lambda x, i: i < n // 2)),
+    Case('then_by', lambda q, n: q.then_by(_key)),
+    Case('then_by_descending', lambda q, n: q.then_by_descending(_key)),
+    Case('to_dict', lambda q, n: q.to_dict(_ident)),
+    Case('to_list', lambda q, n: q.to_list()),
+    Case('to_lookup', lambda q, n: q.to_lookup(_key)),
+    Case('to_set', lambda q, n: q.to_set()),
+    Case('to_tuple', lambda q, n: q.to_tuple()),
+    Case('union', lambda q, n: q.union(range(0, n, 2))),
+    Case('union_by', lambda q, n: q.union_by(range(0, n, 2), _key)),
+    Case('where', lambda q, n: q.where(lambda x: x % 2 == 0)),
+    Case('where2', lambda q, n: q.where2(lambda x, i: i % 2 == 0)),
+    Case('zip', lambda q, n: q.zip(range(n))),
+    Case('zip2', lambda q, n: q.zip2(range(n), max)),
+
+    # MoreEnumerable
+    Case('aggregate_right', lambda q, n: q.aggregate_right(0, lambda x, acc: acc + x)),
+    Case('consume', lambda q, n: q.consume()),
+    Case('cycle', lambda q, n: q.cycle(2)),
+    Case('enumerate', lambda q, n: q.enumerate()),
+    Case('except_by2', lambda q, n: q.except_by2(range(0, n, 2), _ident)),
+    Case('flatten', lambda q, n: q.flatten()),
+    Case('flatten2', lambda q, n: q.flatten2(_noop)),
+    Case('for_each', lambda q, n: q.for_each(_noop)),
+    Case('for_each2', lambda q, n: q.for_each2(_noop)),
+    Case('group_adjacent', lambda q, n: q.group_adjacent(lambda x: x // 10, _ident)),
+    Case('group_adjacent2', lambda q, n: q.group_adjacent2(lambda x: x // 10)),
+    Case('interleave', lambda q, n: q.interleave(range(n))),
+    Case('maxima_by', lambda q, n: q.maxima_by(_key)),
+    Case('minima_by', lambda q, n: q.minima_by(_key)),
+    Case('pipe', lambda q, n: q.pipe(_noop)),
+    Case('pre_scan', lambda q, n: q.pre_scan(0, add)),
+    Case('rank', lambda q, n: q.rank()),
+    Case('rank_by', lambda q, n: q.rank_by(_key)),
+    Case('run_length_encode', lambda q, n: q.run_length_encode()),
+    Case('scan', lambda q, n: q.scan(add)),
+    Case('scan(seed)', lambda q, n: q.scan(0, add)),
+    Case('scan_right', lambda q, n: q.scan_right(add)),
+    Case('segment', lambda q, n: q.segment(lambda x: x % 100 == 0)),
+    Case('segment2', lambda q, n: q.segment2(lambda x, i: i % 100 == 0)),
+    Case('segment3', lambda q, n: q.segment3(lambda x, last, i: i % 100 == 0)),
+    Case('traverse_breath_first', lambda q, n: MoreEnumerable.traverse_breath_first(0, _tree(n)),
+        uses_source=False),
+    Case('traverse_depth_first', lambda q, n: MoreEnumerable.traverse_depth_first(0, _tree(n)),
+        uses_source=False),
+    Case('traverse_topological', lambda q, n: q.traverse_topological(lambda x: ())),
+    Case('traverse_topological2', lambda q, n: q.traverse_topological2(lambda x: (), _ident)),
+]
+
+
+def operator_name(case_name: str) -> str:
+    # 'count(predicate)' -> 'count', 'order_by.then_by' -> 'order_by'
+    return case_name.split('(')[0].split('.')[0]
+
+
+def missing_operators() -> List[str]:
+    '''
+    Returns the public methods of Enumerable, MoreEnumerable and OrderedEnumerable that no case
+    times.
+    '''
+    covered: Set[str] = {operator_name(case.name) for case in CASES}
+    public: Iterable[str] = (name for name in {*dir(MoreEnumerable), *dir(OrderedEnumerable)}
+        if not name.startswith('_'))
+    return sorted(name for name in public if name not in covered)
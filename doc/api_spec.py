@@ -22,6 +22,49 @@ _project = 'types_linq'
 type_file = f'{_path}/more_typing.py'
 
 modules: list[ModuleSpec] = [
+    {
+        'file_path': f'{_path}/async_enumerable.pyi',
+        'name': f'{_project}.async_enumerable',
+        'gvs': {*()},
+        'classes': {
+            'AsyncEnumerable': {
+                'fields': {*()},
+                'methods': {
+                    '__init__',
+                    '__aiter__',
+                    'aggregate',
+                    'all',
+                    'any',
+                    'chunk',
+                    'concat',
+                    'contains',
+                    'count',
+                    'distinct',
+                    'first',
+                    'first2',
+                    'group_by',
+                    'group_by2',
+                    'select',
+                    'select2',
+                    'select_async',
+                    'select_many',
+                    'skip',
+                    'skip_while',
+                    'sum',
+                    'take',
+                    'take_while',
+                    'to_dict',
+                    'to_list',
+                    'to_lookup',
+                    'to_set',
+                    'where',
+                    'where2',
+                    'where_async',
+                },
+                'readonly_properties': {*()},
+            },
+        },
+    },
     {
         'file_path': f'{_path}/cached_enumerable.py',
         'name': f'{_project}.cached_enumerable',
@@ -51,11 +94,16 @@ modules: list[ModuleSpec] = [
                     '__len__',
                     '__reversed__',
                     'aggregate',
+                    'aggregate_by',
+                    'aggregate_by2',
+                    'aggregate_many',
                     'all',
                     'any',
                     'append',
                     'as_cached',
                     'as_more',
+                    'as_numeric',
+                    'as_parallel',
                     'average',
                     'average2',
                     'cast',
@@ -63,6 +111,7 @@ modules: list[ModuleSpec] = [
                     'concat',
                     'contains',
                     'count',
+                    'count_by',
                     'default_if_empty',
                     'distinct',
                     'distinct_by',
@@ -70,8 +119,10 @@ modules: list[ModuleSpec] = [
                     'empty',
                     'except1',
                     'except_by',
+                    'every',
                     'first',
                     'first2',
+                    'full_outer_join',
                     'group_by',
                     'group_by2',
                     'group_join',
@@ -80,6 +131,7 @@ modules: list[ModuleSpec] = [
                     'join',
                     'last',
                     'last2',
+                    'left_join',
                     'max',
                     'max2',
                     'max_by',
@@ -95,6 +147,7 @@ modules: list[ModuleSpec] = [
                     'reverse',
                     'select',
                     'select2',
+                    'select_batch',
                     'select_many',
                     'select_many2',
                     'sequence_equal',
@@ -104,6 +157,7 @@ modules: list[ModuleSpec] = [
                     'skip_last',
                     'skip_while',
                     'skip_while2',
+                    'stats',
                     'sum',
                     'sum2',
                     'take',
@@ -141,6 +195,56 @@ modules: list[ModuleSpec] = [
             },
         },
     },
+    {
+        'file_path': f'{_path}/instrumentation.py',
+        'name': f'{_project}.instrumentation',
+        'gvs': {*()},
+        'classes': {
+            'OperatorStats': {
+                'fields': {*()},
+                'methods': {*()},
+                'readonly_properties': {
+                    'elements_in',
+                    'elements_out',
+                    'enumerations',
+                    'id',
+                    'inputs',
+                    'library_time',
+                    'materialized',
+                    'name',
+                    'selector_calls',
+                    'selector_time',
+                },
+            },
+            'Instrumentation': {
+                'fields': {*()},
+                'methods': {
+                    'to_dict',
+                    'to_folded',
+                },
+                'readonly_properties': {
+                    'operators',
+                },
+            },
+        },
+    },
+    {
+        'file_path': f'{_path}/join_strategy.py',
+        'name': f'{_project}.join_strategy',
+        'gvs': {*()},
+        'classes': {
+            'JoinStrategy': {
+                'fields': {
+                    'auto',
+                    'hash_inner',
+                    'hash_outer',
+                    'merge',
+                },
+                'methods': {*()},
+                'readonly_properties': {*()},
+            },
+        },
+    },
     {
         'file_path': f'{_path}/lookup.py',
         'name': f'{_project}.lookup',
@@ -166,6 +270,9 @@ modules: list[ModuleSpec] = [
         'name': f'{_project}.more_typing',
         'gvs': {
             'TAccumulate',
+            'TAccumulate2',
+            'TAccumulate3',
+            'TAccumulate4',
             'TAverage_co',
             'TCollection',
             'TDefault',
@@ -211,6 +318,26 @@ modules: list[ModuleSpec] = [
             },
         },
     },
+    {
+        'file_path': f'{_path}/numeric_enumerable.pyi',
+        'name': f'{_project}.numeric_enumerable',
+        'gvs': {*()},
+        'classes': {
+            'NumericEnumerable': {
+                'fields': {*()},
+                'methods': {
+                    'as_numeric',
+                    'average',
+                    'max',
+                    'min',
+                    'select',
+                    'sum',
+                    'where',
+                },
+                'readonly_properties': {*()},
+            },
+        },
+    },
     {
         'file_path': f'{_path}/ordered_enumerable.pyi',
         'name': f'{_project}.ordered_enumerable',
@@ -227,6 +354,45 @@ modules: list[ModuleSpec] = [
             }
         },
     },
+    {
+        'file_path': f'{_path}/parallel_enumerable.pyi',
+        'name': f'{_project}.parallel_enumerable',
+        'gvs': {*()},
+        'classes': {
+            'ParallelEnumerable': {
+                'fields': {*()},
+                'methods': {
+                    'aggregate',
+                    'as_parallel',
+                    'count',
+                    'select',
+                    'select_many',
+                    'sum',
+                    'to_list',
+                    'where',
+                },
+                'readonly_properties': {*()},
+            },
+        },
+    },
+    {
+        'file_path': f'{_path}/stats.py',
+        'name': f'{_project}.stats',
+        'gvs': {*()},
+        'classes': {
+            'Stats': {
+                'fields': {*()},
+                'methods': {*()},
+                'readonly_properties': {
+                    'average',
+                    'count',
+                    'max',
+                    'min',
+                    'sum',
+                },
+            },
+        },
+    },
     {
         'file_path': f'{_path}/types_linq_error.py',
         'name': f'{_project}.types_linq_error',
@@ -267,6 +433,8 @@ modules: list[ModuleSpec] = [
                     'flatten2',
                     'for_each',
                     'for_each2',
+                    'group_adjacent',
+                    'group_adjacent2',
                     'interleave',
                     'maxima_by',
                     'minima_by',
@@ -35,11 +35,14 @@ class MyMethodDef:
     comment: str
     is_static: bool
     is_abstract: bool
+    is_async: bool
 
     def markdown(self):
         builder = ['#### ']
         if self.is_abstract:
             builder.append('abstract ')
+        if self.is_async:
+            builder.append('async ')
         if self.is_static:
             builder.append('staticmethod ')
         else:
@@ -56,8 +59,7 @@ class MyMethodDef:
                 builder.append(', ')
             elif self.params:
                 builder.append(', *, ')
-        for p in self.kwonlyparams:
-            builder.append(', '.join(p.decl() for p in self.kwonlyparams))
+        builder.append(', '.join(p.decl() for p in self.kwonlyparams))
         builder.append(')`\n\n')
 
         builder = [''.join(builder)]
@@ -219,7 +221,7 @@ class ModuleVisitor(ast.NodeVisitor):
         found_funnames = {*()}
 
         for i, stmt in enumerate(node.body):
-            if isinstance(stmt, ast.FunctionDef):
+            if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef)):
                 defname = stmt.name
                 print(f'    Found def {defname}()')
                 found_funnames.add(defname)
@@ -276,7 +278,7 @@ def get_variable(assign: ast.Assign, maybe_doc: Optional[ast.AST]):
     )
 
 
-def get_method(fun_def: ast.FunctionDef, class_tparams: list[str]):
+def get_method(fun_def: Union[ast.FunctionDef, ast.AsyncFunctionDef], class_tparams: list[str]):
     # class tparam is not part of method's tparam
     is_static = find_decorator(fun_def, 'staticmethod')
 
@@ -328,6 +330,7 @@ def get_method(fun_def: ast.FunctionDef, class_tparams: list[str]):
         comment=rewrite_comments(get_def_docstring(fun_def)),
         is_static=is_static,
         is_abstract=find_decorator(fun_def, 'abstractmethod'),
+        is_async=isinstance(fun_def, ast.AsyncFunctionDef),
     )
 
 
@@ -347,11 +350,11 @@ def node_is_constant_str(node: ast.AST):
     return ''
 
 
-def get_def_docstring(any_def: Union[ast.FunctionDef, ast.ClassDef, ast.Module]):
+def get_def_docstring(any_def: Union[ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Module]):
     return node_is_constant_str(any_def.body[0])
 
 
-def find_decorator(any_def: Union[ast.FunctionDef, ast.ClassDef], name: str):
+def find_decorator(any_def: Union[ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef], name: str):
     return any(d.id == name for d in any_def.decorator_list)
 
 
@@ -372,7 +375,7 @@ def get_tparam_for_class(class_def: ast.ClassDef):
     return v.tparams
 
 
-def get_tparam_for_method(fun_def: ast.FunctionDef, class_tparams: list[str]):
+def get_tparam_for_method(fun_def: Union[ast.FunctionDef, ast.AsyncFunctionDef], class_tparams: list[str]):
     v = TParamFinder()
     v.visit(fun_def.args)
     tparams = [p for p in v.tparams if p not in class_tparams]
@@ -18,7 +18,10 @@ setup(
     },
     zip_safe=False,
     python_requires='>=3.7',
-    extras_require={':python_version<"3.8"': ['typing_extensions']},
+    extras_require={
+        ':python_version<"3.8"': ['typing_extensions'],
+        'numpy': ['numpy'],
+    },
     platforms='any',
     classifiers=[
         'Topic :: Utilities',
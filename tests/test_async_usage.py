@@ -0,0 +1,214 @@
+import asyncio
+
+import pytest
+
+from types_linq import Enumerable, InvalidOperationError
+from types_linq.async_enumerable import AsyncEnumerable
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+async def agen(it, delay=0):
+    for elem in it:
+        await asyncio.sleep(delay)
+        yield elem
+
+
+async def collect(aen):
+    return [e async for e in aen]
+
+
+class TestAsyncIterMethod:
+    def test_async_generator(self):
+        en = AsyncEnumerable(agen([1, 2, 3]))
+        assert run(en.to_list()) == [1, 2, 3]
+        assert run(en.to_list()) == []
+
+    def test_async_generator_function(self):
+        en = AsyncEnumerable(lambda: agen([1, 2, 3]))
+        assert run(en.to_list()) == [1, 2, 3]
+        assert run(en.to_list()) == [1, 2, 3]
+
+    def test_sync_iterable(self):
+        en = AsyncEnumerable(Enumerable([1, 2, 3]).select(lambda x: x * 2))
+        assert run(collect(en)) == [2, 4, 6]
+        assert run(collect(AsyncEnumerable(lambda: (i for i in range(3))))) == [0, 1, 2]
+
+
+class TestAsyncOperators:
+    def test_select_where(self):
+        en = AsyncEnumerable(agen(range(10))) \
+            .where(lambda x: x % 2 == 0) \
+            .select(lambda x: x * 10)
+        assert run(en.to_list()) == [0, 20, 40, 60, 80]
+
+    def test_indexed(self):
+        en = AsyncEnumerable(lambda: agen('abcd'))
+        assert run(en.select2(lambda x, i: x * i).to_list()) == ['', 'b', 'cc', 'ddd']
+        assert run(en.where2(lambda x, i: i % 2 == 1).to_list()) == ['b', 'd']
+
+    def test_select_many(self):
+        en = AsyncEnumerable(lambda: agen([[1, 2], [], [3]]))
+        assert run(en.select_many(lambda x: x).to_list()) == [1, 2, 3]
+        assert run(en.select_many(agen, lambda x, e: (len(x), e)).to_list()) == \
+            [(2, 1), (2, 2), (1, 3)]
+
+    def test_skip_take(self):
+        en = AsyncEnumerable(lambda: agen(range(10)))
+        assert run(en.skip(7).to_list()) == [7, 8, 9]
+        assert run(en.take(3).to_list()) == [0, 1, 2]
+        assert run(en.take(0).to_list()) == []
+        assert run(en.take(20).to_list()) == [*range(10)]
+        assert run(en.skip(2).take(2).to_list()) == [2, 3]
+
+    def test_take_stops_pulling(self):
+        pulled = []
+        async def naturals():
+            i = 0
+            while True:
+                pulled.append(i)
+                yield i
+                i += 1
+        assert run(AsyncEnumerable(naturals()).take(3).to_list()) == [0, 1, 2]
+        assert pulled == [0, 1, 2]
+
+    def test_while(self):
+        en = AsyncEnumerable(lambda: agen([1, 2, 5, 1, 6]))
+        assert run(en.take_while(lambda x: x < 3).to_list()) == [1, 2]
+        assert run(en.take_while(lambda x: x < 10).to_list()) == [1, 2, 5, 1, 6]
+        assert run(en.skip_while(lambda x: x < 3).to_list()) == [5, 1, 6]
+
+    def test_chunk(self):
+        en = AsyncEnumerable(lambda: agen(range(7)))
+        assert run(en.chunk(3).to_list()) == [[0, 1, 2], [3, 4, 5], [6]]
+        assert run(en.take(6).chunk(3).to_list()) == [[0, 1, 2], [3, 4, 5]]
+        with pytest.raises(InvalidOperationError):
+            en.chunk(0)
+
+    def test_concat_distinct(self):
+        en = AsyncEnumerable(agen([1, 2, 1])).concat([3, 2]).concat(agen([[4]]))
+        assert run(en.distinct().to_list()) == [1, 2, 3, [4]]
+
+    def test_group_by(self):
+        en = AsyncEnumerable(lambda: agen(['apple', 'avocado', 'banana', 'cherry', 'blueberry']))
+        groups = run(en.group_by2(lambda s: s[0]).to_list())
+        assert [(g.key, g.to_list()) for g in groups] == \
+            [('a', ['apple', 'avocado']), ('b', ['banana', 'blueberry']), ('c', ['cherry'])]
+        assert run(en.group_by(lambda s: s[0], len).select(lambda g: g.sum()).to_list()) == \
+            [12, 15, 6]
+        assert run(en.group_by(lambda s: s[0], len, lambda k, g: k * g.count()).to_list()) == \
+            ['aa', 'bb', 'c']
+        assert run(en.group_by2(len, lambda k, g: k).to_list()) == [5, 7, 6, 9]
+
+
+class TestAsyncTerminals:
+    def test_aggregate(self):
+        en = AsyncEnumerable(lambda: agen([1, 2, 3]))
+        assert run(en.aggregate(lambda acc, e: acc * 10 + e)) == 123
+        assert run(en.aggregate(4, lambda acc, e: acc + e)) == 10
+        assert run(en.aggregate(4, lambda acc, e: acc + e, str)) == '10'
+        with pytest.raises(InvalidOperationError):
+            run(AsyncEnumerable([]).aggregate(lambda acc, e: acc + e))
+
+    def test_quantifiers(self):
+        en = AsyncEnumerable(lambda: agen([1, 2, 3]))
+        assert run(en.all(lambda x: x > 0))
+        assert not run(en.all(lambda x: x > 1))
+        assert run(en.any())
+        assert not run(AsyncEnumerable([]).any())
+        assert run(en.any(lambda x: x > 2))
+        assert not run(en.any(lambda x: x > 3))
+        assert run(en.contains(2))
+        assert not run(en.contains(4))
+
+    def test_count_sum(self):
+        en = AsyncEnumerable(lambda: agen([1, 2, 3]))
+        assert run(en.count()) == 3
+        assert run(en.count(lambda x: x != 2)) == 2
+        assert run(en.sum()) == 6
+        assert run(en.sum(lambda x: x * 1.5)) == 9.0
+        assert run(AsyncEnumerable([]).sum()) == 0
+
+    def test_first(self):
+        en = AsyncEnumerable(lambda: agen([1, 2, 3]))
+        assert run(en.first()) == 1
+        assert run(en.first(lambda x: x > 1)) == 2
+        assert run(en.first2(0)) == 1
+        assert run(en.first2(lambda x: x > 5, 0)) == 0
+        with pytest.raises(InvalidOperationError):
+            run(AsyncEnumerable([]).first())
+        with pytest.raises(InvalidOperationError):
+            run(en.first(lambda x: x > 5))
+
+    def test_containers(self):
+        en = AsyncEnumerable(lambda: agen(['a', 'bb', 'cc']))
+        assert run(en.to_set()) == {'a', 'bb', 'cc'}
+        assert run(en.to_dict(lambda s: s[0])) == {'a': 'a', 'b': 'bb', 'c': 'cc'}
+        assert run(en.to_dict(lambda s: s, len)) == {'a': 1, 'bb': 2, 'cc': 2}
+        lookup = run(en.to_lookup(len))
+        assert lookup[2].to_list() == ['bb', 'cc']
+        lookup2 = run(en.to_lookup(len, str.upper))
+        assert lookup2[1].to_list() == ['A']
+
+
+class TestSelectAsyncMethod:
+    def test_order_and_concurrency(self):
+        running = 0
+        peak = 0
+        async def selector(x):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            # later elements finish first
+            await asyncio.sleep(0.01 * (5 - x))
+            running -= 1
+            return x * 2
+        en = AsyncEnumerable(range(5)).select_async(selector, max_concurrency=3)
+        assert run(en.to_list()) == [0, 2, 4, 6, 8]
+        assert peak == 3
+
+    def test_sequential_by_default(self):
+        running = 0
+        peak = 0
+        async def selector(x):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return x
+        assert run(AsyncEnumerable(agen(range(5))).select_async(selector).to_list()) == [*range(5)]
+        assert peak == 1
+
+    def test_where_async(self):
+        async def is_even(x):
+            await asyncio.sleep(0)
+            return x % 2 == 0
+        en = AsyncEnumerable(agen(range(10))).where_async(is_even, max_concurrency=4)
+        assert run(en.to_list()) == [0, 2, 4, 6, 8]
+
+    def test_error_cancels_pending(self):
+        cancelled = []
+        async def selector(x):
+            try:
+                if x == 0:
+                    raise ValueError(x)
+                await asyncio.sleep(1)
+                return x
+            except asyncio.CancelledError:
+                cancelled.append(x)
+                raise
+        en = AsyncEnumerable(range(5)).select_async(selector, max_concurrency=3)
+        with pytest.raises(ValueError):
+            run(en.to_list())
+        assert cancelled == [1, 2]
+
+    def test_errors(self):
+        async def selector(x):
+            return x
+        with pytest.raises(InvalidOperationError):
+            AsyncEnumerable([]).select_async(selector, max_concurrency=0)
+        with pytest.raises(InvalidOperationError):
+            AsyncEnumerable([]).where_async(selector, max_concurrency=0)
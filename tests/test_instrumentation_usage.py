@@ -0,0 +1,287 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import json
+from operator import add
+import threading
+from typing import Any
+
+import pytest
+
+from types_linq import Enumerable, IndexOutOfRangeError, InvalidOperationError
+from types_linq.instrumentation import Instrumentation
+from types_linq.more import MoreEnumerable
+
+
+def square(x):
+    return x * x
+
+
+def by_name(instrumentation, name):
+    return [op for op in instrumentation.operators if op.name == name]
+
+
+class TestInstrumentation:
+    def test_pipeline(self):
+        with Instrumentation() as ins:
+            res = Enumerable(range(10)).where(lambda x: x % 2 == 0).select(square).to_list()
+        assert res == [0, 4, 16, 36, 64]
+        stats = [(op.name, op.elements_in, op.elements_out, op.selector_calls, op.enumerations)
+            for op in ins.operators]
+        assert stats == [
+            ('Enumerable', None, 10, 0, 1),
+            ('where', 10, 5, 10, 1),
+            ('select', 5, 5, 5, 1),
+            ('to_list', 5, 5, 0, 0),
+        ]
+        src, where, select, to_list = ins.operators
+        assert [op.id for op in ins.operators] == [0, 1, 2, 3]
+        assert tuple(where.inputs) == (src,)
+        assert tuple(to_list.inputs) == (select,)
+        assert where.selector_time > 0 and where.library_time > 0
+        assert to_list.materialized == 5
+        assert where.materialized is None
+
+    def test_unchanged_results(self):
+        with Instrumentation():
+            en = Enumerable([3, 1, 4, 1, 5])
+            assert en.select(square).count() == 5
+            assert len(en.select(square)) == 5
+            assert en.select(square)[1] == 1
+            assert en.skip(1).take(3).to_list() == [1, 4, 1]
+            assert en.every(2).to_list() == [3, 4, 5]
+            assert en.count(lambda x: x > 2) == 3
+            assert en.cast(int).to_list() == [3, 1, 4, 1, 5]
+            assert en.concat(Enumerable([9])).to_list() == [3, 1, 4, 1, 5, 9]
+            assert Enumerable.range(0, 3).to_list() == [0, 1, 2]
+            assert MoreEnumerable([1, 3, 2, 3]).maxima_by(lambda x: x).first(lambda x: x > 0) == 3
+            assert Enumerable([(1, 'a')]).to_dict(lambda p: p[0]) == {1: (1, 'a')}
+
+    def test_reiterable(self):
+        with Instrumentation() as ins:
+            q = Enumerable([1, 2, 3, 4])[1:3]
+            assert q.to_list() == [2, 3]
+            assert q.to_list() == [2, 3]
+            assert len(q) == 2
+            assert q[1] == 3 and q[-2] == 2
+            gen = Enumerable(lambda: iter([1, 2, 3])).select(square)
+            assert gen.to_list() == [1, 4, 9]
+            assert gen.to_list() == [1, 4, 9]
+            # a view, as without instrumentation
+            view: Any = Enumerable(range(10)).select(square)._get_iterable()
+            assert len(view) == 10 and view[-1] == 81
+            with pytest.raises(IndexOutOfRangeError):
+                q[2]
+        # the elements of the list are read through the view by index
+        src, getitem = ins.operators[:2]
+        assert getitem.name == '__getitem__'
+        assert src.elements_out == 6 and getitem.elements_out == 6
+        select = by_name(ins, 'select')[0]
+        assert select.enumerations == 2 and select.elements_out == 6
+
+    def test_inputs(self):
+        with Instrumentation() as ins:
+            first = Enumerable([1, 2])
+            second = Enumerable([3])
+            first.concat(second).to_list()
+            Enumerable.range(0, 4).to_list()
+        concat, = by_name(ins, 'concat')
+        assert [op.name for op in concat.inputs] == ['Enumerable', 'Enumerable']
+        assert concat.elements_in == 3
+        assert concat.elements_out == 3
+        range_, = by_name(ins, 'range')
+        assert range_.inputs == () and range_.elements_in is None
+        assert range_.elements_out == 4
+
+    def test_scalar_results(self):
+        with Instrumentation() as ins:
+            en = MoreEnumerable([1, 2, 3])
+            en.sum()
+            en.consume()
+            en.cast(int)
+        assert by_name(ins, 'sum')[0].elements_out == 1
+        assert by_name(ins, 'consume')[0].elements_out == 0
+        # cast() returns its receiver, which keeps its own node
+        cast, = by_name(ins, 'cast')
+        assert cast.elements_out == 0
+        assert cast.inputs[0].elements_out == 6
+
+    def test_nested_operators(self):
+        with Instrumentation() as ins:
+            assert Enumerable(range(5)).as_numeric().sum(lambda x: x * 2) == 20
+        # sum(selector) calls select() and sum(); the selector is timed once, for the outer sum()
+        outer, inner = by_name(ins, 'sum')
+        selects = by_name(ins, 'select')
+        assert outer.selector_calls == 5
+        assert inner.selector_calls == 0
+        assert all(op.selector_calls == 0 for op in selects)
+        assert tuple(inner.inputs) == (selects[0],)
+
+    def test_materialized(self):
+        lst = [3, 1, 2, 5, 4]
+        with Instrumentation() as ins:
+            en = Enumerable(lst)
+            en.order_by(lambda x: x).to_list()
+            en.group_by(lambda x: x % 2, lambda x: x).to_list()
+            # a view over the list
+            en.reverse().to_list()
+            gen = Enumerable(lambda: iter(lst))
+            gen.take_last(2).to_list()
+            gen.skip_last(2).to_list()
+            gen.skip_last(10).to_list()
+            query = gen.reverse()
+            query.to_list()
+            lst.pop()
+            query.to_list()
+        assert by_name(ins, 'order_by')[0].materialized == 5
+        assert by_name(ins, 'group_by')[0].materialized == 5
+        assert by_name(ins, 'take_last')[0].materialized == 2
+        assert [op.materialized for op in by_name(ins, 'skip_last')] == [2, 5]
+        assert [op.materialized for op in by_name(ins, 'reverse')] == [None, 5]
+
+    def test_slicing(self):
+        with Instrumentation() as ins:
+            assert Enumerable(lambda: iter(range(10)))[-2] == 8
+        names = [op.name for op in ins.operators]
+        assert names[:2] == ['Enumerable', '__getitem__']
+        assert 'take_last' in names and 'to_list' in names
+        assert by_name(ins, 'take_last')[0].materialized == 2
+
+    def test_error(self):
+        def factory():
+            raise ValueError
+        with Instrumentation() as ins:
+            with pytest.raises(ValueError):
+                Enumerable(factory).select(square).to_list()
+        select, = by_name(ins, 'select')
+        assert select.elements_out == 0
+
+    def test_restored(self):
+        select = Enumerable.select
+        get_iterable = Enumerable._get_iterable
+        range_ = Enumerable.__dict__['range']
+        with Instrumentation():
+            assert Enumerable.select is not select
+        assert Enumerable.select is select
+        assert Enumerable._get_iterable is get_iterable
+        assert Enumerable.__dict__['range'] is range_
+
+    def test_only_inside(self):
+        with Instrumentation() as ins:
+            query = Enumerable([1, 2, 3]).select(square)
+        assert query.where(lambda x: x > 1).to_list() == [4, 9]
+        assert [op.name for op in ins.operators] == ['Enumerable', 'select']
+        assert by_name(ins, 'select')[0].selector_calls == 0
+
+    def test_other_threads(self):
+        results = []
+        def run():
+            query = Enumerable([1, 2, 3]).select(square).where(lambda x: x > 1)
+            results.append(query.to_list())
+            results.append(query.group_by2(lambda x: x).count())
+            results.append(Enumerable.range(0, 2).to_list())
+        with Instrumentation() as ins:
+            thread = threading.Thread(target=run)
+            thread.start()
+            thread.join()
+        assert results == [[4, 9], 2, [0, 1]]
+        assert ins.operators == []
+
+    def test_concurrent(self):
+        select = Enumerable.select
+        entered = threading.Barrier(2)
+        exited = threading.Event()
+        results = {}
+        def run(name, stay):
+            with Instrumentation() as ins:
+                entered.wait()
+                Enumerable([1, 2, 3]).select(square).to_list()
+                if stay:
+                    exited.wait()
+                    # the other block has exited. the wrappers are still installed
+                    Enumerable([1]).to_set()
+                else:
+                    exited.set()
+            results[name] = [op.name for op in ins.operators]
+        threads = [threading.Thread(target=run, args=(name, name == 'a')) for name in 'ab']
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results == {
+            'a': ['Enumerable', 'select', 'to_list', 'Enumerable', 'to_set'],
+            'b': ['Enumerable', 'select', 'to_list'],
+        }
+        assert Enumerable.select is select
+
+    def test_asyncio(self):
+        async def task(n):
+            await asyncio.sleep(0)
+            return Enumerable(range(n)).select(square).to_list()
+        async def main():
+            outside = asyncio.ensure_future(task(2))
+            with Instrumentation() as ins:
+                res = await asyncio.gather(task(3), outside)
+            return ins, res
+        ins, res = asyncio.run(main())
+        assert res == [[0, 1, 4], [0, 1]]
+        # the task created outside the block is not recorded
+        assert [op.elements_out for op in by_name(ins, 'select')] == [3]
+
+    def test_thread_pool(self):
+        with ThreadPoolExecutor(2) as pool:
+            with Instrumentation() as ins:
+                res = Enumerable(range(50)).as_parallel(executor=pool, chunk_size=8) \
+                    .select(square).to_list()
+        assert res == [x * x for x in range(50)]
+        assert by_name(ins, 'select')[0].selector_calls == 50
+
+    def test_process_pool(self):
+        with ProcessPoolExecutor(2) as pool:
+            with Instrumentation() as ins:
+                res = Enumerable(range(20)).as_parallel(executor=pool, chunk_size=8) \
+                    .select(square).to_list()
+        assert res == [x * x for x in range(20)]
+        assert by_name(ins, 'select')[0].selector_calls == 0
+
+    def test_nested(self):
+        with Instrumentation() as outer:
+            Enumerable([1]).to_list()
+            with Instrumentation() as inner:
+                Enumerable([1]).to_set()
+            Enumerable([1]).to_tuple()
+        assert [op.name for op in outer.operators] == ['Enumerable', 'to_list', 'Enumerable',
+            'to_tuple']
+        assert [op.name for op in inner.operators] == ['Enumerable', 'to_set']
+
+    def test_already_active(self):
+        ins = Instrumentation()
+        with ins:
+            with pytest.raises(InvalidOperationError):
+                with ins:
+                    pass
+            Enumerable([1]).to_list()
+        with ins:
+            Enumerable([2]).to_list()
+        assert len(ins.operators) == 4
+
+    def test_to_dict(self):
+        with Instrumentation() as ins:
+            Enumerable([1, 2]).aggregate(add)
+        d = json.loads(json.dumps(ins.to_dict()))
+        assert [(op['id'], op['name'], op['inputs']) for op in d['operators']] == [
+            (0, 'Enumerable', []),
+            (1, 'aggregate', [0]),
+        ]
+        assert d['operators'][1]['selector_calls'] == 1
+        assert d['operators'][1]['elements_in'] == 2
+        assert set(d['operators'][0]) == {'id', 'name', 'inputs', 'enumerations', 'elements_in',
+            'elements_out', 'selector_calls', 'selector_time', 'library_time', 'materialized'}
+
+    def test_to_folded(self):
+        with Instrumentation() as ins:
+            Enumerable(range(100)).select(square).to_list()
+        lines = ins.to_folded().splitlines()
+        paths = {line.rsplit(' ', 1)[0] for line in lines}
+        assert {'select#1', 'to_list#2', 'to_list#2;select#1', 'to_list#2;select#1;square',
+            'to_list#2;select#1;Enumerable#0'} == paths
+        assert all(int(line.rsplit(' ', 1)[1]) >= 0 for line in lines)
@@ -202,6 +202,39 @@ class TestForEachMethod:
         assert side_effects == ['7/0', '9/1', '11/2']
 
 
+class TestGroupAdjacentMethod:
+    def test_empty(self):
+        assert MoreEnumerable([]).group_adjacent2(lambda x: x).to_list() == []
+
+    def test_group_adjacent(self):
+        readings = [('mon', 3), ('mon', 5), ('tue', 2), ('mon', 1)]
+        en = MoreEnumerable(readings).group_adjacent(lambda r: r[0], lambda r: r[1])
+        assert en.select(lambda g: (g.key, g.to_list())).to_list() == \
+            [('mon', [3, 5]), ('tue', [2]), ('mon', [1])]
+
+    def test_result_selector(self):
+        en = MoreEnumerable('aabccca')
+        assert en.group_adjacent2(str.upper, lambda k, g: k * g.count()).to_list() == \
+            ['AA', 'B', 'CCC', 'A']
+        assert en.group_adjacent(lambda c: c, ord, lambda k, g: g.sum()).to_list() == \
+            [194, 98, 297, 97]
+
+    def test_unhashable_keys(self):
+        en = MoreEnumerable([[1], [1], [2]]).group_adjacent2(lambda x: x)
+        assert en.select(lambda g: (g.key, g.count())).to_list() == [([1], 2), ([2], 1)]
+
+    def test_streaming(self):
+        pulled = []
+        def gen():
+            for i in range(100):
+                pulled.append(i)
+                yield i
+        en = MoreEnumerable(gen).group_adjacent2(lambda x: x // 10)
+        assert en.first().to_list() == [*range(10)]
+        # the first element of the next group is read to detect the end of the first
+        assert pulled == [*range(11)]
+
+
 class TestInterleaveMethod:
     def test_interleave_one(self):
         en = MoreEnumerable([1, 2, 4]).interleave(*[])
@@ -545,6 +578,11 @@ class TestScanMethod:
         q = MoreEnumerable([]).scan(-1, lambda acc, e: acc + e)
         assert q.to_list() == [-1]
 
+    def test_overload2_repeat(self):
+        q = MoreEnumerable([1, 2]).scan(10, lambda acc, e: acc + e)
+        assert q.to_list() == [10, 11, 13]
+        assert q.to_list() == [10, 11, 13]
+
 
 class TestScanRightMethod:
     def test_overload1(self):
@@ -666,6 +704,10 @@ class TestCycleMethod:
         en = MoreEnumerable(gen())
         assert en.cycle(None).take(11).to_list() == [1, 2] * 5 + [1]
 
+    def test_infinite_count_no_elem(self):
+        en = MoreEnumerable([])
+        assert en.cycle().to_list() == []
+
     def test_invalid(self):
         en = MoreEnumerable([1, 2, 3])
         with pytest.raises(InvalidOperationError):
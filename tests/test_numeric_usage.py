@@ -0,0 +1,179 @@
+import array
+from datetime import timedelta
+
+import pytest
+
+from types_linq import Enumerable, InvalidOperationError
+from types_linq import numeric_enumerable
+from types_linq.numeric_enumerable import NumericEnumerable
+
+
+@pytest.fixture
+def no_numpy(monkeypatch):
+    monkeypatch.setattr(numeric_enumerable, 'np', None)
+
+
+class TestAsNumericMethod:
+    def test_as_numeric(self):
+        en = Enumerable([1, 2, 3]).as_numeric()
+        assert isinstance(en, NumericEnumerable)
+        assert en.as_numeric() is en
+        assert en.to_list() == [1, 2, 3]
+
+    def test_deferred(self):
+        lst = [1, 2]
+        en = Enumerable(lst).as_numeric()
+        lst.append(3)
+        assert en.sum() == 6
+
+
+class TestGenericFallback:
+    def test_aggregates(self):
+        en = Enumerable(lambda: (x for x in [3, 1, 4, 1, 5])).as_numeric()
+        assert en.sum() == 14
+        assert en.min() == 1
+        assert en.max() == 5
+        assert en.average() == 2.8
+        assert en.sum(lambda x: x * 2) == 28
+        assert en.min(lambda x: -x) == -5
+        assert en.max(lambda x: -x) == -1
+        assert en.average(lambda x: x * 10) == 28
+
+    def test_empty(self):
+        en = Enumerable([]).as_numeric()
+        assert en.sum() == 0
+        with pytest.raises(InvalidOperationError):
+            en.min()
+        with pytest.raises(InvalidOperationError):
+            en.max()
+        with pytest.raises(InvalidOperationError):
+            en.average()
+
+    def test_sum_non_numbers(self):
+        days = [timedelta(days=1), timedelta(days=2)]
+        assert Enumerable(days).as_numeric().sum() == timedelta(days=3)
+        assert Enumerable(days).as_numeric().sum(lambda d: d * 2) == timedelta(days=6)
+
+    def test_select_where(self):
+        en = Enumerable([3, 1, 4, 1, 5]).as_numeric()
+        query = en.where(lambda x: x > 2).select(lambda x: x * 10)
+        assert isinstance(query, NumericEnumerable)
+        assert query.to_list() == [30, 40, 50]
+        assert query.sum() == 120
+
+    def test_lazy(self):
+        pulled = []
+        def gen():
+            for i in range(100):
+                pulled.append(i)
+                yield i
+        en = Enumerable(gen).as_numeric().where(lambda x: x % 2 == 1).select(lambda x: x * x)
+        assert en.first() == 1
+        assert pulled == [0, 1]
+
+    def test_array_without_numpy(self, no_numpy):
+        en = Enumerable(array.array('d', [3, 1, 4, 1, 5])).as_numeric()
+        assert en.sum() == 14.0
+        assert en.where(lambda x: x > 2).select(lambda x: x * 2).to_list() == [6.0, 8.0, 10.0]
+        assert en.max() == 5.0
+
+
+class TestNumpyBackend:
+    def test_aggregates(self):
+        np = pytest.importorskip('numpy')
+        en = Enumerable(np.array([3, 1, 4, 1, 5])).as_numeric()
+        assert en.sum() == 14
+        assert en.min() == 1
+        assert en.max() == 5
+        assert en.average() == 2.8
+        assert en.sum(lambda x: x * 2) == 28
+
+    def test_empty(self):
+        np = pytest.importorskip('numpy')
+        en = Enumerable(np.array([], dtype=float)).as_numeric()
+        assert en.sum() == 0
+        with pytest.raises(InvalidOperationError):
+            en.min()
+        with pytest.raises(InvalidOperationError):
+            en.average()
+
+    def test_vectorized(self):
+        np = pytest.importorskip('numpy')
+        calls = []
+        def selector(x):
+            calls.append(x)
+            return x * 2
+        query = Enumerable(np.arange(10)).as_numeric() \
+            .where(lambda x: x % 3 == 0) \
+            .select(selector)
+        assert calls == []
+        assert query.to_list() == [0, 6, 12, 18]
+        # called once with the filtered array
+        assert len(calls) == 1 and isinstance(calls[0], np.ndarray)
+
+    def test_array_array(self):
+        np = pytest.importorskip('numpy')
+        calls = []
+        def selector(x):
+            calls.append(x)
+            return x * 2
+        en = Enumerable(array.array('d', [3, 1, 4, 1, 5])).as_numeric()
+        query = en.where(lambda x: x > 2).select(selector)
+        assert query.sum() == 24.0
+        assert len(calls) == 1 and isinstance(calls[0], np.ndarray)
+        # the results are Python values
+        assert [type(x) for x in query] == [float, float, float]
+        assert type(query.sum()) is float
+        assert en.max(lambda x: -x) == -1.0
+        assert type(en.average()) is float
+        assert en.select(lambda x: x > 2).to_list() == [True, False, True, False, True]
+
+    def test_float32(self):
+        np = pytest.importorskip('numpy')
+        # summed in double precision, as the generic implementation sums Python floats
+        values = [1e8, 1.0, -1e8]
+        assert Enumerable(array.array('f', values)).sum() == 1.0
+        for source in (array.array('f', values), np.array(values, dtype=np.float32)):
+            en = Enumerable(source).as_numeric()
+            assert en.sum() == 1.0
+            assert en.average() == pytest.approx(1 / 3)
+
+    def test_integer_array_array(self):
+        pytest.importorskip('numpy')
+        calls = []
+        def selector(x):
+            calls.append(x)
+            return x + x
+        en = Enumerable(array.array('B', [200, 100])).as_numeric()
+        assert en.select(selector).to_list() == [400, 200]
+        # integer arrays are not vectorized, since NumPy integer arithmetic would overflow
+        assert calls == [200, 100]
+        assert Enumerable(array.array('i', [2 ** 30])).as_numeric() \
+            .select(lambda x: x * 4).to_list() == [2 ** 32]
+        assert Enumerable(array.array('i', [2 ** 30, 1])).as_numeric() \
+            .where(lambda x: x * 4 > 2 ** 31).to_list() == [2 ** 30]
+        assert Enumerable(array.array('q', [2 ** 62, 2 ** 62])).as_numeric().sum() == 2 ** 63
+        assert Enumerable(array.array('i', [3, 1, 4, 1, 5])).as_numeric() \
+            .where(lambda x: x > 2).sum() == 12
+
+    def test_fallback(self):
+        np = pytest.importorskip('numpy')
+        en = Enumerable(np.array([-2, 3, -1])).as_numeric()
+        # `if` on an array raises
+        assert en.select(lambda x: x if x > 0 else 0).to_list() == [0, 3, 0]
+        # not an array of the same shape
+        assert en.select(lambda x: [x]).to_list() == [[-2], [3], [-1]]
+        assert en.select(lambda x: x.sum()).to_list() == [-2, 3, -1]
+        # not a mask
+        assert en.where(lambda x: x + 2).to_list() == [3, -1]
+        # errors are raised as for Python numbers
+        en2 = Enumerable(array.array('d', [1.0, 0.0])).as_numeric()
+        with pytest.raises(ZeroDivisionError):
+            en2.where(lambda x: 1 / x > 0).to_list()
+        with pytest.raises(ZeroDivisionError):
+            en2.select(lambda x: 1 / x).to_list()
+        assert Enumerable(np.array([2.0, 4.0])).as_numeric().select(lambda x: 1 / x).to_list() == \
+            [0.5, 0.25]
+        # unsupported arrays
+        assert Enumerable(np.array([[1, 2], [3, 4]])).as_numeric().sum().tolist() == [4, 6]  # type: ignore
+        assert Enumerable(np.array(['b', 'a'])).as_numeric().min() == 'a'
@@ -1,9 +1,16 @@
 from collections.abc import Container, Iterable, Reversible, Sequence, Sized
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import accumulate, chain, cycle, dropwhile, islice, takewhile
+import sys
+import threading
+from typing import Any
 
 import pytest
 
 from types_linq import Enumerable, InvalidOperationError
-from types_linq.util import ComposeSet, ComposeMap
+from types_linq.fused_enumerable import FusedEnumerable
+from types_linq.util import ComposeSet, ComposeMap, freeze_hash
 
 def naturals():
     i = 0
@@ -12,6 +19,10 @@ def naturals():
         i += 1
 
 
+def square(x):
+    return x * x
+
+
 class TestAbc:
     def test_abc(self):
         en = Enumerable([])
@@ -38,6 +49,121 @@ class TestInfinite:
         assert en2.take(2).to_list() == [0, 2]
 
 
+class TestFusedOperators:
+    def test_fuse_chain(self):
+        en = Enumerable(range(20)).select(lambda x: x * 3).where(lambda x: x % 2 == 0) \
+            .skip(1).take(4).select(str)
+        assert isinstance(en, FusedEnumerable)
+        assert len(en._stages) == 4
+        assert en.to_list() == ['6', '12', '18', '24']
+        assert en.to_list() == ['6', '12', '18', '24']
+
+    def test_branches(self):
+        en = Enumerable([1, 2, 3, 4]).select(lambda x: x * 10)
+        b1 = en.where(lambda x: x > 20)
+        b2 = en.take(1)
+        assert b1.to_list() == [30, 40]
+        assert b2.to_list() == [10]
+        assert en.to_list() == [10, 20, 30, 40]
+
+    def test_compose_skip_take(self):
+        lst = [*range(10)]
+        counts = [-1, 0, 1, 3, 7, 12]
+        for a in counts:
+            for b in counts:
+                a_, b_ = max(a, 0), max(b, 0)
+                en = Enumerable(lst)
+                assert en.skip(a).skip(b).to_list() == lst[a_:][b_:]
+                assert en.skip(a).take(b).to_list() == lst[a_:][:b_]
+                assert en.take(a).skip(b).to_list() == lst[:a_][b_:]
+                assert en.take(a).take(b).to_list() == lst[:a_][:b_]
+
+    def test_builtin_iterators(self):
+        # these operators run on builtin iterators over non-sequence sources
+        gen = lambda: (i for i in range(10))
+        en = Enumerable(gen)
+        assert type(iter(en.take_while(lambda x: x < 3))) is takewhile
+        assert type(iter(en.skip_while(lambda x: x < 3))) is dropwhile
+        assert type(iter(en.select_many(lambda x: [x]))) is chain
+        assert type(iter(en.zip2('abc', lambda x, y: y))) is map
+        assert type(iter(en.every(2))) is islice
+        more = en.as_more()
+        assert type(iter(more.scan(lambda x, y: x + y))) is accumulate
+        assert type(iter(more.cycle())) is cycle
+        assert type(iter(more.enumerate())) is enumerate
+
+    def test_select_many_view_fallback(self):
+        en = Enumerable([1, 2, 3]).select(lambda x: x * 10) \
+            .select_many(lambda x: [x, x + 1], lambda x, y: (x, y)).take(3)
+        assert en.to_list() == [(10, 10), (10, 11), (20, 20)]
+
+    def test_every_view(self):
+        calls = []
+        def square_logged(x):
+            calls.append(x)
+            return x * x
+        en = Enumerable(range(100)).select(square_logged).every(7).every(2)
+        assert isinstance(en, FusedEnumerable)
+        assert len(en._stages) == 2
+        assert len(en) == 8
+        assert en[3] == 42 * 42
+        assert calls == [42]
+        assert en.to_list() == [x * x for x in range(0, 100, 14)]
+
+    def test_nested_sequence_source(self):
+        en = Enumerable(Enumerable(Enumerable([1, 2, 3, 4]))).skip(1).take(2)
+        assert len(en) == 2
+        assert en.to_list() == [2, 3]
+
+    def test_skip_zero_generator(self):
+        gen = (i for i in range(3))
+        en = Enumerable(gen).skip(0)
+        assert en.to_list() == [0, 1, 2]
+
+    def test_no_excess_pulls(self):
+        gen = (i for i in range(10))
+        en = Enumerable(gen).skip(2).take(3).where(lambda x: x != 3)
+        assert en.to_list() == [2, 4]
+        assert next(gen) == 5
+
+    def test_deferred(self):
+        called = []
+        def factory():
+            called.append(1)
+            return [1, 2, 3]
+        en = Enumerable(factory).where(lambda x: x > 1).select(lambda x: x + 1)
+        cached = en.as_cached()
+        assert called == []
+        assert cached.to_list() == [3, 4]
+        assert called == [1]
+
+    def test_reverse_reversible(self):
+        class Reversed(deque):  # type: ignore
+            def __iter__(self):
+                raise AssertionError('copied')
+        en = Enumerable(Reversed([1, 2, 3])).reverse()
+        assert en.to_list() == [3, 2, 1]
+        assert en.select(str).to_list() == ['3', '2', '1']
+        assert Enumerable(deque([1, 2, 3])).reverse().where(lambda x: x > 1).to_list() == [3, 2]
+
+    def test_lazy_upstream(self):
+        keys = []
+        def key(x):
+            keys.append(x)
+            return x % 2
+        grouped = Enumerable(range(10)).group_by2(key).select(lambda g: g.key)
+        assert grouped.prepend(-1).first() == -1
+        assert grouped.concat([1]).append(2).first2(None) == 0
+        assert keys == [*range(10)]
+        ordered = Enumerable([3, 1, 2]).order_by(lambda x: x)
+        assert ordered.prepend(0).first() == 0
+        assert ordered.select(str).to_list() == ['1', '2', '3']
+        # no upstream work, so a view is still made
+        assert len(Enumerable([3, 1, 2]).select(str).prepend('0')) == 4
+        en = Enumerable(range(4))
+        assert Enumerable(['1']).concat(en.select(str)).zip(en)[1] == ('0', 1)
+
+
 class TestAsCachedMethod:
     def test_enumerate_same_generator(self):
         gen = (i for i in range(6))
@@ -134,6 +260,189 @@ class TestAsCachedMethod:
         en.take(10).to_list()
         assert en.take(15).to_list() == [*range(5, 20)]
 
+    def test_capacity_shrink_after_wrap(self):
+        en = Enumerable(naturals()).as_cached(cache_capacity=4)
+        assert en.take(11).to_list() == [*range(11)]
+        en.as_cached(cache_capacity=2)
+        assert en.take(3).to_list() == [9, 10, 11]
+        en.as_cached(cache_capacity=3)
+        assert en.take(4).to_list() == [10, 11, 12, 13]
+        assert en.take(4).to_list() == [11, 12, 13, 14]
+
+    def test_thread_safe_read_across_wrap(self):
+        en = Enumerable(naturals()).as_cached(cache_capacity=100, thread_safe=True)
+        assert en.take(130).to_list() == [*range(130)]
+        assert en.take(100).to_list() == [*range(30, 130)]
+
+    def test_invalid_settings(self):
+        with pytest.raises(InvalidOperationError):
+            Enumerable([1]).as_cached(cache_bytes=-1)
+        with pytest.raises(InvalidOperationError):
+            Enumerable([1]).as_cached(spill_dir='.')
+        en = Enumerable([1]).as_cached()
+        with pytest.raises(InvalidOperationError):
+            en.as_cached(cache_capacity=-1)
+
+    def test_cache_bytes(self):
+        en = Enumerable(naturals()).as_cached(cache_bytes=3, size_selector=lambda _: 1)
+        assert en.take(5).to_list() == [0, 1, 2, 3, 4]
+        assert en.take(5).to_list() == [2, 3, 4, 5, 6]
+        assert en.take(2).to_list() == [4, 5]
+
+    def test_cache_bytes_getsizeof(self):
+        strs = ['a' * 100, 'b' * 100, 'c' * 10, 'd' * 10, 'e' * 10]
+        en = Enumerable(iter(strs)).as_cached(cache_bytes=3 * sys.getsizeof('a' * 10) + 1)
+        assert en.to_list() == strs
+        assert en.to_list() == strs[2:]
+
+    def test_cache_bytes_and_capacity(self):
+        en = Enumerable(naturals()).as_cached(
+            cache_capacity=2, cache_bytes=10, size_selector=lambda x: x,
+        )
+        assert en.take(4).to_list() == [0, 1, 2, 3]
+        assert en.take(2).to_list() == [2, 3]
+        assert en.take(6).to_list() == [2, 3, 4, 5, 6, 7]
+        assert en.take(2).to_list() == [7, 8]
+
+    def test_cache_bytes_value_too_large(self):
+        en = Enumerable(naturals()).as_cached(cache_bytes=0)
+        assert en.take(3).to_list() == [0, 1, 2]
+        assert en.take(1).to_list() == [3]
+
+    def test_change_limits(self):
+        en = Enumerable(naturals()).as_cached(cache_capacity=3)
+        assert en.take(5).to_list() == [*range(5)]
+        en.as_cached(cache_bytes=2, size_selector=lambda _: 1)
+        assert en.take(2).to_list() == [3, 4]
+        en.as_cached(cache_capacity=3)
+        assert en.take(4).to_list() == [3, 4, 5, 6]
+        en.as_cached()
+        assert en.take(7).to_list() == [4, 5, 6, 7, 8, 9, 10]
+        assert en.take(3).to_list() == [4, 5, 6]
+
+    def test_spill(self):
+        en = Enumerable(naturals()).as_cached(cache_capacity=3, spill=True)
+        assert en.take(10).to_list() == [*range(10)]
+        assert en.take(12).to_list() == [*range(12)]
+        en.as_cached(cache_capacity=1, spill=True)
+        assert en.take(13).to_list() == [*range(13)]
+        en.as_cached(cache_capacity=1)
+        assert en.take(2).to_list() == [12, 13]
+
+    def test_spill_cache_bytes(self, tmp_path):
+        en = Enumerable(iter([[1, 2], [3], [], [4]])).as_cached(
+            cache_bytes=0, spill=True, spill_dir=str(tmp_path),
+        )
+        assert en.to_list() == [[1, 2], [3], [], [4]]
+        assert en.to_list() == [[1, 2], [3], [], [4]]
+
+    def test_spill_enabled_later(self):
+        en = Enumerable(naturals()).as_cached(cache_capacity=2)
+        assert en.take(4).to_list() == [0, 1, 2, 3]
+        en.as_cached(cache_capacity=2, spill=True)
+        assert en.take(4).to_list() == [2, 3, 4, 5]
+        assert en.take(6).to_list() == [2, 3, 4, 5, 6, 7]
+
+    def test_spill_interleaved(self):
+        en = Enumerable(naturals()).as_cached(cache_capacity=2, spill=True)
+        it1, it2 = iter(en), iter(en)
+        assert [next(it1) for _ in range(5)] == [0, 1, 2, 3, 4]
+        assert [next(it2) for _ in range(3)] == [0, 1, 2]
+        assert [next(it1) for _ in range(2)] == [5, 6]
+        assert [next(it2) for _ in range(5)] == [3, 4, 5, 6, 7]
+
+    def test_thread_safe_spill(self):
+        en = Enumerable(naturals()).as_cached(cache_capacity=10, spill=True, thread_safe=True)
+        assert en.take(100).to_list() == [*range(100)]
+        assert en.take(110).to_list() == [*range(110)]
+        en.as_cached(cache_capacity=10, cache_bytes=100, spill=True)
+        assert en.take(120).to_list() == [*range(120)]
+
+    def test_thread_safe_shared_pull(self):
+        pulled = []
+        def gen():
+            for i in range(1000):
+                pulled.append(i)
+                yield i
+        en = Enumerable(gen()).as_cached(thread_safe=True)
+        barrier = threading.Barrier(8)
+        def consume(_):
+            barrier.wait()
+            return en.to_list()
+        with ThreadPoolExecutor(8) as executor:
+            results = [*executor.map(consume, range(8))]
+        assert results == [[*range(1000)]] * 8
+        assert pulled == [*range(1000)]
+        assert en.to_list() == [*range(1000)]
+
+    def test_thread_safe_sequential(self):
+        en = Enumerable(naturals()).as_cached(cache_capacity=5, thread_safe=True)
+        b1 = en.take(100)
+        b2 = en.take(100)
+        assert b1.take(3).to_list() == [0, 1, 2]
+        assert b2.take(3).to_list() == [0, 1, 2]
+        assert b1.take(6).to_list() == [0, 1, 2, 3, 4, 5]
+        assert b2.take(4).to_list() == [1, 2, 3, 4]
+        assert b1.take(7).to_list() == [1, 2, 3, 4, 5, 6, 7]
+        assert en.take(100).to_list() == [*range(3, 103)]
+
+    def test_thread_safe_evicted_by_other_thread(self):
+        en = Enumerable(naturals()).as_cached(cache_capacity=3, thread_safe=True)
+        it = iter(en)
+        assert next(it) == 0
+        t = threading.Thread(target=lambda: en.take(10).to_list())
+        t.start()
+        t.join()
+        assert next(it) == 7
+
+    def test_thread_safe_waiting_puller(self):
+        # the second thread waits for the source, then reads the value pulled by the first
+        entered = threading.Event()
+        release = threading.Event()
+        def gen():
+            entered.set()
+            release.wait()
+            yield 1
+            yield 2
+        en = Enumerable(gen()).as_cached(thread_safe=True)
+        waiting = threading.Event()
+        class NotifyingLock:
+            def __init__(self, lock):
+                self.lock = lock
+            def __enter__(self):
+                waiting.set()
+                return self.lock.__enter__()
+            def __exit__(self, *args):
+                return self.lock.__exit__(*args)
+        with ThreadPoolExecutor(2) as executor:
+            f1 = executor.submit(en.to_list)
+            entered.wait()
+            en._pull_lock = NotifyingLock(en._pull_lock)  # type: ignore
+            f2 = executor.submit(en.to_list)
+            waiting.wait()
+            release.set()
+            assert f1.result() == [1, 2]
+            assert f2.result() == [1, 2]
+
+    def test_thread_safe_zero_capacity(self):
+        en = Enumerable(naturals()).as_cached(cache_capacity=0, thread_safe=True)
+        assert en.take(1).to_list() == [0]
+        assert en.take(2).to_list() == [1, 2]
+        en.as_cached(cache_capacity=2)
+        assert en.take(2).to_list() == [3, 4]
+        assert en.take(3).to_list() == [3, 4, 5]
+
+    def test_thread_safe_enable_later(self):
+        en = Enumerable(naturals()).as_cached()
+        assert en.take(3).to_list() == [0, 1, 2]
+        assert en.as_cached(thread_safe=True) is en
+        assert en.as_cached(cache_capacity=2) is en
+        assert en.take(3).to_list() == [1, 2, 3]
+        lock = en._lock
+        assert lock is not None
+        en.as_cached(thread_safe=True)
+        assert en._lock is lock
+
     def test_capacity_shrink(self):
         en = Enumerable(naturals()).as_cached(cache_capacity=10)
         en.take(10).to_list()
@@ -166,6 +475,98 @@ class TestAsCachedMethod:
             en2.as_cached(cache_capacity=-1)
 
 
+class TestAsParallelMethod:
+    def test_select_where(self):
+        with ThreadPoolExecutor(4) as pool:
+            en = Enumerable(range(100)).as_parallel(executor=pool, chunk_size=7)
+            q = en.where(lambda x: x % 3 == 0).select(lambda x: x * 2)
+            assert q.to_list() == [x * 2 for x in range(100) if x % 3 == 0]
+            assert [*q] == q.to_list()
+            assert q.take(3).to_list() == [0, 6, 12]
+
+    def test_select_many(self):
+        en = Enumerable(['ab', 'c', '', 'def']).as_parallel(chunk_size=1)
+        assert en.select_many(list).to_list() == ['a', 'b', 'c', 'd', 'e', 'f']
+        assert en.select_many(list, lambda s, c: s + c).to_list() == \
+            ['aba', 'abb', 'cc', 'defd', 'defe', 'deff']
+
+    def test_runs_in_workers(self):
+        threads = set()
+        def selector(x):
+            threads.add(threading.get_ident())
+            return x
+        with ThreadPoolExecutor(2) as pool:
+            Enumerable(range(10)).as_parallel(executor=pool, chunk_size=1).select(selector).to_list()
+        assert threading.get_ident() not in threads
+
+    def test_terminals(self):
+        en = Enumerable(range(1000)).as_parallel(chunk_size=64)
+        assert en.sum() == sum(range(1000))
+        assert en.sum(lambda x: x * 2) == 2 * sum(range(1000))
+        assert en.count() == 1000
+        assert en.count(lambda x: x % 10 == 0) == 100
+        assert en.aggregate(0, lambda acc, e: acc + 1, lambda a, b: a + b, str) == '1000'
+        assert en.aggregate(lambda a, b: a + b) == sum(range(1000))
+
+    def test_aggregate_combines_in_order(self):
+        en = Enumerable('abcdefg').as_parallel(chunk_size=2)
+        assert en.aggregate('', lambda acc, e: acc + e, lambda a, b: a + '|' + b, str.upper) == \
+            'AB|CD|EF|G'
+
+    def test_empty(self):
+        en = Enumerable([]).as_parallel()
+        assert en.sum() == 0
+        assert en.count() == 0
+        assert en.to_list() == []
+        assert en.aggregate(5, lambda acc, e: acc + e, lambda a, b: a + b, lambda x: x) == 5
+        assert Enumerable([1, 2]).as_parallel(chunk_size=1).where(lambda x: x > 1).sum() == 2
+
+    def test_unordered(self):
+        with ThreadPoolExecutor(4) as pool:
+            en = Enumerable(naturals()).take(500) \
+                .as_parallel(executor=pool, chunk_size=3, ordered=False)
+            assert sorted(en.select(lambda x: -x).to_list()) == sorted(-x for x in range(500))
+
+    def test_as_parallel_again(self):
+        en = Enumerable(range(10)).as_parallel(chunk_size=3).select(lambda x: x + 1)
+        en2 = en.as_parallel(chunk_size=1, ordered=False)
+        assert sorted(en2.to_list()) == en.to_list() == [*range(1, 11)]
+
+    def test_lazy_and_bounded(self):
+        pulled = []
+        def gen():
+            for i in naturals():
+                pulled.append(i)
+                yield i
+        en = Enumerable(gen).as_parallel(chunk_size=10).select(square)
+        assert pulled == []
+        assert en.take(3).to_list() == [0, 1, 4]
+        # the infinite source is only read ahead by a bounded number of chunks
+        assert len(pulled) < 10000
+
+    def test_process_pool(self):
+        with ProcessPoolExecutor(2) as pool:
+            en = Enumerable(range(50)).as_parallel(executor=pool, chunk_size=8).select(square)
+            assert en.to_list() == [x * x for x in range(50)]
+            assert en.sum() == sum(x * x for x in range(50))
+
+    def test_worker_error(self):
+        def selector(x):
+            if x == 30:
+                raise ValueError(x)
+            return x
+        for ordered in (True, False):
+            en = Enumerable(range(100)).as_parallel(chunk_size=1, ordered=ordered).select(selector)
+            with pytest.raises(ValueError):
+                en.to_list()
+
+    def test_errors(self):
+        with pytest.raises(InvalidOperationError):
+            Enumerable([]).as_parallel(chunk_size=0)
+        with pytest.raises(InvalidOperationError):
+            Enumerable([]).as_parallel().as_parallel(chunk_size=-1)
+
+
 class TestOrderedByThenIter:
     def test_orderby_index(self):
         en = Enumerable([1, 3, 2]).order_by(lambda x: x)
@@ -236,3 +637,80 @@ class TestComposeMapAandSet:
         with pytest.raises(KeyError):
             del map[[]]
         assert self.__set_equal(map.items(), [([1, 2, 4], 3)])
+
+    def test_unhashable_containers(self):
+        map = ComposeMap()
+        map[[1, {'a': [2]}]] = 1
+        map[{'x': 1, 'y': [2, 3]}] = 2
+        map[{1, 2}] = 3
+        map[bytearray(b'ab')] = 4
+        assert map[[1, {'a': [2]}]] == 1
+        assert map[{'y': [2, 3], 'x': 1}] == 2
+        assert map[{2, 1}] == 3
+        assert map[bytearray(b'ab')] == 4
+        assert [1, {'a': [3]}] not in map
+        assert [*map] == [[1, {'a': [2]}], {'x': 1, 'y': [2, 3]}, {1, 2}, bytearray(b'ab')]
+
+    def test_unhashable_objects(self):
+        class Key:
+            __hash__ = None  # type: ignore
+            def __init__(self, v):
+                self.v = v
+            def __eq__(self, other):
+                return isinstance(other, Key) and self.v == other.v
+        set = ComposeSet([Key(1), [Key(1)], Key(2), Key(1), [Key(1)]])
+        assert len(set) == 3
+        assert Key(2) in set and [Key(1)] in set
+        set.discard(Key(2))
+        set.discard([Key(1)])
+        assert [*set] == [Key(1)]
+
+    def test_key_hasher(self):
+        calls = []
+        def key_hasher(x):
+            calls.append(x)
+            return 0
+        map = ComposeMap([([1], 'a'), ([2], 'b'), ([1], 'c')], key_hasher=key_hasher)
+        assert len(calls) == 3
+        assert [*map.items()] == [([1], 'c'), ([2], 'b')]
+        del map[[1]]
+        del map[[2]]
+        assert len(map) == 0
+        set = ComposeSet([[1], [1.0], [True]], key_hasher=len)
+        assert len(set) == 1
+
+    def test_freeze_hash(self):
+        assert freeze_hash([1, [2]]) == freeze_hash([1.0, [2]]) == hash((1, (2,)))
+        assert freeze_hash({'a': 1, 'b': 2}) == freeze_hash({'b': 2, 'a': 1})
+        class Unhashable:
+            __hash__ = None  # type: ignore
+        with pytest.raises(TypeError):
+            freeze_hash([Unhashable()])
+
+    def test_hashable_type_unhashable_value(self):
+        # tuples are hashable unless they contain unhashable values
+        set = ComposeSet([(1, [2]), (1, 2)])
+        assert (1, [2]) in set and (1, 2) in set
+        assert not set.try_add((1, [2]))
+        assert set.try_add((2, [2]))
+        assert not set.try_add((1, 2))
+        set.discard((1, [2]))
+        assert [*set] == [(1, 2), (2, [2])]
+
+        map: ComposeMap[Any, str] = ComposeMap([((1, [2]), 'a')])
+        map[(1, [2])] = 'b'
+        map[(1, 2)] = 'c'
+        assert map[(1, [2])] == 'b'
+        assert map.get((1, [2])) == 'b'
+        assert map.get((1, [3]), 'd') == 'd'
+        assert (1, [2]) in map and (1, [3]) not in map
+        del map[(1, [2])]
+        assert [*map.items()] == [((1, 2), 'c')]
+
+    def test_try_add(self):
+        set = ComposeSet()
+        assert set.try_add(1)
+        assert not set.try_add(1)
+        assert set.try_add([1])
+        assert not set.try_add([1])
+        assert [*set] == [1, [1]]
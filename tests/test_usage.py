@@ -1,9 +1,12 @@
 import math
-from typing import Any, Generic, Iterable, List, NamedTuple, Sequence, Tuple, TypeVar, cast
+import os
+from typing import Any, Generic, Iterable, List, NamedTuple, Optional, Sequence, Tuple, TypeVar, cast
 
 import pytest
 
-from types_linq import Enumerable, InvalidOperationError, IndexOutOfRangeError
+from types_linq import Enumerable, InvalidOperationError, IndexOutOfRangeError, JoinStrategy
+from types_linq.ordered_enumerable import OrderedEnumerable
+from types_linq.util import identity
 
 
 TSource_co = TypeVar('TSource_co', covariant=True)
@@ -120,6 +123,76 @@ class TestAggregateMethod:
         assert sole == 87
 
 
+class TestAggregateByMethod:
+    def test_aggregate_by(self):
+        sales = [('tea', 3), ('coffee', 5), ('tea', 2), ('milk', 1)]
+        en = Enumerable(sales).aggregate_by(lambda s: s[0], 10, lambda acc, s: acc + s[1])
+        assert en.to_list() == [('tea', 15), ('coffee', 15), ('milk', 11)]
+        assert en.to_list() == [('tea', 15), ('coffee', 15), ('milk', 11)]
+
+    def test_empty(self):
+        assert Enumerable([]).aggregate_by(lambda x: x, 0, lambda acc, x: acc + 1).to_list() == []
+
+    def test_seed_selector(self):
+        words = ['apple', 'bean', 'avocado', 'beet', 'apple']
+        def add(acc, w):
+            acc.append(w)
+            return acc
+        en = Enumerable(words).aggregate_by2(lambda w: w[0], lambda k: [k.upper()], add)
+        assert en.to_list() == \
+            [('a', ['A', 'apple', 'avocado', 'apple']), ('b', ['B', 'bean', 'beet'])]
+
+    def test_none_accumulator(self):
+        def toggle(acc: Optional[int], x: int) -> Optional[int]:
+            return x if acc is None else None
+        en = Enumerable([1, 2, 3]).aggregate_by(lambda x: x % 2, None, toggle)
+        assert en.to_list() == [(1, None), (0, 2)]
+
+    def test_unhashable_keys(self):
+        en = Enumerable([[1], [2], [1]]).aggregate_by(lambda x: x, 0, lambda acc, x: acc + 1)
+        assert en.to_list() == [([1], 2), ([2], 1)]
+
+
+class TestAggregateManyMethod:
+    def test_aggregate_many(self):
+        en = Enumerable(['apple', 'fig', 'banana'])
+        assert en.aggregate_many((0, lambda acc, w: acc + len(w))) == (14,)
+        assert en.aggregate_many(
+            (0, lambda acc, w: acc + len(w)),
+            ('', lambda acc, w: acc + w[0]),
+            (0, lambda acc, w: acc + 1),
+        ) == (14, 'afb', 3)
+
+    def test_typed(self):
+        en = Enumerable(['apple', 'fig', 'banana'])
+        total, initials = en.aggregate_many((0, lambda acc, w: acc + len(w)), ('', lambda acc, w: acc + w[0]))
+        assert total + 1 == 15 and initials.upper() == 'AFB'
+        def longer(acc: str, w: str) -> str:
+            return w if len(w) > len(acc) else acc
+        longest, count, lengths = en.aggregate_many(
+            ('', longer),
+            (0, lambda acc, w: acc + 1),
+            ((), lambda acc, w: (*acc, len(w))),
+        )
+        assert (longest.upper(), count * 2, lengths) == ('BANANA', 6, (5, 3, 6))
+
+    def test_enumerates_once(self):
+        pulled = []
+        def gen():
+            for i in range(5):
+                pulled.append(i)
+                yield i
+        en = Enumerable(gen)
+        add = lambda acc, e: acc + e
+        assert en.aggregate_many((0, add), (1, add), (2, add), (3, add), (4, add), (5, add)) == \
+            (10, 11, 12, 13, 14, 15)
+        assert pulled == [0, 1, 2, 3, 4]
+
+    def test_empty(self):
+        assert Enumerable([]).aggregate_many((0, lambda acc, e: acc + e), ([], lambda acc, e: acc)) == \
+            (0, [])
+
+
 class TestAllMethod:
     def test_all(self):
         ints = [1, 3, 5, 7, 9]
@@ -177,6 +250,12 @@ class TestAppendMethod:
         assert en.to_list() == []
         assert en2.to_list() == [7, 8]
 
+    def test_sequence_view(self):
+        en = Enumerable([1, 2]).append(3)
+        assert len(en) == 3
+        assert en[2] == 3
+        assert en[-3] == 1
+
 
 class TestAverageMethod:
     def test_average_overload1(self):
@@ -268,6 +347,30 @@ class TestConcatMethod:
         en4 = en1.concat(en1).concat(en2).concat([]).concat([16])
         assert en4.to_list() == [1, 2, 3, 1, 2, 3, 1, 2, 4, 16]
 
+    def test_sequence_view(self):
+        en = Enumerable([1, 2]).concat(range(3, 6))
+        assert len(en) == 5
+        assert en[1] == 2
+        assert en[2] == 3
+        assert en[1:4].to_list() == [2, 3, 4]
+        with pytest.raises(IndexError):
+            en[5]
+        with pytest.raises(IndexError):
+            en[-6]
+
+    def test_generator(self):
+        en = Enumerable(x for x in [1, 2]).prepend(0).append(3).concat([4])
+        assert en.to_list() == [0, 1, 2, 3, 4]
+
+    def test_sequence_and_generator(self):
+        called = []
+        def gen_func():
+            called.append(1)
+            yield from [3, 4]
+        en = Enumerable([1, 2]).concat(Enumerable(gen_func)).select(lambda x: x * 2)
+        assert en.to_list() == [2, 4, 6, 8]
+        assert called == [1]
+
 
 class TestContainsMethod:
     def test_overload1(self):
@@ -324,6 +427,20 @@ class TestCountMethod:
         assert len(en2) == 0
 
 
+class TestCountByMethod:
+    def test_count_by(self):
+        en = Enumerable(['apple', 'bean', 'avocado', 'beet', 'cherry']).count_by(lambda w: w[0])
+        assert en.to_list() == [('a', 2), ('b', 2), ('c', 1)]
+        assert en.to_dict(lambda t: t[0], lambda t: t[1]) == {'a': 2, 'b': 2, 'c': 1}
+
+    def test_empty(self):
+        assert Enumerable([]).count_by(lambda x: x).to_list() == []
+
+    def test_unhashable_keys(self):
+        en = Enumerable([{'a': 1}, {'a': 2}, {'a': 1}]).count_by(lambda x: x)
+        assert en.to_list() == [({'a': 1}, 2), ({'a': 2}, 1)]
+
+
 class TestDefaultIfEmptyMethod:
     def test_non_empty(self):
         lst = [44]
@@ -374,6 +491,12 @@ class TestReverseMethod:
         assert en2.reverse().to_list() == [2, 1]
         assert [i for i in reversed(en2)] == [2, 1]
 
+    def test_sequence_view(self):
+        en = Enumerable([1, 2, 3]).reverse()
+        assert len(en) == 3
+        assert en[0] == 3
+        assert en.reverse().to_list() == [1, 2, 3]
+
 
 class TestElementAtMethod:
     def test_overload1_0(self):
@@ -475,6 +598,28 @@ class TestExceptByMethod:
         assert en.except_by([2, 1], len).to_list() == ['aaa', 'dddd']
 
 
+class TestEveryMethod:
+    def test_every(self):
+        en = Enumerable(range(10))
+        assert en.every(1).to_list() == [*range(10)]
+        assert en.every(3).to_list() == [0, 3, 6, 9]
+        assert en.every(20).to_list() == [0]
+
+    def test_generator(self):
+        gen = lambda: (i for i in range(10))
+        en = Enumerable(gen)
+        assert en.every(4).to_list() == [0, 4, 8]
+        assert en.every(2).every(3).to_list() == [0, 6]
+        assert en.select(lambda x: -x).every(5).to_list() == [0, -5]
+
+    def test_empty(self):
+        assert Enumerable([]).every(2).to_list() == []
+
+    def test_invalid(self):
+        with pytest.raises(InvalidOperationError):
+            Enumerable([1]).every(0)
+
+
 class TestFirstMethod:
     def test_first_overload1_yes(self):
         lst = ('a', 'b', 5, 'c')
@@ -515,6 +660,33 @@ class TestFirstMethod:
         assert en.first2(lambda e: isinstance(e, tuple), 'A') == 'A'
 
 
+class TestFullOuterJoinMethod:
+    outer = [(1, 'a'), (2, 'b'), (5, 'c'), (2, 'd')]
+    inner = [(2, 'x'), (1, 'y'), (3, 'z'), (2, 'w'), (0, 'v')]
+
+    def query(self, outer: Iterable[Tuple[int, str]], inner: Iterable[Tuple[int, str]], strategy: JoinStrategy):
+        return Enumerable(outer).full_outer_join(inner, lambda o: o[0], lambda i: i[0],
+            lambda o, i: (o[1] if o else '-') + (i[1] if i else '-'), strategy=strategy).to_list()
+
+    def test_full_outer_join(self):
+        expected = ['ay', 'bx', 'bw', 'c-', 'dx', 'dw', '-z', '-v']
+        assert self.query(self.outer, self.inner, JoinStrategy.auto) == expected
+        assert self.query(self.outer, self.inner, JoinStrategy.hash_inner) == expected
+
+    def test_hash_outer(self):
+        assert self.query(self.outer, self.inner, JoinStrategy.hash_outer) == \
+            ['bx', 'dx', 'ay', '-z', 'bw', 'dw', '-v', 'c-']
+
+    def test_merge(self):
+        outer = sorted(self.outer, key=lambda o: o[0])
+        inner = sorted(self.inner, key=lambda i: i[0])
+        assert self.query(outer, inner, JoinStrategy.merge) == \
+            ['-v', 'ay', 'bx', 'bw', 'dx', 'dw', '-z', 'c-']
+        assert self.query(outer[:2], inner, JoinStrategy.merge) == \
+            ['-v', 'ay', 'bx', 'bw', '-z']
+        assert self.query([], [], JoinStrategy.merge) == []
+
+
 class TestGroupByMethod:
     pets_list: List[Tuple[str, float]] = [
         ('Barley', 8.3), ('Boots', 4.9), ('Whiskers', 1.5), ('Daisy', 4.3),
@@ -576,6 +748,64 @@ class TestGroupByMethod:
             next(it)
 
 
+    def test_spill(self, tmp_path: Any):
+        lst = [(i * 7 % 23, i) for i in range(500)]
+        en = Enumerable(lst)
+        expected = {k: [v for _, v in g] for k, g in en.group_by2(lambda t: t[0]).select(lambda g: (g.key, g))}
+        q = en.group_by(lambda t: t[0], lambda t: t[1], spill_threshold=30, spill_dir=str(tmp_path))
+        res = q.to_list()
+        assert len(res) == 23
+        assert {g.key: g.to_list() for g in res} == expected
+        q2 = en.group_by2(lambda t: t[0], lambda k, g: (k, g.count()), spill_threshold=30)
+        assert sorted(q2) == sorted((k, len(v)) for k, v in expected.items())
+        assert os.listdir(tmp_path) == []
+
+    def test_spill_in_memory(self):
+        # the usual order if nothing is spilled
+        en = Enumerable(TestGroupByMethod.pets_list)
+        q = en.group_by2(lambda pet: math.floor(pet[1]), lambda k, g: k, spill_threshold=100)
+        assert q.to_list() == [8, 4, 1, 2]
+
+    class Key:
+        def __init__(self, val: int):
+            self.val = val
+        def __eq__(self, other: Any):
+            return self.val == other.val
+        __hash__ = None  # type: ignore
+
+    def test_spill_unhashable(self):
+        lst = [[i % 3] for i in range(20)]
+        q = Enumerable(lst).group_by2(identity, lambda k, g: (k, g.count()), spill_threshold=4)
+        assert sorted(q.to_list()) == [([0], 7), ([1], 7), ([2], 6)]
+        q2 = Enumerable(range(20)).group_by2(lambda x: self.Key(x % 3), spill_threshold=4)
+        assert sorted((g.key.val, g.to_list()) for g in q2) == \
+            [(0, [*range(0, 20, 3)]), (1, [*range(1, 20, 3)]), (2, [*range(2, 20, 3)])]
+
+    def test_spill_identity_keys(self):
+        class P:
+            pass
+        a, b = P(), P()
+        # the keys are compared by identity, and cannot be pickled
+        en = Enumerable([a, b, a, b, a, b]).select2(lambda x, i: (x, i))
+        q = en.group_by(lambda t: t[0], lambda t: t[1], spill_threshold=2)
+        res = q.to_list()
+        assert len(res) == 2
+        assert {id(g.key): g.to_list() for g in res} == {id(a): [0, 2, 4], id(b): [1, 3, 5]}
+
+    def test_spill_abandon(self):
+        q = Enumerable(range(100)).group_by2(lambda x: x % 10, spill_threshold=5)
+        it = iter(q)
+        g = next(it)
+        assert g.to_list() == [*range(g.key, 100, 10)]
+        it.close()  # type: ignore
+
+    def test_spill_errors(self):
+        with pytest.raises(InvalidOperationError):
+            Enumerable([]).group_by2(identity, spill_threshold=0)
+        with pytest.raises(InvalidOperationError):
+            Enumerable([]).group_by(identity, identity, spill_dir='.')
+
+
 class TestGroupJoinMethod:
     def test_group_join(self):
         class Person(NamedTuple):
@@ -640,6 +870,20 @@ class TestGroupJoinMethod:
         assert q.to_list() == [(16, []), (17, []), (15, [])]
 
 
+    def test_strategies(self):
+        outer = Enumerable([3, 1, 2]).order_by(identity)
+        inner = Enumerable([1, 1, 3, 4]).order_by(identity)
+        def q(strategy):
+            return outer.group_join(inner, identity, identity,
+                lambda o, g: (o, g.to_list()), strategy=strategy).to_list()
+        expected = [(1, [1, 1]), (2, []), (3, [3])]
+        assert q(JoinStrategy.auto) == expected
+        assert q(JoinStrategy.hash_inner) == expected
+        assert q(JoinStrategy.merge) == expected
+        with pytest.raises(InvalidOperationError):
+            q(JoinStrategy.hash_outer)
+
+
 class TestIntersectMethod:
     def test_intersect(self):
         ints = [4, 88, 21, -5, 25, 12, 77, 77, 79, 77, 0, 0]
@@ -714,6 +958,58 @@ class TestJoinMethod:
         assert q.to_list() == []
 
 
+    def test_strategies(self):
+        outer = [(1, 'a'), (2, 'b'), (2, 'c'), (4, 'd')]
+        inner = [(2, 'x'), (1, 'y'), (3, 'z'), (2, 'w')]
+        en = Enumerable(outer)
+        def q(strategy):
+            return en.join(inner, lambda o: o[0], lambda i: i[0],
+                lambda o, i: o[1] + i[1], strategy=strategy).to_list()
+        expected = ['ay', 'bx', 'bw', 'cx', 'cw']
+        assert q(JoinStrategy.auto) == expected
+        assert q(JoinStrategy.hash_inner) == expected
+        assert q(JoinStrategy.hash_outer) == ['bx', 'cx', 'ay', 'bw', 'cw']
+        sorted_inner = sorted(inner, key=lambda i: i[0])
+        assert en.join(sorted_inner, lambda o: o[0], lambda i: i[0],
+            lambda o, i: o[1] + i[1], strategy=JoinStrategy.merge).to_list() == \
+            ['ay', 'bx', 'bw', 'cx', 'cw']
+
+    def test_merge_planned(self):
+        called = []
+        def outer_key(o: Tuple[int, str]):
+            called.append(o)
+            return o[0]
+        def inner_key(i: Tuple[int, str]):
+            return i[0]
+        outer = Enumerable([(4, 'd'), (2, 'b'), (1, 'a'), (2, 'c')]).order_by(outer_key)
+        inner = Enumerable([(2, 'x'), (1, 'y'), (3, 'z'), (2, 'w')]).order_by(inner_key)
+        q = outer.join(inner, outer_key, inner_key, lambda o, i: o[1] + i[1])
+        assert q.to_list() == ['ay', 'bx', 'bw', 'cx', 'cw']
+        # with a hash join, outer_key would be called again for the probing
+        assert len(called) == 8
+        outer_desc = Enumerable([1, 3, 2]).order_by_descending(identity)
+        inner_desc = Enumerable([2, 3, 3, 0]).order_by_descending(identity)
+        assert outer_desc.join(inner_desc, identity, identity, lambda o, i: (o, i)).to_list() == \
+            [(3, 3), (3, 3), (2, 2)]
+        # unhashable keys are fine
+        outer_lists = Enumerable([[2], [1]]).order_by(identity)
+        inner_lists = Enumerable([[1], [3], [2]]).order_by(identity)
+        assert outer_lists.join(inner_lists, identity, identity, lambda o, i: o + i).to_list() == \
+            [[1, 1], [2, 2]]
+        # orderings using comparers are not merged
+        outer_cmp = Enumerable([2, 1]).order_by(identity, lambda x, y: y - x)
+        assert outer_cmp.join(Enumerable([1, 2]).order_by(identity), identity, identity,
+            lambda o, i: o).to_list() == [2, 1]
+
+    def test_merge_unsorted(self):
+        en = Enumerable([1, 3, 2])
+        with pytest.raises(InvalidOperationError):
+            en.join([1, 2, 3], identity, identity, lambda o, i: o, strategy=JoinStrategy.merge).to_list()
+        with pytest.raises(InvalidOperationError):
+            Enumerable([1, 2]).join([1, 3, 2], identity, identity, lambda o, i: o,
+                strategy=JoinStrategy.merge).to_list()
+
+
 class TestLastMethod:
     def test_last_overload1_yes(self):
         lst = ('a', object(), 'b', 5, 'c')
@@ -754,6 +1050,30 @@ class TestLastMethod:
         assert en.last2(lambda e: isinstance(e, tuple), 'A') == 'A'
 
 
+class TestLeftJoinMethod:
+    outer = [(1, 'a'), (2, 'b'), (5, 'c'), (2, 'd')]
+    inner = [(2, 'x'), (1, 'y'), (3, 'z'), (2, 'w')]
+
+    def test_left_join(self):
+        q = Enumerable(self.outer).left_join(self.inner, lambda o: o[0], lambda i: i[0],
+            lambda o, i: (o[1], i and i[1]))
+        assert q.to_list() == [
+            ('a', 'y'), ('b', 'x'), ('b', 'w'), ('c', None), ('d', 'x'), ('d', 'w'),
+        ]
+
+    def test_strategies(self):
+        def q(outer: Iterable[Tuple[int, str]], inner: Iterable[Tuple[int, str]], strategy: JoinStrategy):
+            return Enumerable(outer).left_join(inner, lambda o: o[0], lambda i: i[0],
+                lambda o, i: o[1] + (i[1] if i else '-'), strategy=strategy).to_list()
+        assert q(self.outer, self.inner, JoinStrategy.hash_outer) == \
+            ['bx', 'dx', 'ay', 'bw', 'dw', 'c-']
+        outer = sorted(self.outer, key=lambda o: o[0])
+        inner = sorted(self.inner, key=lambda i: i[0])
+        assert q(outer, inner, JoinStrategy.merge) == ['ay', 'bx', 'bw', 'dx', 'dw', 'c-']
+        assert q([], inner, JoinStrategy.merge) == []
+        assert q(outer, [], JoinStrategy.merge) == ['a-', 'b-', 'd-', 'c-']
+
+
 class TestMaxMethod:
     def test_max_overload1(self):
         nums = (1, 5, 2.2, 5, 1, 2)
@@ -967,6 +1287,93 @@ class TestOrderByMethod:
         )
         assert q.to_list() == [nodes[i] for i in [0, 4, 1, 3, 2]]
 
+    def test_len_unsorted(self):
+        called = []
+        def key(x: int):
+            called.append(x)
+            return x
+        en = Enumerable([3, 1, 2]).order_by(key).then_by_descending(key)
+        assert len(en) == 3
+        assert en.count() == 3
+        assert called == []
+        assert en[0] == 1
+        assert len(Enumerable(x for x in [3, 1, 2]).order_by(key)) == 3
+
+    def test_partial_sort(self, monkeypatch: Any):
+        # enough elements so that the leading or trailing ones are selected without a full sort
+        lst = [(i * 7 % 10, i) for i in range(200)]
+        asc = sorted(lst, key=lambda t: t[0])
+        desc = sorted(lst, key=lambda t: t[0], reverse=True)
+        en = Enumerable(lst).order_by(lambda t: t[0])
+        en_desc = Enumerable(lst).order_by_descending(lambda t: t[0])
+        sort = cast(Any, OrderedEnumerable)._sort
+        sorts: List[int] = []
+        def spy(self: Any, lst: Any):
+            sorts.append(len(lst))
+            return sort(self, lst)
+        monkeypatch.setattr(OrderedEnumerable, '_sort', spy)
+        assert en.take(3).to_list() == asc[:3]
+        assert en.skip(1).take(2).to_list() == asc[1:3]
+        assert en.skip(1).skip(1).take(2).to_list() == asc[2:4]
+        assert en.take_last(3).to_list() == asc[-3:]
+        assert en_desc.take(3).to_list() == desc[:3]
+        assert en_desc.take_last(3).to_list() == desc[-3:]
+        assert en.first() == en.element_at(0) == en.first2(None) == asc[0]
+        assert en.last() == en.last2(None) == asc[-1]
+        assert en_desc.last() == desc[-1]
+        assert en[2] == asc[2] and en[-2] == asc[-2]
+        assert en.element_at(2) == asc[2] and en.element_at(-2) == asc[-2]
+        assert en[:3].to_list() == asc[:3]
+        assert en[1:5:2].to_list() == asc[1:5:2]
+        assert en.elements_in(1, 3).to_list() == asc[1:3]
+        assert sorts == []
+        assert en[96:].to_list() == asc[96:]
+        assert en.take(50).to_list() == asc[:50]
+        # a full sort is faster for these
+        assert sorts == [200, 200]
+        assert en.last(lambda t: t[1] < 50) == [t for t in asc if t[1] < 50][-1]
+        assert en.last2(lambda t: t[1] >= 200, None) is None
+
+    def test_partial_sort_then_by(self):
+        lst = [(i % 3, i % 4, i) for i in range(100)]
+        en = Enumerable(lst).order_by(lambda t: t[0]).then_by_descending(lambda t: t[1])
+        expected = sorted(lst, key=lambda t: (t[0], -t[1]))
+        assert en.take(3).to_list() == expected[:3]
+        assert en.take_last(3).to_list() == expected[-3:]
+        assert en.first() == expected[0]
+        assert en.last() == expected[-1]
+
+    def test_lazy(self):
+        lst = [(i * 7919 % 1000, i % 3, i) for i in range(5000)]
+        en = Enumerable(lst).order_by(lambda t: t[0], lazy=True)
+        assert not isinstance(en._get_iterable(), list)
+        assert en.to_list() == sorted(lst, key=lambda t: t[0])
+        en2 = Enumerable(lst).order_by_descending(lambda t: t[1], lazy=True) \
+            .then_by(lambda t: t[0])
+        expected = sorted(lst, key=lambda t: (-t[1], t[0]))
+        assert en2.take_while(lambda t: t[1] == 2).to_list() == [t for t in expected if t[1] == 2]
+        assert en2.to_list() == expected
+        assert len(en2) == 5000
+        assert en2[100] == expected[100]
+        en3 = Enumerable([3, 1, 2]).order_by(lambda x: x, lambda x, y: y - x, lazy=True)
+        assert en3.to_list() == [3, 2, 1]
+        en4 = Enumerable([3, 1, 2]).order_by_descending(lambda x: -x, lazy=True)
+        assert en4.to_list() == [1, 2, 3]
+
+    def test_partial_sort_out_of_range(self):
+        en = Enumerable([3, 1, 2]).order_by(lambda x: x)
+        assert en.take(5).to_list() == [1, 2, 3]
+        assert en.take_last(5).to_list() == [1, 2, 3]
+        with pytest.raises(IndexOutOfRangeError):
+            en[3]
+        with pytest.raises(IndexOutOfRangeError):
+            en[-4]
+        with pytest.raises(InvalidOperationError):
+            Enumerable([]).order_by(lambda x: x).first()
+        with pytest.raises(InvalidOperationError):
+            Enumerable([]).order_by(lambda x: x).last()
+        assert Enumerable([]).order_by(lambda x: x).last2(0) == 0
+
 
 class TestPrependMethod:
     def test_no_mutate(self):
@@ -977,6 +1384,12 @@ class TestPrependMethod:
         assert en.to_list() == [10]
         assert en2.to_list() == [8, 7, 10]
 
+    def test_sequence_view(self):
+        en = Enumerable(range(3)).prepend(-1)
+        assert len(en) == 4
+        assert en[0] == -1
+        assert en[-1] == 2
+
 
 class TestRangeMethod:
     def test_range(self):
@@ -1038,6 +1451,68 @@ class TestSelectMethod:
         doubled = en.select2(lambda e, i: e * i)
         assert doubled.to_list() == [0, 1, 4, 9]
 
+    def test_select_sequence_view(self):
+        called = []
+        def selector(x: int):
+            called.append(x)
+            return x * 2
+        en = Enumerable([1, 2, 3, 4]).select(selector)
+        assert len(en) == 4
+        assert called == []
+        assert en[2] == 6
+        assert en[-1] == 8
+        assert called == [3, 4]
+        assert [*reversed(en)] == [8, 6, 4, 2]
+
+    def test_select2_sequence_view(self):
+        en = Enumerable([1, 2, 3, 4]).select2(lambda e, i: (e, i))
+        assert len(en) == 4
+        assert en[-1] == (4, 3)
+        assert en[1:3].to_list() == [(2, 1), (3, 2)]
+        assert en.to_list() == [(1, 0), (2, 1), (3, 2), (4, 3)]
+
+
+class TestSelectBatchMethod:
+    def test_select_batch(self):
+        calls = []
+        def selector(batch):
+            calls.append(batch)
+            return [x * 10 for x in batch]
+        en = Enumerable(range(7)).select_batch(selector, batch_size=3)
+        assert calls == []
+        assert en.to_list() == [0, 10, 20, 30, 40, 50, 60]
+        assert calls == [[0, 1, 2], [3, 4, 5], [6]]
+
+    def test_default_batch_size(self):
+        sizes = []
+        def selector(batch):
+            sizes.append(len(batch))
+            return batch
+        assert Enumerable(range(2000)).select_batch(selector).count() == 2000
+        assert sizes == [1024, 976]
+
+    def test_fused(self):
+        en = Enumerable(lambda: iter(range(10))) \
+            .where(lambda x: x % 2 == 0) \
+            .select_batch(lambda b: (len(b), sum(b)), batch_size=2) \
+            .skip(1)
+        assert en.to_list() == [2, 2, 10, 1, 8]
+        assert Enumerable([]).select_batch(lambda b: b).to_list() == []
+
+    def test_lazy(self):
+        pulled = []
+        def gen():
+            for i in range(100):
+                pulled.append(i)
+                yield i
+        en = Enumerable(gen).select_batch(lambda b: b, batch_size=4)
+        assert en.take(5).to_list() == [0, 1, 2, 3, 4]
+        assert pulled == [*range(8)]
+
+    def test_invalid_batch_size(self):
+        with pytest.raises(InvalidOperationError):
+            Enumerable([1]).select_batch(lambda b: b, batch_size=0)
+
 
 class TestSelectManyMethod:
     def test_selectmany_overload1(self):
@@ -1254,6 +1729,21 @@ class TestSkipMethod:
         assert en.skip(0).to_list() == lst
         assert en.skip(-1).to_list() == lst
 
+    def test_sequence_view(self):
+        en = Enumerable(range(10 ** 12)).skip(10 ** 12 - 3)
+        assert len(en) == 3
+        assert en[0] == 10 ** 12 - 3
+        assert en[-1] == 10 ** 12 - 1
+        assert en.to_list() == [10 ** 12 - 3, 10 ** 12 - 2, 10 ** 12 - 1]
+
+    def test_sequence_view_chained(self):
+        lst = [*range(10)]
+        en = Enumerable(lst).skip(2).skip_last(1).skip(3)
+        assert len(en) == 4
+        assert en[1] == 6
+        assert en[1:3].to_list() == [6, 7]
+        assert [*reversed(en)] == [8, 7, 6, 5]
+        assert en.select(lambda x: x * 2).to_list() == [10, 12, 14, 16]
 
 class TestSkipLastMethod:
     def test_some(self):
@@ -1290,6 +1780,12 @@ class TestSkipLastMethod:
             assert stored == [0, 1, 2, *range(3, 3 + count + 1)]
             count += 1
 
+    def test_sequence_view(self):
+        tup = (1, 2, 3, 4, 5)
+        en = Enumerable(tup).skip_last(2)
+        assert len(en) == 3
+        assert en[2] == 3
+        assert en.to_list() == [1, 2, 3]
 
 class TestSkipWhileMethod:
     def test_skip_while_some(self):
@@ -1335,6 +1831,31 @@ class TestSkipWhileMethod:
         assert q.to_list() == []
 
 
+class TestStatsMethod:
+    def test_stats(self):
+        stats = Enumerable(e for e in [3, 1, 4, 1, 5]).stats()
+        assert (stats.count, stats.sum, stats.min, stats.max, stats.average) == (5, 14, 1, 5, 2.8)
+
+    def test_selector(self):
+        stats = Enumerable(['apple', 'fig', 'banana']).stats(len)
+        assert (stats.count, stats.sum, stats.min, stats.max, stats.average) == (3, 14, 3, 6, 14 / 3)
+
+    def test_single(self):
+        stats = Enumerable(['x']).stats()
+        assert (stats.count, stats.sum, stats.min, stats.max) == (1, 'x', 'x', 'x')
+
+    def test_empty(self):
+        stats = Enumerable([]).stats()
+        assert stats.count == 0
+        assert stats.sum == 0
+        with pytest.raises(InvalidOperationError):
+            stats.min
+        with pytest.raises(InvalidOperationError):
+            stats.max
+        with pytest.raises(InvalidOperationError):
+            stats.average
+
+
 class TestSumMethod:
     def test_sum_overload1(self):
         floats = [.1, .3, .5, .9, 1.1]
@@ -1407,6 +1928,18 @@ class TestTakeMethod:
         en = Enumerable(TestElementAtMethod.OnlyHasGetItem(['x']))
         assert en.elements_in(slice(7)).to_list() == ['x']
 
+    def test_overload1_sequence_view(self):
+        class NoIterList(List[int]):
+            def __iter__(self):
+                assert False
+        lst = NoIterList(range(100))
+        en = Enumerable(lst).skip(40).take(5)
+        assert len(en) == 5
+        assert en[0] == 40
+        assert en[-1] == 44
+        assert en.take(2).to_list() == [40, 41]
+        lst[40] = -1
+        assert en.to_list() == [-1, 41, 42, 43, 44]
 
 class TestTakeLastMethod:
     def test_some(self):
@@ -1438,6 +1971,12 @@ class TestTakeLastMethod:
         assert en.take_last(0).to_list() == []
         assert en.take_last(-1).to_list() == []
 
+    def test_sequence_view(self):
+        en = Enumerable([5, 6, 7, 8]).take_last(3)
+        assert len(en) == 3
+        assert en[0] == 6
+        assert en.take_last(5).to_list() == [6, 7, 8]
+        assert en.where(lambda x: x % 2 == 0).to_list() == [6, 8]
 
 class TestTakeWhileMethod:
     def test_take_while_some(self):
@@ -1602,6 +2141,58 @@ class TestThenByMethod:
         ]
 
 
+    def test_selector_called_once_per_level(self):
+        calls: List[int] = []
+        def selector(i: int):
+            def inner(t: Tuple[int, int, int]):
+                calls.append(i)
+                return t[i]
+            return inner
+        lst = [(i % 3, i % 2, -i) for i in range(12)]
+        q = Enumerable(lst).order_by(selector(0)) \
+            .then_by_descending(selector(1)) \
+            .then_by(selector(2), lambda x, y: x - y)
+        assert q.to_list() == sorted(lst, key=lambda t: (t[0], -t[1], t[2]))
+        assert sorted(calls) == [0] * 12 + [1] * 12 + [2] * 12
+
+    def test_mixed_directions(self):
+        lst = [(i % 3, 'abc'[i % 4 % 3], i % 5 / 2) for i in range(30)]
+        q = Enumerable(lst).order_by_descending(lambda t: t[0]) \
+            .then_by(lambda t: t[1]) \
+            .then_by(lambda t: t[2])
+        assert q.to_list() == sorted(lst, key=lambda t: (-t[0], t[1], t[2]))
+        q2 = Enumerable(lst).order_by(lambda t: t[1]) \
+            .then_by_descending(lambda t: t[2], lambda x, y: (x > y) - (x < y)) \
+            .then_by_descending(lambda t: t[0])
+        assert q2.to_list() == sorted(lst, key=lambda t: (t[1], -t[2], -t[0]))
+
+    def test_lt_only_keys(self):
+        class Key:
+            # ordered by v. == is the default identity comparison
+            def __init__(self, v: int):
+                self.v = v
+            def __lt__(self, other: 'Key') -> bool:
+                return self.v < other.v
+        lst = [(i % 3, i % 4) for i in range(24)]
+        q = Enumerable(lst).order_by(lambda t: Key(t[0])) \
+            .then_by(lambda t: Key(t[1]))
+        assert q.to_list() == sorted(lst)
+        q2 = Enumerable(lst).order_by(lambda t: Key(t[0])) \
+            .then_by_descending(lambda t: Key(t[1]))
+        assert q2.to_list() == sorted(lst, key=lambda t: (t[0], -t[1]))
+        q3 = Enumerable(lst).order_by_descending(lambda t: Key(t[0])) \
+            .then_by(lambda t: Key(t[1]))
+        assert q3.to_list() == sorted(lst, key=lambda t: (-t[0], t[1]))
+
+    def test_stable(self):
+        lst = [(i % 2, i % 3, i) for i in range(20)]
+        q = Enumerable(lst).order_by_descending(lambda t: t[0]) \
+            .then_by_descending(lambda t: t[1])
+        assert q.to_list() == sorted(lst, key=lambda t: (-t[0], -t[1]))
+        q2 = Enumerable(lst).order_by(lambda t: t[0], lambda x, y: x - y)
+        assert q2.to_list() == sorted(lst, key=lambda t: t[0])
+
+
 class TestToLookupMethod:
     food: List[Tuple[str, str]] = [
         ('main', 'ramen'), ('main', 'noodles'), ('side', 'chicken'),
@@ -1674,6 +2265,16 @@ class TestZipMethod:
         zipped = en.zip(Enumerable(other_lst).append('u').append('v'))
         assert zipped.to_list() == [(1, 'x'), (2, 'y'), (3, 'z'), (4, 't'), (5, 'u')]
 
+    def test_sequence_view(self):
+        en = Enumerable([1, 2, 3]).zip('abcd', (True, False, True))
+        assert len(en) == 3
+        assert en[1] == (2, 'b', False)
+        assert en.to_list() == [(1, 'a', True), (2, 'b', False), (3, 'c', True)]
+
+    def test_sequence_and_generator(self):
+        en = Enumerable([1, 2, 3]).zip(x for x in 'ab')
+        assert en.to_list() == [(1, 'a'), (2, 'b')]
+
 
 class TestElementsInMethod:
     def test_overload1(self):
@@ -1793,6 +2394,30 @@ class TestElementsInMethod:
         q = Enumerable(gen).elements_in(slicing)
         assert q.to_list() == expected
 
+    @pytest.mark.parametrize('length', [0, 1, 5, 12])
+    @pytest.mark.parametrize('step', [None, 1, 2, 5, -1, -2, -5])
+    def test_all_bounds(self, length: int, step: Optional[int]):
+        bounds = [None, -14, -6, -2, -1, 0, 1, 3, 7, 14]
+        gen = lambda: (i for i in range(length))
+        for start in bounds:
+            for stop in bounds:
+                slicing = slice(start, stop, step)
+                q = Enumerable(gen).elements_in(slicing)
+                assert q.to_list() == [*range(length)][slicing]
+
+    def test_reiterable(self):
+        gen = lambda: (i for i in range(10))
+        for q in (Enumerable(gen)[2:5], Enumerable(gen).select(lambda x: x)[-3:],
+                Enumerable(gen).elements_in(slice(1, 8, 3))):
+            first = q.to_list()
+            assert first and q.to_list() == first
+
+    def test_zero_step(self):
+        gen = lambda: (i for i in range(5))
+        q = Enumerable(gen).elements_in(slice(None, None, 0))
+        with pytest.raises(ValueError):
+            q.to_list()
+
     def test_fallback(self):
         en = Enumerable(TestElementAtMethod.OnlyHasGetItem(['x']))
         assert en[:7].to_list() == ['h', 'a', 'h', 'a']
@@ -1,9 +1,11 @@
 from .enumerable import Enumerable
+from .join_strategy import JoinStrategy
 from .types_linq_error import TypesLinqError, InvalidOperationError, IndexOutOfRangeError
 
 
 __all__ = [
     'Enumerable',
+    'JoinStrategy',
     'TypesLinqError',
     'InvalidOperationError',
     'IndexOutOfRangeError',
@@ -0,0 +1,344 @@
+from __future__ import annotations
+import asyncio
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Deque, Dict, Generic, Iterable, List, Set, TYPE_CHECKING, Tuple, Union
+
+if TYPE_CHECKING:
+    from .lookup import Lookup
+
+from .enumerable import Enumerable
+from .types_linq_error import InvalidOperationError
+from .util import ComposeSet, identity, return_second
+
+from .more_typing import (
+    TKey,
+    TResult,
+    TSource_co,
+    TValue,
+)
+
+
+class AsyncEnumerable(AsyncIterable[TSource_co], Generic[TSource_co]):
+
+    _iter_factory: Callable[[], Union[AsyncIterable[TSource_co], Iterable[TSource_co]]]
+
+    def __init__(self,
+        it: Union[
+            AsyncIterable[TSource_co],
+            Iterable[TSource_co],
+            Callable[[], Union[AsyncIterable[TSource_co], Iterable[TSource_co]]],
+        ],
+    ):
+        if isinstance(it, (AsyncIterable, Iterable)):
+            self._iter_factory = lambda it_=it: it_
+        else:
+            self._iter_factory = lambda it_=it: it_()
+
+    def _get_iterable(self) -> Union[AsyncIterable[TSource_co], Iterable[TSource_co]]:
+        return self._iter_factory()
+
+    def __aiter__(self) -> AsyncIterator[TSource_co]:
+        iterable = self._get_iterable()
+        if isinstance(iterable, AsyncIterable):
+            return iterable.__aiter__()
+        return _from_iterable(iterable)
+
+    async def aggregate(self, *args) -> Any:
+        if len(args) == 3:
+            seed, func, result_selector = args
+            async for elem in self:
+                seed = func(seed, elem)
+            return result_selector(seed)
+
+        elif len(args) == 2:
+            seed, func = args
+            async for elem in self:
+                seed = func(seed, elem)
+            return seed
+
+        else:  # len(args) == 1
+            func = args[0]
+            iterator = self.__aiter__()
+            try:
+                seed = await iterator.__anext__()
+            except StopAsyncIteration:
+                Enumerable._raise_empty_sequence()
+            async for elem in iterator:
+                seed = func(seed, elem)
+            return seed
+
+    async def all(self, predicate: Callable[[TSource_co], bool]) -> bool:
+        async for elem in self:
+            if not predicate(elem):
+                return False
+        return True
+
+    async def any(self, *args: Callable[[TSource_co], bool]) -> bool:
+        if len(args) == 0:
+            async for _ in self:
+                return True
+            return False
+
+        else:  # len(args) == 1
+            predicate = args[0]
+            async for elem in self:
+                if predicate(elem):
+                    return True
+            return False
+
+    def chunk(self, size: int) -> AsyncEnumerable[List[TSource_co]]:
+        if size < 1:
+            raise InvalidOperationError('size must be greater than 0')
+        async def inner():
+            lst: List[Any] = []
+            async for elem in self:
+                lst.append(elem)
+                if len(lst) == size:
+                    yield lst
+                    lst = []
+            if lst:
+                yield lst
+        return AsyncEnumerable(inner)
+
+    def concat(self,
+        second: Union[AsyncIterable[TSource_co], Iterable[TSource_co]],
+    ) -> AsyncEnumerable[TSource_co]:
+        async def inner():
+            async for elem in self:
+                yield elem
+            async for elem in AsyncEnumerable(second):
+                yield elem
+        return AsyncEnumerable(inner)
+
+    async def contains(self, value: object) -> bool:
+        async for elem in self:
+            if elem == value:
+                return True
+        return False
+
+    async def count(self, *args: Callable[[TSource_co], bool]) -> int:
+        if len(args) == 0:
+            predicate: Callable[[TSource_co], bool] = lambda _: True
+        else:  # len(args) == 1
+            predicate = args[0]
+        count = 0
+        async for elem in self:
+            if predicate(elem):
+                count += 1
+        return count
+
+    def distinct(self) -> AsyncEnumerable[TSource_co]:
+        async def inner():
+            s = ComposeSet()
+            async for elem in self:
+                if s.try_add(elem):
+                    yield elem
+        return AsyncEnumerable(inner)
+
+    async def first(self, *args: Callable[[TSource_co], bool]) -> TSource_co:
+        if len(args) == 0:
+            async for elem in self:
+                return elem
+            Enumerable._raise_empty_sequence()
+
+        else:  # len(args) == 1
+            predicate = args[0]
+            async for elem in self:
+                if predicate(elem):
+                    return elem
+            Enumerable._raise_no_such_element()
+
+    async def first2(self, *args) -> Any:
+        if len(args) == 1:
+            predicate: Callable[[TSource_co], bool] = lambda _: True
+            default = args[0]
+        else:  # len(args) == 2
+            predicate, default = args
+        async for elem in self:
+            if predicate(elem):
+                return elem
+        return default
+
+    def group_by(self, *args) -> AsyncEnumerable[Any]:
+        # grouping needs the whole sequence. the groups are formed by the synchronous version
+        async def inner():
+            for elem in Enumerable(await self.to_list()).group_by(*args):
+                yield elem
+        return AsyncEnumerable(inner)
+
+    def group_by2(self, *args) -> AsyncEnumerable[Any]:
+        async def inner():
+            for elem in Enumerable(await self.to_list()).group_by2(*args):
+                yield elem
+        return AsyncEnumerable(inner)
+
+    def select(self, selector: Callable[[TSource_co], TResult]) -> AsyncEnumerable[TResult]:
+        async def inner():
+            async for elem in self:
+                yield selector(elem)
+        return AsyncEnumerable(inner)
+
+    def select2(self, selector: Callable[[TSource_co, int], TResult]) -> AsyncEnumerable[TResult]:
+        async def inner():
+            i = 0
+            async for elem in self:
+                yield selector(elem, i)
+                i += 1
+        return AsyncEnumerable(inner)
+
+    def select_async(self,
+        selector: Callable[[TSource_co], Awaitable[TResult]],
+        *,
+        max_concurrency: int = 1,
+    ) -> AsyncEnumerable[TResult]:
+        if max_concurrency < 1:
+            raise InvalidOperationError('max_concurrency must be greater than 0')
+        async def inner():
+            async for _, res in _map_async(self, selector, max_concurrency):
+                yield res
+        return AsyncEnumerable(inner)
+
+    def select_many(self,
+        collection_selector: Callable[[TSource_co], Union[AsyncIterable[Any], Iterable[Any]]],
+        *args: Callable[[TSource_co, Any], TResult],
+    ) -> AsyncEnumerable[Any]:
+        if len(args) == 0:
+            result_selector: Any = return_second
+        else:  # len(args) == 1
+            result_selector = args[0]
+        async def inner():
+            async for elem in self:
+                async for sub in AsyncEnumerable(collection_selector(elem)):
+                    yield result_selector(elem, sub)
+        return AsyncEnumerable(inner)
+
+    def skip(self, count: int) -> AsyncEnumerable[TSource_co]:
+        async def inner():
+            i = 0
+            async for elem in self:
+                if i >= count:
+                    yield elem
+                else:
+                    i += 1
+        return AsyncEnumerable(inner)
+
+    def skip_while(self, predicate: Callable[[TSource_co], bool]) -> AsyncEnumerable[TSource_co]:
+        async def inner():
+            skipping = True
+            async for elem in self:
+                if skipping and predicate(elem):
+                    continue
+                skipping = False
+                yield elem
+        return AsyncEnumerable(inner)
+
+    async def sum(self, *args) -> Any:
+        if len(args) == 0:
+            selector: Any = identity
+        else:  # len(args) == 1
+            selector = args[0]
+        iterator = self.__aiter__()
+        try:
+            sum_ = selector(await iterator.__anext__())
+        except StopAsyncIteration:
+            return 0
+        async for elem in iterator:
+            sum_ += selector(elem)
+        return sum_
+
+    def take(self, count: int) -> AsyncEnumerable[TSource_co]:
+        async def inner():
+            if count <= 0:
+                return
+            i = 0
+            async for elem in self:
+                yield elem
+                i += 1
+                if i == count:
+                    break
+        return AsyncEnumerable(inner)
+
+    def take_while(self, predicate: Callable[[TSource_co], bool]) -> AsyncEnumerable[TSource_co]:
+        async def inner():
+            async for elem in self:
+                if not predicate(elem):
+                    break
+                yield elem
+        return AsyncEnumerable(inner)
+
+    async def to_dict(self,
+        key_selector: Callable[[TSource_co], TKey],
+        *args: Callable[[TSource_co], TValue],
+    ) -> Union[Dict[TKey, TValue], Dict[TKey, TSource_co]]:
+        if len(args) == 0:
+            value_selector: Any = identity
+        else:  # len(args) == 1
+            value_selector = args[0]
+        return {key_selector(e): value_selector(e) async for e in self}
+
+    async def to_list(self) -> List[TSource_co]:
+        return [e async for e in self]
+
+    async def to_lookup(self,
+        key_selector: Callable[[TSource_co], TKey],
+        *args: Callable[[TSource_co], TValue],
+    ) -> Union[Lookup[TKey, TValue], Lookup[TKey, TSource_co]]:
+        return Enumerable(await self.to_list()).to_lookup(key_selector, *args)
+
+    async def to_set(self) -> Set[TSource_co]:
+        return {e async for e in self}
+
+    def where(self, predicate: Callable[[TSource_co], bool]) -> AsyncEnumerable[TSource_co]:
+        async def inner():
+            async for elem in self:
+                if predicate(elem):
+                    yield elem
+        return AsyncEnumerable(inner)
+
+    def where2(self, predicate: Callable[[TSource_co, int], bool]) -> AsyncEnumerable[TSource_co]:
+        async def inner():
+            i = 0
+            async for elem in self:
+                if predicate(elem, i):
+                    yield elem
+                i += 1
+        return AsyncEnumerable(inner)
+
+    def where_async(self,
+        predicate: Callable[[TSource_co], Awaitable[bool]],
+        *,
+        max_concurrency: int = 1,
+    ) -> AsyncEnumerable[TSource_co]:
+        if max_concurrency < 1:
+            raise InvalidOperationError('max_concurrency must be greater than 0')
+        async def inner():
+            async for elem, res in _map_async(self, predicate, max_concurrency):
+                if res:
+                    yield elem
+        return AsyncEnumerable(inner)
+
+
+async def _from_iterable(iterable: Iterable[Any]) -> AsyncIterator[Any]:
+    for elem in iterable:
+        yield elem
+
+
+async def _map_async(
+    source: AsyncIterable[Any],
+    func: Callable[[Any], Awaitable[Any]],
+    max_concurrency: int,
+) -> AsyncIterator[Tuple[Any, Any]]:
+    # at most max_concurrency awaitables are running. results are yielded in the source order
+    pending: Deque[Tuple[Any, asyncio.Future[Any]]] = Deque()
+    try:
+        async for elem in source:
+            pending.append((elem, asyncio.ensure_future(func(elem))))
+            if len(pending) >= max_concurrency:
+                elem, future = pending.popleft()
+                yield elem, await future
+        while pending:
+            elem, future = pending.popleft()
+            yield elem, await future
+    finally:
+        # the enumeration is abandoned or an awaitable failed
+        for _, future in pending:
+            future.cancel()
@@ -0,0 +1,384 @@
+from typing import AsyncIterable, AsyncIterator, Awaitable, Callable, Dict, Generic, Iterable, List, Set, Union, overload
+
+from .enumerable import Enumerable
+from .grouping import Grouping
+from .lookup import Lookup
+from .more_typing import (
+    TAccumulate,
+    TCollection,
+    TDefault,
+    TKey,
+    TResult,
+    TSource_co,
+    TSupportsAdd,
+    TValue,
+)
+
+
+class AsyncEnumerable(AsyncIterable[TSource_co], Generic[TSource_co]):
+    '''
+    ```py
+    from types_linq.async_enumerable import AsyncEnumerable
+    ```
+
+    Provides a set of helper methods for querying asynchronous iterables, such as async generators
+    reading paginated data over asyncio. Like `Enumerable`, the queries are deferred: nothing is
+    read from the source until the result is iterated with `async for` or a method returning an
+    awaitable is awaited.
+
+    Synchronous iterables (including `Enumerable`s) are accepted as well, so they can be mixed with
+    asynchronous sources. Methods that need the whole sequence (e.g. `group_by()`) collect it
+    and then use the synchronous implementation.
+
+    Revisions
+        ~ v1.3.0: New.
+    '''
+
+    @overload
+    def __init__(self, __async_iterable: AsyncIterable[TSource_co]) -> None:
+        '''
+        Wraps an async iterable.
+
+        Example
+        ```py
+        >>> async def pages():
+        ...     for page in ([1, 2], [3], [4, 5]):
+        ...         await asyncio.sleep(0)
+        ...         yield page
+
+        >>> query = AsyncEnumerable(pages()).select_many(lambda p: p).where(lambda x: x % 2 == 1)
+        >>> await query.to_list()
+        [1, 3, 5]
+        ```
+        '''
+
+    @overload
+    def __init__(self, __iterable: Iterable[TSource_co]) -> None:
+        '''
+        Wraps a synchronous iterable.
+        '''
+
+    @overload
+    def __init__(self, __iterable_factory: Callable[[], Union[AsyncIterable[TSource_co], Iterable[TSource_co]]]) -> None:
+        '''
+        Wraps an async iterable or a synchronous iterable returned from the factory function. The
+        function is called every time the AsyncEnumerable is iterated, so passing an async
+        generator function makes the result reiterable.
+        '''
+
+    def __aiter__(self) -> AsyncIterator[TSource_co]:
+        '''
+        Returns an async iterator that enumerates the values in the sequence.
+        '''
+
+    @overload
+    async def aggregate(self,
+        __seed: TAccumulate,
+        __func: Callable[[TAccumulate, TSource_co], TAccumulate],
+        __result_selector: Callable[[TAccumulate], TResult],
+    ) -> TResult:
+        '''
+        Applies an accumulator function over the sequence. The seed is used as the initial
+        accumulator value, and the result_selector is used to select the result value.
+        '''
+
+    @overload
+    async def aggregate(self,
+        __seed: TAccumulate,
+        __func: Callable[[TAccumulate, TSource_co], TAccumulate],
+    ) -> TAccumulate:
+        '''
+        Applies an accumulator function over the sequence. The seed is used as the initial
+        accumulator value.
+        '''
+
+    @overload
+    async def aggregate(self,
+        __func: Callable[[TSource_co, TSource_co], TSource_co],
+    ) -> TSource_co:
+        '''
+        Applies an accumulator function over the sequence. Raises `InvalidOperationError` if
+        there is no value in the sequence.
+        '''
+
+    async def all(self, predicate: Callable[[TSource_co], bool]) -> bool:
+        '''
+        Tests whether all elements of the sequence satisfy a condition.
+        '''
+
+    @overload
+    async def any(self) -> bool:
+        '''
+        Tests whether the sequence has any elements.
+        '''
+
+    @overload
+    async def any(self, __predicate: Callable[[TSource_co], bool]) -> bool:
+        '''
+        Tests whether any element of the sequence satisfies a condition.
+        '''
+
+    def chunk(self, size: int) -> AsyncEnumerable[List[TSource_co]]:
+        '''
+        Splits the elements of a sequence into chunks of size at most the provided size. Raises
+        `InvalidOperationError` if `size` is less than 1.
+        '''
+
+    def concat(self, second: Union[AsyncIterable[TSource_co], Iterable[TSource_co]]) -> AsyncEnumerable[TSource_co]:
+        '''
+        Concatenates two sequences. The second sequence may be synchronous or asynchronous.
+        '''
+
+    async def contains(self, value: object) -> bool:
+        '''
+        Tests whether the sequence contains the specified element using `==`.
+        '''
+
+    @overload
+    async def count(self) -> int:
+        '''
+        Returns the number of elements in the sequence.
+        '''
+
+    @overload
+    async def count(self, __predicate: Callable[[TSource_co], bool]) -> int:
+        '''
+        Returns the number of elements that satisfy the condition.
+        '''
+
+    def distinct(self) -> AsyncEnumerable[TSource_co]:
+        '''
+        Returns distinct elements from the sequence.
+        '''
+
+    @overload
+    async def first(self) -> TSource_co:
+        '''
+        Returns the first element of the sequence. Raises `InvalidOperationError` if there is no
+        first element.
+        '''
+
+    @overload
+    async def first(self, __predicate: Callable[[TSource_co], bool]) -> TSource_co:
+        '''
+        Returns the first element of the sequence that satisfies the condition. Raises
+        `InvalidOperationError` if no such element exists.
+        '''
+
+    @overload
+    async def first2(self, __default: TDefault) -> Union[TSource_co, TDefault]:
+        '''
+        Returns the first element of the sequence or a default value if there is no such
+        element.
+        '''
+
+    @overload
+    async def first2(self,
+        __predicate: Callable[[TSource_co], bool],
+        __default: TDefault,
+    ) -> Union[TSource_co, TDefault]:
+        '''
+        Returns the first element of the sequence that satisfies the condition or a default value if
+        no such element exists.
+        '''
+
+    @overload
+    def group_by(self,
+        key_selector: Callable[[TSource_co], TKey],
+        value_selector: Callable[[TSource_co], TValue],
+        __result_selector: Callable[[TKey, Enumerable[TValue]], TResult],
+    ) -> AsyncEnumerable[TResult]:
+        '''
+        Groups the elements of the sequence according to specified key selector and value selector. Then
+        it returns the result value using each grouping and its key.
+        '''
+
+    @overload
+    def group_by(self,
+        key_selector: Callable[[TSource_co], TKey],
+        value_selector: Callable[[TSource_co], TValue],
+    ) -> AsyncEnumerable[Grouping[TKey, TValue]]:
+        '''
+        Groups the elements of the sequence according to specified key selector and value selector.
+        '''
+
+    @overload
+    def group_by2(self,
+        key_selector: Callable[[TSource_co], TKey],
+        __result_selector: Callable[[TKey, Enumerable[TSource_co]], TResult],
+    ) -> AsyncEnumerable[TResult]:
+        '''
+        Groups the elements of the sequence according to a specified key selector function and creates a
+        result value using each grouping and its key.
+        '''
+
+    @overload
+    def group_by2(self,
+        key_selector: Callable[[TSource_co], TKey],
+    ) -> AsyncEnumerable[Grouping[TKey, TSource_co]]:
+        '''
+        Groups the elements of the sequence according to a specified key selector function.
+        '''
+
+    def select(self, selector: Callable[[TSource_co], TResult]) -> AsyncEnumerable[TResult]:
+        '''
+        Projects each element of the sequence into a new form.
+        '''
+
+    def select2(self, selector: Callable[[TSource_co, int], TResult]) -> AsyncEnumerable[TResult]:
+        '''
+        Projects each element of the sequence into a new form by incorporating the indices.
+        '''
+
+    def select_async(self,
+        selector: Callable[[TSource_co], Awaitable[TResult]],
+        *,
+        max_concurrency: int = 1,
+    ) -> AsyncEnumerable[TResult]:
+        '''
+        Projects each element of the sequence into a new form using an async selector (e.g. a
+        coroutine function). Up to max_concurrency awaitables are run concurrently while reading
+        ahead from the source. The results are in the same order as the elements.
+
+        If an awaitable raises an exception, the other pending ones are cancelled.
+
+        Raises `InvalidOperationError` if max_concurrency is less than 1.
+
+        Example
+        ```py
+        >>> async def fetch(id):
+        ...     await asyncio.sleep(0.1)
+        ...     return f'item{id}'
+
+        >>> # takes 0.2 seconds instead of 0.5 seconds
+        >>> await AsyncEnumerable(range(5)).select_async(fetch, max_concurrency=3).to_list()
+        ['item0', 'item1', 'item2', 'item3', 'item4']
+        ```
+        '''
+
+    @overload
+    def select_many(self,
+        collection_selector: Callable[[TSource_co], Union[AsyncIterable[TCollection], Iterable[TCollection]]],
+        __result_selector: Callable[[TSource_co, TCollection], TResult],
+    ) -> AsyncEnumerable[TResult]:
+        '''
+        Projects each element of the sequence into a synchronous or asynchronous iterable, flattens
+        the resulting sequence into one sequence, then calls result_selector on each element therein.
+        '''
+
+    @overload
+    def select_many(self,
+        __selector: Callable[[TSource_co], Union[AsyncIterable[TResult], Iterable[TResult]]],
+    ) -> AsyncEnumerable[TResult]:
+        '''
+        Projects each element of the sequence to a synchronous or asynchronous iterable and flattens
+        the resultant sequences.
+        '''
+
+    def skip(self, count: int) -> AsyncEnumerable[TSource_co]:
+        '''
+        Bypasses a specified number of elements and then returns the remaining elements.
+        '''
+
+    def skip_while(self, predicate: Callable[[TSource_co], bool]) -> AsyncEnumerable[TSource_co]:
+        '''
+        Bypasses elements in the sequence as long as the condition is true and then returns the remaining
+        elements.
+        '''
+
+    @overload
+    async def sum(self: AsyncEnumerable[TSupportsAdd]) -> Union[TSupportsAdd, int]:
+        '''
+        Computes the sum of the sequence, or `0` if the sequence is empty.
+        '''
+
+    @overload
+    async def sum(self, __selector: Callable[[TSource_co], TSupportsAdd]) -> Union[TSupportsAdd, int]:
+        '''
+        Computes the sum of the sequence using the selector. Returns `0` if the sequence is empty.
+        '''
+
+    def take(self, count: int) -> AsyncEnumerable[TSource_co]:
+        '''
+        Returns a specified number of contiguous elements from the start of the sequence. The source
+        is not read beyond the last returned element.
+        '''
+
+    def take_while(self, predicate: Callable[[TSource_co], bool]) -> AsyncEnumerable[TSource_co]:
+        '''
+        Returns elements from the sequence as long as the condition is true and skips the remaining.
+        '''
+
+    @overload
+    async def to_dict(self,
+        key_selector: Callable[[TSource_co], TKey],
+        __value_selector: Callable[[TSource_co], TValue],
+    ) -> Dict[TKey, TValue]:
+        '''
+        Enumerates all values and returns a dict containing them. key_selector and value_selector
+        are used to select keys and values.
+        '''
+
+    @overload
+    async def to_dict(self,
+        key_selector: Callable[[TSource_co], TKey],
+    ) -> Dict[TKey, TSource_co]:
+        '''
+        Enumerates all values and returns a dict containing them. key_selector is used to select
+        keys.
+        '''
+
+    async def to_list(self) -> List[TSource_co]:
+        '''
+        Enumerates all values and returns a list containing them.
+        '''
+
+    @overload
+    async def to_lookup(self,
+        key_selector: Callable[[TSource_co], TKey],
+        __value_selector: Callable[[TSource_co], TValue],
+    ) -> Lookup[TKey, TValue]:
+        '''
+        Enumerates all values and returns a lookup containing them according to specified key
+        selector and value selector.
+        '''
+
+    @overload
+    async def to_lookup(self,
+        key_selector: Callable[[TSource_co], TKey],
+    ) -> Lookup[TKey, TSource_co]:
+        '''
+        Enumerates all values and returns a lookup containing them according to the specified
+        key selector.
+        '''
+
+    async def to_set(self) -> Set[TSource_co]:
+        '''
+        Enumerates all values and returns a set containing them.
+        '''
+
+    def where(self, predicate: Callable[[TSource_co], bool]) -> AsyncEnumerable[TSource_co]:
+        '''
+        Filters the sequence of values based on a predicate.
+        '''
+
+    def where2(self, predicate: Callable[[TSource_co, int], bool]) -> AsyncEnumerable[TSource_co]:
+        '''
+        Filters the sequence of values based on a predicate. Each element's index is used in the
+        predicate logic.
+        '''
+
+    def where_async(self,
+        predicate: Callable[[TSource_co], Awaitable[bool]],
+        *,
+        max_concurrency: int = 1,
+    ) -> AsyncEnumerable[TSource_co]:
+        '''
+        Filters the sequence of values based on an async predicate. Up to max_concurrency
+        awaitables are run concurrently while reading ahead from the source. The order of the
+        elements is preserved.
+
+        If an awaitable raises an exception, the other pending ones are cancelled.
+
+        Raises `InvalidOperationError` if max_concurrency is less than 1.
+        '''
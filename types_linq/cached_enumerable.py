@@ -1,5 +1,11 @@
 from __future__ import annotations
-from typing import Dict, Iterable, Iterator, Optional
+from array import array
+from collections import deque
+import pickle
+import sys
+import tempfile
+import threading
+from typing import IO, Any, Callable, Deque, Iterable, Iterator, List, Optional
 
 from .enumerable import Enumerable
 from .types_linq_error import InvalidOperationError
@@ -9,6 +15,10 @@ from .more_typing import (
 )
 
 
+# the maximum number of cached values a thread-safe enumeration copies while holding the lock
+_read_batch_size = 64
+
+
 class CachedEnumerable(Enumerable[TSource_co]):
     '''
     ```py
@@ -17,34 +27,119 @@ class CachedEnumerable(Enumerable[TSource_co]):
 
     Enumerable that stores the enumerated results which can be accessed repeatedly.
 
+    The cache can be limited by the number of values, and by their total size in bytes. Values that
+    no longer fit are evicted oldest first. If spilling is enabled, evicted values are moved to a
+    temporary file instead, so that later enumerations still start from the first value.
+
+    If it is thread-safe, it can be enumerated by multiple threads at the same time. The source is
+    advanced by one thread at a time, and each value is pulled from it only once. Threads reading
+    values that are already cached are not blocked by a thread waiting for the source. A
+    CachedEnumerable that has been made thread-safe stays thread-safe.
+
     Users should not construct instances of this class directly. Use `Enumerable.as_cached()` instead.
 
     Revisions
+        ~ v1.3.0: Added thread-safe mode, the size limit and spilling.
         ~ v0.1.1: New.
     '''
 
-    _iter: Iterator[TSource_co]
+    _iter: Optional[Iterator[TSource_co]]
     _cache_capacity: Optional[int]
-    _enumerated_values: Dict[int, TSource_co]
+    _cache_bytes: Optional[int]
+    _size_selector: Callable[[Any], int]
+    # the values in memory have indices in [_min_index, _tracked). the value with index i is at
+    # _values[(i - _base) % _ring_size] if only the number of values is limited, so that _values
+    # is a ring buffer that grows up to the capacity. otherwise it is at _values[i - _base], and
+    # the evicted values before _min_index are set to None and dropped in bulk
+    _values: List[Any]
+    _ring_size: Optional[int]
+    _base: int
     _min_index: int
     _tracked: int
+    # the sizes of the values in memory, and their sum, if the size is limited
+    _sizes: Deque[int]
+    _total_size: int
+    # the evicted values with indices in [_spill_start, _min_index) are pickled to _spill_file,
+    # starting at _spill_offsets[i - _spill_start]. None if not spilling
+    _spill_file: Optional[IO[bytes]]
+    _spill_offsets: array[int]
+    _spill_start: int
+    # guards the cache, and the lock held while advancing the source. None if not thread-safe
+    _lock: Optional[threading.Lock]
+    _pull_lock: Optional[threading.Lock]
 
-    def __init__(self, source: Iterable[TSource_co], cache_capacity: Optional[int]):
-        if cache_capacity is not None and cache_capacity < 0:
-            raise InvalidOperationError('cache_capacity must be nonnegative')
-        self._iter = iter(source)
-        super().__init__(self._iter)
-        self._cache_capacity = cache_capacity
-        self._enumerated_values = {}
+    def __init__(self,
+        source: Iterable[TSource_co],
+        cache_capacity: Optional[int],
+        thread_safe: bool = False,
+        cache_bytes: Optional[int] = None,
+        size_selector: Optional[Callable[[TSource_co], int]] = None,
+        spill: bool = False,
+        spill_dir: Optional[str] = None,
+    ):
+        self._check_settings(cache_capacity, cache_bytes, spill, spill_dir)
+        super().__init__(source)
+        # the source is not touched until the first enumeration
+        self._iter = None
+        self._cache_capacity = None
+        self._cache_bytes = None
+        self._size_selector = sys.getsizeof
+        self._values = []
+        self._ring_size = None
+        self._base = 0
         self._min_index = 0
         self._tracked = 0
+        self._sizes = deque()
+        self._total_size = 0
+        self._spill_file = None
+        self._spill_offsets = array('q')
+        self._spill_start = 0
+        self._lock = None
+        self._pull_lock = None
+        if thread_safe:
+            self._make_thread_safe()
+        self._configure(cache_capacity, cache_bytes, size_selector, spill, spill_dir)
+
+    @staticmethod
+    def _check_settings(
+        cache_capacity: Optional[int],
+        cache_bytes: Optional[int],
+        spill: bool,
+        spill_dir: Optional[str],
+    ) -> None:
+        if cache_capacity is not None and cache_capacity < 0:
+            raise InvalidOperationError('cache_capacity must be nonnegative')
+        if cache_bytes is not None and cache_bytes < 0:
+            raise InvalidOperationError('cache_bytes must be nonnegative')
+        if spill_dir is not None and not spill:
+            raise InvalidOperationError('spill_dir requires spill')
+
+    def _make_thread_safe(self) -> None:
+        if self._lock is None:
+            # _lock is checked to select the implementation, so it is set last
+            self._pull_lock = threading.Lock()
+            self._lock = threading.Lock()
 
     def _get_iterable(self) -> Iterator[TSource_co]:
+        if self._lock is not None:
+            return self._get_iterable_locked()
+        return self._get_iterable_unlocked()
+
+    def _get_iterable_unlocked(self) -> Iterator[TSource_co]:
+        if self._iter is None:
+            self._iter = iter(super()._get_iterable())
         i = 0
         while True:
             while i < self._tracked and self._cache_capacity != 0:
-                i = max(self._min_index, i)
-                res = self._enumerated_values[i]
+                if i < self._min_index:
+                    i = self._first_available(i)
+                    if i < self._min_index:
+                        res = self._load(i, i + 1)[0]
+                        i += 1
+                        yield res
+                    continue
+                ring_size = self._ring_size
+                res = self._values[i - self._base if ring_size is None else (i - self._base) % ring_size]
                 i += 1
                 yield res
             try:
@@ -54,27 +149,196 @@ class CachedEnumerable(Enumerable[TSource_co]):
             if self._cache_capacity == 0:
                 yield res
                 continue
-            len_ = len(self._enumerated_values)
-            if self._cache_capacity is not None and \
-                len_ > 0 and len_ == self._cache_capacity:
-                del self._enumerated_values[self._min_index]
-                self._min_index += 1
-            self._enumerated_values[self._tracked] = res
-            self._tracked += 1
+            if self._cache_bytes is None and self._spill_file is None:
+                # same as _store(), inlined
+                ring_size = self._ring_size
+                if ring_size is None or len(self._values) < ring_size:
+                    self._values.append(res)
+                else:
+                    self._values[(self._tracked - self._base) % ring_size] = res
+                    self._min_index += 1
+                self._tracked += 1
+            else:
+                self._store(res)
             i += 1
             yield res
 
-    def as_cached(self, *, cache_capacity: Optional[int] = None) -> CachedEnumerable[TSource_co]:
+    def _get_iterable_locked(self) -> Iterator[TSource_co]:
+        lock, pull_lock = self._lock, self._pull_lock
+        assert lock is not None and pull_lock is not None
+        i = 0
+        while True:
+            values = None
+            with lock:
+                if i < self._tracked and self._cache_capacity != 0:
+                    i = self._first_available(i)
+                    stop = min(self._tracked, i + _read_batch_size)
+                    values = self._read(i, stop)
+                    i = stop
+            if values is not None:
+                # the lock is not held while the values are consumed
+                yield from values
+                continue
+            with pull_lock:
+                with lock:
+                    if i < self._tracked and self._cache_capacity != 0:
+                        # another thread has pulled the value while this one was waiting
+                        continue
+                if self._iter is None:
+                    self._iter = iter(super()._get_iterable())
+                try:
+                    res = next(self._iter)
+                except StopIteration:
+                    break
+                with lock:
+                    if self._cache_capacity != 0:
+                        self._store(res)
+                        i += 1
+            yield res
+
+    def _first_available(self, i: int) -> int:
+        # the first index from i whose value is in memory or spilled
+        if self._spill_file is not None:
+            return max(self._spill_start, i)
+        return max(self._min_index, i)
+
+    def _store(self, value: Any) -> None:
+        # the capacity is not 0
+        ring_size = self._ring_size
+        if ring_size is not None and len(self._values) == ring_size:
+            # the ring buffer is full. overwrite the oldest value
+            pos = (self._tracked - self._base) % ring_size
+            if self._spill_file is not None:
+                self._spill(self._values[pos])
+            self._values[pos] = value
+            self._min_index += 1
+            self._tracked += 1
+            return
+        self._values.append(value)
+        self._tracked += 1
+        if self._cache_bytes is not None:
+            size = self._size_selector(value)
+            self._sizes.append(size)
+            self._total_size += size
+        if ring_size is None:
+            self._evict()
+
+    def _evict(self) -> None:
+        # evicts the oldest values until the limits are met. the values are not in a ring buffer
+        cap, cache_bytes = self._cache_capacity, self._cache_bytes
+        while self._min_index < self._tracked and (
+            (cap is not None and self._tracked - self._min_index > cap) or
+            (cache_bytes is not None and self._total_size > cache_bytes)
+        ):
+            pos = self._min_index - self._base
+            if self._spill_file is not None:
+                self._spill(self._values[pos])
+            self._values[pos] = None
+            if cache_bytes is not None:
+                self._total_size -= self._sizes.popleft()
+            self._min_index += 1
+        evicted = self._min_index - self._base
+        if evicted > 0 and evicted * 2 >= len(self._values):
+            del self._values[:evicted]
+            self._base = self._min_index
+
+    def _spill(self, value: Any) -> None:
+        # appends the value at _min_index to the spill file
+        assert self._spill_file is not None
+        self._spill_file.seek(0, 2)
+        self._spill_offsets.append(self._spill_file.tell())
+        pickle.dump(value, self._spill_file, pickle.HIGHEST_PROTOCOL)
+
+    def _load(self, start: int, stop: int) -> List[Any]:
+        # returns the spilled values with indices in [start, stop)
+        assert self._spill_file is not None
+        self._spill_file.seek(self._spill_offsets[start - self._spill_start])
+        return [pickle.load(self._spill_file) for _ in range(stop - start)]
+
+    def _read(self, start: int, stop: int) -> List[Any]:
+        # returns the cached values with indices in [start, stop), which are in memory or spilled
+        res: List[Any] = []
+        if start < self._min_index:
+            res = self._load(start, min(stop, self._min_index))
+            start = self._min_index
+        count = stop - start
+        if count <= 0:
+            return res
+        ring_size = self._ring_size
+        pos = start - self._base if ring_size is None else (start - self._base) % ring_size
+        values = self._values[pos:pos + count]
+        if len(values) < count:
+            # wraps around the ring buffer
+            values += self._values[:count - len(values)]
+        return res + values
+
+    def as_cached(self, *,
+        cache_capacity: Optional[int] = None,
+        thread_safe: bool = False,
+        cache_bytes: Optional[int] = None,
+        size_selector: Optional[Callable[[TSource_co], int]] = None,
+        spill: bool = False,
+        spill_dir: Optional[str] = None,
+    ) -> CachedEnumerable[TSource_co]:
         '''
-        Updates settings and returns the original CachedEnumerable reference.
+        Updates settings and returns the original CachedEnumerable reference. Values that no longer
+        fit are evicted, or spilled if spill is true. Turning spilling off discards the spilled values.
+
+        If thread_safe is true, enumerations started afterwards are thread-safe. Passing false does
+        not make a thread-safe CachedEnumerable unsafe.
 
-        Raises `InvalidOperationError` if cache_capacity is negative.
+        Raises `InvalidOperationError` if cache_capacity or cache_bytes is negative, or if spill_dir
+        is given without spill.
         '''
-        if cache_capacity is not None:
-            if cache_capacity < 0:
-                raise InvalidOperationError('cache_capacity must be nonnegative')
-            while len(self._enumerated_values) > cache_capacity:
-                del self._enumerated_values[self._min_index]
-                self._min_index += 1
-        self._cache_capacity = cache_capacity
+        self._check_settings(cache_capacity, cache_bytes, spill, spill_dir)
+        if thread_safe:
+            self._make_thread_safe()
+        if self._lock is None:
+            self._configure(cache_capacity, cache_bytes, size_selector, spill, spill_dir)
+        else:
+            with self._lock:
+                self._configure(cache_capacity, cache_bytes, size_selector, spill, spill_dir)
         return self
+
+    def _configure(self,
+        cache_capacity: Optional[int],
+        cache_bytes: Optional[int],
+        size_selector: Optional[Callable[[TSource_co], int]],
+        spill: bool,
+        spill_dir: Optional[str],
+    ) -> None:
+        if not spill:
+            if self._spill_file is not None:
+                self._spill_file.close()
+                self._spill_file = None
+                self._spill_offsets = array('q')
+        elif self._spill_file is None:
+            self._spill_file = tempfile.TemporaryFile(dir=spill_dir)
+            self._spill_start = self._min_index
+
+        if size_selector is None:
+            size_selector = sys.getsizeof
+        if cache_capacity == self._cache_capacity and cache_bytes == self._cache_bytes and \
+            size_selector is self._size_selector:
+            return
+
+        # lays the values in memory out again as a plain list, then evicts those that no longer fit
+        values = self._read(self._min_index, self._tracked)
+        self._cache_capacity = cache_capacity
+        self._cache_bytes = cache_bytes
+        self._size_selector = size_selector
+        self._values = values
+        self._ring_size = None
+        self._base = self._min_index
+        if cache_bytes is None:
+            self._sizes = deque()
+            self._total_size = 0
+        else:
+            self._sizes = deque(map(self._size_selector, values))
+            self._total_size = sum(self._sizes)
+        self._evict()
+        if cache_capacity and cache_bytes is None:
+            # the remaining values are at the start of the ring buffer
+            del self._values[:self._min_index - self._base]
+            self._base = self._min_index
+            self._ring_size = cache_capacity
@@ -1,5 +1,6 @@
 from __future__ import annotations
-from typing import Any, Callable, Container, Deque, Dict, Iterable, Iterator, List, MutableSequence, NoReturn, Optional, Reversible, Sequence, Set, Sized, TYPE_CHECKING, Tuple, Type, Generic, Union
+from concurrent.futures import Executor
+from typing import Any, Callable, Container, Dict, Iterable, Iterator, List, MutableSequence, NoReturn, Optional, Reversible, Sequence, Set, Sized, TYPE_CHECKING, Tuple, Type, Generic, Union
 
 if TYPE_CHECKING:
     from .lookup import Lookup
@@ -7,17 +8,25 @@ if TYPE_CHECKING:
     from .ordered_enumerable import OrderedEnumerable
     from .cached_enumerable import CachedEnumerable
     from .more import MoreEnumerable
+    from .numeric_enumerable import NumericEnumerable
+    from .parallel_enumerable import ParallelEnumerable
+    from .stats import Stats
 
+from .join_strategy import JoinStrategy
 from .types_linq_error import InvalidOperationError, IndexOutOfRangeError
 from .util import (
+    batches,
+    ComposeMap,
     ComposeSet,
     default_equal,
     default_gt,
     default_lt,
     identity,
+    lazy_slice,
     return_second,
 )
 from .more_typing import (
+    TAccumulate,
     TCollection,
     TDefault,
     TInner,
@@ -35,12 +44,15 @@ _signal: Any = object()
 class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
 
     _iter_factory: Callable[[], Iterable[TSource_co]]
+    # whether the factory returns a given iterable, so that obtaining it runs no query work
+    _has_iterable = False
 
     def __init__(self,
         it: Union[Iterable[TSource_co], Callable[[], Iterable[TSource_co]]]
     ):
         if isinstance(it, Iterable):
             self._iter_factory = lambda it_=it: it_
+            self._has_iterable = True
         else:
             self._iter_factory = lambda it_=it: it_()
 
@@ -66,8 +78,9 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
     def _raise_not_enough_elements() -> NoReturn:
         raise IndexOutOfRangeError('Not enough elements in the sequence')
 
-    def _every(self, step: int) -> Enumerable[TSource_co]:
-        return self.where2(lambda _, i: i % step == 0)
+    def _fuse(self, kind: str, arg: Any) -> Any:
+        from .fused_enumerable import FusedEnumerable
+        return FusedEnumerable(self, ((kind, arg),))  # type: ignore
 
     def _getitem_impl(self,
         index: Union[int, slice],
@@ -104,33 +117,9 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
                 except IndexError as e:
                     raise IndexOutOfRangeError from e
                 return res if isinstance(res, Enumerable) else Enumerable(res)
-            # we do not enumerate all values if the begin and the end only involve
-            # nonnegative indices since in which case the sliced part can be obtained
-            # without reversing.
-            # otherwise have to enumerate all with using list's slice operator.
-            # (don't enumerate right away in this function, of course)
-            def inner(s: slice = index):
-                en = iterable if isinstance(iterable, Enumerable) else Enumerable(iterable)
-                start_is_none = s.start is None
-                stop_is_none = s.stop is None
-                step = s.step if s.step is not None else 1
-                if (start_is_none and stop_is_none) or (not start_is_none and s.start < 0) \
-                    or (not stop_is_none and s.stop < 0) or (stop_is_none):
-                    yield from en.to_list()[s]
-                    return
-                elif start_is_none:
-                    if step > 0:
-                        yield from en.take(s.stop)._every(step)
-                    else:
-                        yield from en.skip(s.stop + 1).reverse()._every(-step)
-                    return
-                elif s.start <= s.stop and step > 0:
-                    yield from en.skip(s.start).take(s.stop - s.start)._every(step)
-                    return
-                elif step <= 0:
-                    yield from en.skip(s.stop + 1).take(s.start - s.stop) \
-                        .reverse()._every(-step)
-            return Enumerable(inner)
+            # the elements are buffered only as far as the negative bounds require. the iterable
+            # is obtained again for each enumeration, since it may be a one-shot iterator
+            return Enumerable(lambda: lazy_slice(self._get_iterable(), index))
 
     def __getitem__(self,  # type: ignore[override]
         index: Union[int, slice, Tuple[int, TDefault]],
@@ -196,6 +185,39 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
                 seed = func(seed, elem)
             return seed
 
+    def aggregate_by(self,
+        key_selector: Callable[[TSource_co], TKey],
+        seed: TAccumulate,
+        func: Callable[[TAccumulate, TSource_co], TAccumulate],
+    ) -> Enumerable[Tuple[TKey, TAccumulate]]:
+        return self.aggregate_by2(key_selector, lambda _: seed, func)
+
+    def aggregate_by2(self,
+        key_selector: Callable[[TSource_co], TKey],
+        seed_selector: Callable[[TKey], TAccumulate],
+        func: Callable[[TAccumulate, TSource_co], TAccumulate],
+    ) -> Enumerable[Tuple[TKey, TAccumulate]]:
+        def inner():
+            # only one accumulator per key is kept
+            accumulators: ComposeMap[TKey, TAccumulate] = ComposeMap()
+            for elem in self:
+                key = key_selector(elem)
+                acc = accumulators.get(key, _signal)
+                if acc is _signal:
+                    acc = seed_selector(key)
+                accumulators[key] = func(acc, elem)
+            yield from accumulators.items()
+        return Enumerable(inner)
+
+    def aggregate_many(self, *reducers: Tuple[Any, Callable[[Any, TSource_co], Any]]) -> Tuple[Any, ...]:
+        accumulators = [seed for seed, _ in reducers]
+        funcs = [(i, func) for i, (_, func) in enumerate(reducers)]
+        for elem in self:
+            # updated in place, without a new list per element
+            for i, func in funcs:
+                accumulators[i] = func(accumulators[i], elem)
+        return tuple(accumulators)
+
     def all(self, predicate: Callable[[TSource_co], bool]) -> bool:
         for elem in self:
             if not predicate(elem):
@@ -217,19 +239,37 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
 
     def append(self, element: TSource_co) -> Enumerable[TSource_co]:  # type: ignore
         # this method does not mutate the current container
-        def inner():
-            yield from self
-            yield element
-        return Enumerable(inner)
-
-    def as_cached(self, *, cache_capacity: Optional[int] = None) -> CachedEnumerable[TSource_co]:
+        return self._fuse('append', element)
+
+    def as_cached(self, *,
+        cache_capacity: Optional[int] = None,
+        thread_safe: bool = False,
+        cache_bytes: Optional[int] = None,
+        size_selector: Optional[Callable[[TSource_co], int]] = None,
+        spill: bool = False,
+        spill_dir: Optional[str] = None,
+    ) -> CachedEnumerable[TSource_co]:
         from .cached_enumerable import CachedEnumerable
-        return CachedEnumerable(self, cache_capacity)
+        return CachedEnumerable(
+            self, cache_capacity, thread_safe, cache_bytes, size_selector, spill, spill_dir,
+        )
 
     def as_more(self) -> MoreEnumerable[TSource_co]:
         from .more import MoreEnumerable
         return MoreEnumerable(self)
 
+    def as_numeric(self) -> NumericEnumerable[TSource_co]:
+        from .numeric_enumerable import NumericEnumerable
+        return NumericEnumerable(self._get_iterable)
+
+    def as_parallel(self, *,
+        executor: Optional[Executor] = None,
+        chunk_size: int = 1024,
+        ordered: bool = True,
+    ) -> ParallelEnumerable[TSource_co]:
+        from .parallel_enumerable import ParallelEnumerable
+        return ParallelEnumerable(self, (), executor, chunk_size, ordered)
+
     def _average_helper(self, selector, when_empty):
         count = 0
         iterator = iter(self)
@@ -265,27 +305,10 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
     def chunk(self, size: int) -> Enumerable[MutableSequence[TSource_co]]:
         if size < 1:
             raise InvalidOperationError('size must be greater than 0')
-        def inner():
-            lst: List[Any] = [1] * size
-            i = 0
-            for elem in self:
-                lst[i] = elem
-                if i == size - 1:
-                    yield lst
-                    i = 0
-                    lst = [1] * size
-                else:
-                    i += 1
-            if i > 0:
-                del lst[i:]
-                yield lst
-        return Enumerable(inner)
+        return Enumerable(lambda: batches(self, size))
 
     def concat(self, second: Iterable[TSource_co]) -> Enumerable[TSource_co]:
-        def inner():
-            yield from self
-            yield from second
-        return Enumerable(inner)
+        return self._fuse('concat', second)
 
     def contains(self, value: object, *args: Callable[..., bool]):
         if len(args) == 0:
@@ -310,6 +333,15 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
                     count += 1
             return count
 
+    def count_by(self, key_selector: Callable[[TSource_co], TKey]) -> Enumerable[Tuple[TKey, int]]:
+        def inner():
+            counts: ComposeMap[TKey, int] = ComposeMap()
+            for elem in self:
+                key = key_selector(elem)
+                counts[key] = counts.get(key, 0) + 1
+            yield from counts.items()
+        return Enumerable(inner)
+
     def default_if_empty(self,
         default: TDefault,
     ) -> Union[Enumerable[TSource_co], Enumerable[TDefault]]:
@@ -354,12 +386,15 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
             s = ComposeSet(second)
             for elem in self:
                 key = key_selector(elem)
-                if key in s:
-                    continue
-                s.add(key)
-                yield elem
+                if s.try_add(key):
+                    yield elem
         return Enumerable(inner)
 
+    def every(self, step: int) -> Enumerable[TSource_co]:
+        if step < 1:
+            raise InvalidOperationError('step must be greater than 0')
+        return self._fuse('every', step)
+
     @staticmethod
     def _raise_no_such_element() -> NoReturn:
         raise InvalidOperationError('No element satisfying condition')
@@ -393,12 +428,56 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
                     return elem
             return default
 
-    def group_by(self,
+    def full_outer_join(self,
+        inner: Iterable[TInner],
+        outer_key_selector: Callable[[TSource_co], TKey],
+        inner_key_selector: Callable[[TInner], TKey],
+        result_selector: Callable[[Optional[TSource_co], Optional[TInner]], TResult],
+        *,
+        strategy: JoinStrategy = JoinStrategy.auto,
+    ) -> Enumerable[TResult]:
+        from .join_planner import join_groups, missing
+        def inner_gen():
+            groups = join_groups(self, inner, outer_key_selector, inner_key_selector,
+                strategy, True, True)
+            for outer_item, group in groups:
+                if outer_item is missing:
+                    for inner_item in group:
+                        yield result_selector(None, inner_item)
+                    continue
+                matched = False
+                for inner_item in group:
+                    matched = True
+                    yield result_selector(outer_item, inner_item)
+                if not matched:
+                    yield result_selector(outer_item, None)
+        return Enumerable(inner_gen)
+
+    def _group_by_impl(self,
         key_selector: Callable[[TSource_co], TKey],
         value_selector: Callable[[TSource_co], TValue],
-        *args: Callable[[TKey, Enumerable[TValue]], TResult],
+        args: Tuple[Callable[[TKey, Enumerable[TValue]], TResult], ...],
+        spill_threshold: Optional[int],
+        spill_dir: Optional[str],
     ) -> Union[Enumerable[TResult], Enumerable[Grouping[TKey, TValue]]]:
         from .lookup import Lookup
+        if spill_threshold is not None:
+            if spill_threshold < 1:
+                raise InvalidOperationError('spill_threshold must be greater than 0')
+            from .spill import spilled_groupings
+            groupings = lambda: spilled_groupings(self, key_selector, value_selector,
+                spill_threshold, spill_dir)  # type: ignore
+            if len(args) == 1:
+                result_selector = args[0]
+                def inner_gen():
+                    for grouping in groupings():
+                        yield result_selector(grouping.key, grouping)  # type: ignore
+                return Enumerable(inner_gen)
+            else:  # len(args) == 0:
+                return Enumerable(groupings)
+
+        if spill_dir is not None:
+            raise InvalidOperationError('spill_dir requires spill_threshold')
         if len(args) == 1:
             result_selector = args[0]
             inner = lambda: Lookup(self, key_selector, value_selector) \
@@ -408,31 +487,38 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
             inner = lambda: Lookup(self, key_selector, value_selector)
             return Enumerable(inner)
 
+    def group_by(self,
+        key_selector: Callable[[TSource_co], TKey],
+        value_selector: Callable[[TSource_co], TValue],
+        *args: Callable[[TKey, Enumerable[TValue]], TResult],
+        spill_threshold: Optional[int] = None,
+        spill_dir: Optional[str] = None,
+    ) -> Union[Enumerable[TResult], Enumerable[Grouping[TKey, TValue]]]:
+        return self._group_by_impl(key_selector, value_selector, args, spill_threshold, spill_dir)
+
     def group_by2(self,
         key_selector: Callable[[TSource_co], TKey],
         *args: Callable[[TKey, Enumerable[TSource_co]], TResult],
+        spill_threshold: Optional[int] = None,
+        spill_dir: Optional[str] = None,
     ) -> Union[Enumerable[TResult], Enumerable[Grouping[TKey, TSource_co]]]:
-        from .lookup import Lookup
-        if len(args) == 1:
-            result_selector = args[0]
-            inner = lambda: Lookup(self, key_selector, identity) \
-                .apply_result_selector(result_selector)  # type: ignore
-            return Enumerable(inner)
-        else:  # len(args) == 0:
-            inner = lambda: Lookup(self, key_selector, identity)
-            return Enumerable(inner)
+        return self._group_by_impl(key_selector, identity, args, spill_threshold, spill_dir)
 
     def group_join(self,
         inner: Iterable[TInner],
         outer_key_selector: Callable[[TSource_co], TKey],
         inner_key_selector: Callable[[TInner], TKey],
         result_selector: Callable[[TSource_co, Enumerable[TInner]], TResult],
+        *,
+        strategy: JoinStrategy = JoinStrategy.auto,
     ) -> Enumerable[TResult]:
-        from .lookup import Lookup
+        from .join_planner import join_groups
+        if strategy == JoinStrategy.hash_outer:
+            raise InvalidOperationError('group_join() does not support JoinStrategy.hash_outer')
         def inner_gen():
-            lookup = Lookup(inner, inner_key_selector, identity)
-            for outer_item in self:
-                group = lookup[outer_key_selector(outer_item)]
+            groups = join_groups(self, inner, outer_key_selector, inner_key_selector,
+                strategy, False, False)
+            for outer_item, group in groups:
                 yield result_selector(outer_item, group)  # type: ignore
         return Enumerable(inner_gen)
 
@@ -458,12 +544,15 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
         outer_key_selector: Callable[[TSource_co], TKey],
         inner_key_selector: Callable[[TInner], TKey],
         result_selector: Callable[[TSource_co, TInner], TResult],
+        *,
+        strategy: JoinStrategy = JoinStrategy.auto,
     ) -> Enumerable[TResult]:
-        from .lookup import Lookup
+        from .join_planner import join_groups
         def inner_gen():
-            lookup = Lookup(inner, inner_key_selector, identity)
-            for outer_item in self:
-                for inner_item in lookup[outer_key_selector(outer_item)]:
+            groups = join_groups(self, inner, outer_key_selector, inner_key_selector,
+                strategy, False, False)
+            for outer_item, group in groups:
+                for inner_item in group:
                     yield result_selector(outer_item, inner_item)
         return Enumerable(inner_gen)
 
@@ -497,6 +586,27 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
                     default = elem
         return default
 
+    def left_join(self,
+        inner: Iterable[TInner],
+        outer_key_selector: Callable[[TSource_co], TKey],
+        inner_key_selector: Callable[[TInner], TKey],
+        result_selector: Callable[[TSource_co, Optional[TInner]], TResult],
+        *,
+        strategy: JoinStrategy = JoinStrategy.auto,
+    ) -> Enumerable[TResult]:
+        from .join_planner import join_groups
+        def inner_gen():
+            groups = join_groups(self, inner, outer_key_selector, inner_key_selector,
+                strategy, True, False)
+            for outer_item, group in groups:
+                matched = False
+                for inner_item in group:
+                    matched = True
+                    yield result_selector(outer_item, inner_item)
+                if not matched:
+                    yield result_selector(outer_item, None)
+        return Enumerable(inner_gen)
+
     def _minmax_helper(self, result_selector, op, when_empty) -> Any:
         iterator = iter(self)
         try:
@@ -594,6 +704,7 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
     def order_by(self,
         key_selector: Callable[[TSource_co], TKey],
         *args: Callable[[TKey, TKey], int],
+        lazy: bool = False,
     ) -> OrderedEnumerable[TSource_co, TKey]:
         from .ordered_enumerable import OrderedEnumerable
         if len(args) == 1:
@@ -606,11 +717,13 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
             key_selector,
             comparer,
             False,
+            lazy,
         )
 
     def order_by_descending(self,
         key_selector: Callable[[TSource_co], TKey],
         *args: Callable[[TKey, TKey], int],
+        lazy: bool = False,
     ) -> OrderedEnumerable[TSource_co, TKey]:
         from .ordered_enumerable import OrderedEnumerable
         if len(args) == 1:
@@ -623,14 +736,12 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
             key_selector,
             comparer,
             True,
+            lazy,
         )
 
     def prepend(self, element: TSource_co) -> Enumerable[TSource_co]:  # type: ignore
         # see self.append()
-        def inner():
-            yield element
-            yield from self
-        return Enumerable(inner)
+        return self._fuse('prepend', element)
 
     @staticmethod
     def _raise_count_negative() -> NoReturn:
@@ -669,28 +780,32 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
         return Enumerable(inner)
 
     def reverse(self) -> Enumerable[TSource_co]:
-        return Enumerable(lambda: self._reversed_impl(fallback=True))
+        return self._fuse('reverse', None)
 
     def select(self, selector: Callable[[TSource_co], TResult]) -> Enumerable[TResult]:
-        def inner():
-            for elem in self:
-                yield selector(elem)
-        return Enumerable(inner)
+        return self._fuse('select', selector)
 
     def select2(self, selector: Callable[[TSource_co, int], TResult]) -> Enumerable[TResult]:
-        def inner():
-            for i, elem in enumerate(self):
-                yield selector(elem, i)
-        return Enumerable(inner)
+        return self._fuse('select2', selector)
+
+    def select_batch(self,
+        selector: Callable[[List[TSource_co]], Iterable[TResult]],
+        *,
+        batch_size: int = 1024,
+    ) -> Enumerable[TResult]:
+        if batch_size < 1:
+            raise InvalidOperationError('batch_size must be greater than 0')
+        return self._fuse('select_batch', (selector, batch_size))
 
     def select_many(self,
         collection_selector: Callable[[TSource_co], Iterable[TCollection]],
         *args: Callable[[TSource_co, TCollection], TResult],
     ) -> Union[Enumerable[TCollection], Enumerable[TResult]]:
         if len(args) == 0:
-            result_selector: Any = return_second
+            return self._fuse('select_many', collection_selector)
         else:  # len(args) == 1
             result_selector = args[0]
+        # pairing each element with its subelements costs more in builtin iterators than here
         def inner():
             for elem in self:
                 for sub in collection_selector(elem):
@@ -784,44 +899,15 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
 
 
     def skip(self, count: int) -> Enumerable[TSource_co]:
-        def inner():
-            iterator = iter(self)
-            try:
-                for _ in range(count):
-                    next(iterator)
-            except StopIteration:
-                return
-            yield from iterator
-        return Enumerable(inner)
+        return self._fuse('slice', (max(count, 0), None))
 
     def skip_last(self, count: int) -> Enumerable[TSource_co]:
         if count <= 0:
             return self.skip(0)
-        def inner():
-            iterator = iter(self)
-            q = Deque()
-            for elem in iterator:
-                if len(q) == count:
-                    while True:
-                        yield q.pop()
-                        q.appendleft(elem)
-                        try:
-                            elem = next(iterator)
-                        except StopIteration:
-                            break
-                else:
-                    q.appendleft(elem)
-        return Enumerable(inner)
+        return self._fuse('skip_last', count)
 
     def skip_while(self, predicate: Callable[[TSource_co], bool]) -> Enumerable[TSource_co]:
-        def inner():
-            iterator = iter(self)
-            for elem in iterator:
-                if not predicate(elem):
-                    yield elem
-                    break
-            yield from iterator
-        return Enumerable(inner)
+        return self._fuse('skip_while', predicate)
 
     def skip_while2(self, predicate: Callable[[TSource_co, int], bool]) -> Enumerable[TSource_co]:
         def inner():
@@ -833,6 +919,28 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
             yield from iterator
         return Enumerable(inner)
 
+    def stats(self, *args: Callable[[TSource_co], Any]) -> Stats[Any]:
+        from .stats import Stats
+        if len(args) == 0:
+            selector: Any = identity
+        else:  # len(args) == 1
+            selector = args[0]
+        iterator = iter(self)
+        try:
+            sum_ = min_ = max_ = selector(next(iterator))
+        except StopIteration:
+            return Stats(0, 0, None, None)
+        count = 1
+        for elem in iterator:
+            value = selector(elem)
+            sum_ += value
+            if value < min_:
+                min_ = value
+            elif max_ < value:
+                max_ = value
+            count += 1
+        return Stats(count, sum_, min_, max_)
+
     def _sum_helper(self, selector, when_empty):
         iterator = iter(self)
         try:
@@ -860,47 +968,17 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
 
     def take(self, count: Union[int, slice]) -> Enumerable[TSource_co]:
         if isinstance(count, int):
-            def inner(c: int = count):
-                iterator = iter(self)
-                try:
-                    for _ in range(c):
-                        yield next(iterator)
-                except StopIteration:
-                    return
-            return Enumerable(inner)
+            return self._fuse('slice', (0, max(count, 0)))
         else:  # isinstance(count, slice)
             return self.elements_in(count)
 
     def take_last(self, count: int) -> Enumerable[TSource_co]:
         if count <= 0:
             return self.empty()
-        def inner():
-            iterator = iter(self)
-            try:
-                q = Deque((next(iterator),))
-            except StopIteration:
-                return
-            for elem in iterator:
-                if len(q) == count:
-                    while True:
-                        q.popleft()
-                        q.append(elem)
-                        try:
-                            elem = next(iterator)
-                        except StopIteration:
-                            break
-                else:
-                    q.append(elem)
-            yield from q
-        return Enumerable(inner)
+        return self._fuse('take_last', count)
 
     def take_while(self, predicate: Callable[[TSource_co], bool]) -> Enumerable[TSource_co]:
-        def inner():
-            for elem in self:
-                if not predicate(elem):
-                    break
-                yield elem
-        return Enumerable(inner)
+        return self._fuse('take_while', predicate)
 
     def take_while2(self, predicate: Callable[[TSource_co, int], bool]) -> Enumerable[TSource_co]:
         def inner():
@@ -950,18 +1028,12 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
             s = ComposeSet()
             for elem in self.concat(second):
                 key = key_selector(elem)
-                if key in s:
-                    continue
-                s.add(key)
-                yield elem
+                if s.try_add(key):
+                    yield elem
         return Enumerable(inner)
 
     def where(self, predicate: Callable[[TSource_co], bool]) -> Enumerable[TSource_co]:
-        def inner():
-            for elem in self:
-                if predicate(elem):
-                    yield elem
-        return Enumerable(inner)
+        return self._fuse('where', predicate)
 
     def where2(self, predicate: Callable[[TSource_co, int], bool]) -> Enumerable[TSource_co]:
         def inner():
@@ -971,17 +1043,13 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
         return Enumerable(inner)
 
     def zip(self, *iters: Iterable[Any]) -> Enumerable[Any]:
-        def inner():
-            yield from zip(self, *iters)
-        return Enumerable(inner)
+        return self._fuse('zip', iters)
 
     def zip2(self, *iters_and_result_selector: Any) -> Enumerable[Any]:
         iters = iters_and_result_selector[:-1]
         result_selector = iters_and_result_selector[-1]
-        def inner():
-            for tup in zip(self, *iters):
-                yield result_selector(*tup)
-        return Enumerable(inner)
+        # map() with several iterables stops at the shortest one, as zip() does
+        return Enumerable(lambda: map(result_selector, self, *iters))
 
     def elements_in(self, *args) -> Enumerable[TSource_co]:
         if len(args) == 1:
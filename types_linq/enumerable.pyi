@@ -1,3 +1,4 @@
+from concurrent.futures import Executor
 from typing import Any, Callable, Dict, Generic, Iterable, Iterator, List, MutableSequence, NoReturn, Optional, Sequence, Set, Tuple, Type, Union, overload
 
 from .lookup import Lookup
@@ -5,9 +6,16 @@ from .grouping import Grouping
 from .ordered_enumerable import OrderedEnumerable
 from .cached_enumerable import CachedEnumerable
 from .more import MoreEnumerable
+from .numeric_enumerable import NumericEnumerable
+from .parallel_enumerable import ParallelEnumerable
+from .join_strategy import JoinStrategy
+from .stats import Stats
 from .more_typing import (
     SupportsAverage,
     TAccumulate,
+    TAccumulate2,
+    TAccumulate3,
+    TAccumulate4,
     TCollection,
     TDefault,
     TInner,
@@ -46,8 +54,19 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
         an enumerating operation is performed.
         '''
 
+    _has_iterable: bool  # internal
+
     def _get_iterable(self) -> Iterable[TSource_co]: ...  # internal
 
+    def _len_impl(self, fallback: bool) -> int: ...  # internal
+
+    @staticmethod
+    def _raise_not_enough_elements() -> NoReturn: ...  # internal
+
+    def _fuse(self, kind: str, arg: Any) -> Enumerable[Any]: ...  # internal
+
+    def _getitem_impl(self, index: Union[int, slice], fallback: bool) -> Union[TSource_co, Enumerable[TSource_co]]: ...  # internal
+
     def __contains__(self, value: object) -> bool:
         '''
         Tests whether the sequence contains the specified element. Prefers calling `__contains__()`
@@ -170,6 +189,9 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
     @staticmethod
     def _raise_empty_sequence() -> NoReturn: ...  # internal
 
+    @staticmethod
+    def _raise_no_such_element() -> NoReturn: ...  # internal
+
     @overload
     def aggregate(self,
         __seed: TAccumulate,
@@ -230,6 +252,131 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
             ~ v1.2.0: Fixed annotation for __func.
         '''
 
+    def aggregate_by(self,
+        key_selector: Callable[[TSource_co], TKey],
+        seed: TAccumulate,
+        func: Callable[[TAccumulate, TSource_co], TAccumulate],
+    ) -> Enumerable[Tuple[TKey, TAccumulate]]:
+        '''
+        Applies an accumulator function over the elements of each key in the sequence, and returns
+        a sequence of (key, accumulated value) tuples. The seed is used as the initial accumulator
+        value of every key, so it should not be mutated by func; use `aggregate_by2()` to create a
+        new seed per key instead.
+
+        Unlike `group_by()` followed by `aggregate()`, the sequence is enumerated once and only one
+        accumulator per key is kept in memory. Keys are ordered by their first occurrences, as in
+        `group_by()`.
+
+        Example
+        ```py
+        >>> sales = [('tea', 3), ('coffee', 5), ('tea', 2)]
+        >>> Enumerable(sales).aggregate_by(lambda s: s[0], 0, lambda acc, s: acc + s[1]).to_list()
+        [('tea', 5), ('coffee', 5)]
+        ```
+
+        Revisions
+            ~ v1.3.0: New.
+        '''
+
+    def aggregate_by2(self,
+        key_selector: Callable[[TSource_co], TKey],
+        seed_selector: Callable[[TKey], TAccumulate],
+        func: Callable[[TAccumulate, TSource_co], TAccumulate],
+    ) -> Enumerable[Tuple[TKey, TAccumulate]]:
+        '''
+        Applies an accumulator function over the elements of each key in the sequence, and returns
+        a sequence of (key, accumulated value) tuples. The initial accumulator value of a key is
+        created by calling seed_selector with the key.
+
+        Example
+        ```py
+        >>> words = ['apple', 'bean', 'avocado', 'beet']
+        >>> def add(acc, w):
+        ...     acc.add(len(w))
+        ...     return acc
+
+        >>> Enumerable(words).aggregate_by2(lambda w: w[0], lambda _: set(), add).to_list()
+        [('a', {5, 7}), ('b', {4})]
+        ```
+
+        Revisions
+            ~ v1.3.0: New.
+        '''
+
+    @overload
+    def aggregate_many(self,
+        __reducer: Tuple[TAccumulate, Callable[[TAccumulate, TSource_co], TAccumulate]],
+    ) -> Tuple[TAccumulate]:
+        '''
+        Applies several accumulator functions over the sequence in one enumeration, and returns a
+        tuple of the accumulated values, in the order of the reducers. Each reducer is a tuple of
+        a seed, which is used as the initial accumulator value, and an accumulator function.
+
+        This is preferred over calling `aggregate()`, `sum()`, etc. one by one if enumerating the
+        sequence is expensive, e.g. it runs a long query or reads from a generator. See also
+        `stats()`.
+
+        Example
+        ```py
+        >>> words = ['apple', 'fig', 'banana']
+        >>> Enumerable(words).aggregate_many(
+        ...     (0, lambda acc, w: acc + len(w)),
+        ...     ('', lambda acc, w: acc + w[0]),
+        ... )
+        (14, 'afb')
+        ```
+
+        Revisions
+            ~ v1.3.0: New.
+        '''
+
+    @overload
+    def aggregate_many(self,
+        __reducer: Tuple[TAccumulate, Callable[[TAccumulate, TSource_co], TAccumulate]],
+        __reducer2: Tuple[TAccumulate2, Callable[[TAccumulate2, TSource_co], TAccumulate2]],
+    ) -> Tuple[TAccumulate, TAccumulate2]:
+        '''
+        Revisions
+            ~ v1.3.0: New.
+        '''
+
+    @overload
+    def aggregate_many(self,
+        __reducer: Tuple[TAccumulate, Callable[[TAccumulate, TSource_co], TAccumulate]],
+        __reducer2: Tuple[TAccumulate2, Callable[[TAccumulate2, TSource_co], TAccumulate2]],
+        __reducer3: Tuple[TAccumulate3, Callable[[TAccumulate3, TSource_co], TAccumulate3]],
+    ) -> Tuple[TAccumulate, TAccumulate2, TAccumulate3]:
+        '''
+        Revisions
+            ~ v1.3.0: New.
+        '''
+
+    @overload
+    def aggregate_many(self,
+        __reducer: Tuple[TAccumulate, Callable[[TAccumulate, TSource_co], TAccumulate]],
+        __reducer2: Tuple[TAccumulate2, Callable[[TAccumulate2, TSource_co], TAccumulate2]],
+        __reducer3: Tuple[TAccumulate3, Callable[[TAccumulate3, TSource_co], TAccumulate3]],
+        __reducer4: Tuple[TAccumulate4, Callable[[TAccumulate4, TSource_co], TAccumulate4]],
+    ) -> Tuple[TAccumulate, TAccumulate2, TAccumulate3, TAccumulate4]:
+        '''
+        Revisions
+            ~ v1.3.0: New.
+        '''
+
+    @overload
+    def aggregate_many(self,
+        __reducer: Tuple[Any, Callable[[Any, TSource_co], Any]],
+        __reducer2: Tuple[Any, Callable[[Any, TSource_co], Any]],
+        __reducer3: Tuple[Any, Callable[[Any, TSource_co], Any]],
+        __reducer4: Tuple[Any, Callable[[Any, TSource_co], Any]],
+        __reducer5: Tuple[Any, Callable[[Any, TSource_co], Any]],
+        *reducers: Tuple[Any, Callable[[Any, TSource_co], Any]],
+    ) -> Tuple[Any, ...]:
+        '''
+        Revisions
+            ~ v1.3.0: New.
+        '''
+
     def all(self, predicate: Callable[[TSource_co], bool]) -> bool:
         '''
         Tests whether all elements of the sequence satisfy a condition.
@@ -282,9 +429,20 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
         >>> ints
         [1, 3, 5, 7, 9]
         ```
+
+        Revisions
+            ~ v1.3.0: If the wrapped iterable is a list, tuple or range, the result is a lazy view that
+              supports `len()` and indexing in constant time.
         '''
 
-    def as_cached(self, *, cache_capacity: Optional[int] = None) -> CachedEnumerable[TSource_co]:
+    def as_cached(self, *,
+        cache_capacity: Optional[int] = None,
+        thread_safe: bool = False,
+        cache_bytes: Optional[int] = None,
+        size_selector: Optional[Callable[[TSource_co], int]] = None,
+        spill: bool = False,
+        spill_dir: Optional[str] = None,
+    ) -> CachedEnumerable[TSource_co]:
         '''
         Returns a CachedEnumerable to cache the enumerated results in this query so that if the wrapped
         iterable is not repeatable (e.g. generator object), it will be repeatable.
@@ -325,11 +483,28 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
 
         If cache_capacity is None, it is infinite.
 
-        Raises `InvalidOperationError` if cache_capacity is negative.
+        If cache_bytes is given, the total size of the cached values is also limited to that many bytes.
+        The size of each value is computed by size_selector once it is cached, which defaults to
+        `sys.getsizeof()`. Note that `sys.getsizeof()` does not count the objects referenced by the
+        value, e.g. the elements of a list.
+
+        Once the cache is full, the oldest values are evicted, and enumerations that have not reached
+        them yet skip to the oldest value in the cache. If spill is true, the evicted values are pickled
+        to a temporary file in spill_dir (or the default temporary directory) instead, so that every
+        enumeration still yields all values from the start. The file is deleted when the
+        CachedEnumerable is garbage collected.
+
+        If thread_safe is true, the returned CachedEnumerable can be enumerated by multiple threads
+        at the same time. They share one enumeration of the source, so each value is pulled from the
+        source only once.
+
+        Raises `InvalidOperationError` if cache_capacity or cache_bytes is negative, or if spill_dir is
+        given without spill.
 
         The behavior of this method differs from that of `CachedEnumerable`.
 
         Revisions
+            ~ v1.3.0: Added the thread_safe, cache_bytes, size_selector, spill and spill_dir parameters.
             ~ v0.1.1: New.
         '''
 
@@ -346,6 +521,61 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
             ~ v0.2.0: New.
         '''
 
+    def as_numeric(self) -> NumericEnumerable[TSource_co]:
+        '''
+        Returns a NumericEnumerable that evaluates subsequent `select()` and `where()` calls, and the
+        `sum()`, `min()`, `max()` and `average()` methods, using vectorized NumPy operations if the
+        sequence wraps a one-dimensional NumPy array or an `array.array` of floats. NumPy is not
+        required; without it, or for other sources, the generic implementations are used.
+
+        Example
+        ```py
+        >>> import numpy as np
+        >>> prices = np.array([12.5, 3.0, 7.25, 20.0])
+        >>> print(Enumerable(prices).as_numeric().where(lambda p: p > 5).select(lambda p: p * 1.1).sum())
+        43.725
+        ```
+
+        Revisions
+            ~ v1.3.0: New.
+        '''
+
+    def as_parallel(self, *,
+        executor: Optional[Executor] = None,
+        chunk_size: int = 1024,
+        ordered: bool = True,
+    ) -> ParallelEnumerable[TSource_co]:
+        '''
+        Returns a ParallelEnumerable that evaluates subsequent `select()`, `where()` and `select_many()`
+        calls, and the `sum()`, `count()`, `aggregate()` and `to_list()` methods, over chunks of the
+        sequence concurrently.
+
+        Chunks of at most chunk_size elements are read from the sequence in the calling thread and
+        submitted to the executor. If executor is None, a `concurrent.futures.ThreadPoolExecutor` is
+        created for each enumeration and shut down afterwards. A `ProcessPoolExecutor` allows
+        CPU-bound selectors to run on multiple cores, in which case the elements, the selectors and
+        the predicates must be picklable (e.g. functions defined at module level instead of lambdas).
+
+        If ordered is False, the results of the chunks are yielded as soon as they complete, so the
+        order of the elements is not preserved.
+
+        Raises `InvalidOperationError` if chunk_size is less than 1.
+
+        Example
+        ```py
+        >>> from concurrent.futures import ThreadPoolExecutor
+        >>> with ThreadPoolExecutor(4) as pool:
+        ...     Enumerable.range(0, 10).as_parallel(executor=pool, chunk_size=3) \\
+        ...         .where(lambda x: x % 2 == 0)                                  \\
+        ...         .select(lambda x: x * x)                                      \\
+        ...         .to_list()
+        [0, 4, 16, 36, 64]
+        ```
+
+        Revisions
+            ~ v1.3.0: New.
+        '''
+
     @overload
     def average(self: Enumerable[SupportsAverage[TResult]]) -> TResult:
         '''
@@ -455,6 +685,10 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
         >>> en1.concat(en2).to_list()
         [1, 2, 3, 1, 2, 4]
         ```
+
+        Revisions
+            ~ v1.3.0: If both iterables are lists, tuples or ranges, the result is a lazy view that supports
+              `len()` and indexing in constant time.
         '''
 
     @overload
@@ -522,6 +756,22 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
         ```
         '''
 
+    def count_by(self, key_selector: Callable[[TSource_co], TKey]) -> Enumerable[Tuple[TKey, int]]:
+        '''
+        Returns a sequence of (key, count) tuples containing the number of elements of each key in
+        the sequence. The elements are not kept in memory. Keys are ordered by their first
+        occurrences, as in `group_by()`.
+
+        Example
+        ```py
+        >>> Enumerable(['apple', 'bean', 'avocado', 'beet', 'cherry']).count_by(lambda w: w[0]).to_list()
+        [('a', 2), ('b', 2), ('c', 1)]
+        ```
+
+        Revisions
+            ~ v1.3.0: New.
+        '''
+
     def default_if_empty(self,
         default: TDefault,
     ) -> Union[Enumerable[TSource_co], Enumerable[TDefault]]:
@@ -673,6 +923,24 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
               renamed as `except_by2()` to accommodate this.
         '''
 
+    def every(self, step: int) -> Enumerable[TSource_co]:
+        '''
+        Returns every step-th element of the sequence, starting with the first one. This is the same as
+        `self[::step]`, but it always enumerates lazily. If the source is a list or other random-access
+        sequence, the result is a view that indexes the source directly.
+
+        Raises `InvalidOperationError` if step is less than 1.
+
+        Example
+        ```py
+        >>> Enumerable(range(10)).every(3).to_list()
+        [0, 3, 6, 9]
+        ```
+
+        Revisions
+            ~ v1.3.0: New.
+        '''
+
     @overload
     def first(self) -> TSource_co:
         '''
@@ -745,16 +1013,61 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
         ```
         '''
 
+    def full_outer_join(self,
+        inner: Iterable[TInner],
+        outer_key_selector: Callable[[TSource_co], TKey],
+        inner_key_selector: Callable[[TInner], TKey],
+        result_selector: Callable[[Optional[TSource_co], Optional[TInner]], TResult],
+        *,
+        strategy: JoinStrategy = JoinStrategy.auto,
+    ) -> Enumerable[TResult]:
+        '''
+        Correlates the elements of two sequences based on matching keys, like `join()`. In addition,
+        each element in self (outer) or inner without matching elements is passed to the result
+        selector, with `None` in place of the other element.
+
+        Unless `JoinStrategy.merge` is used, the unmatched elements in the sequence held in memory
+        (inner for `JoinStrategy.hash_inner`) come last, in the order of first appearances of their
+        keys. With `JoinStrategy.merge`, all results are in the order of the keys.
+
+        Example
+        ```py
+        >>> Enumerable([1, 2, 2]).full_outer_join(
+        ...     [2, 3],
+        ...     lambda x: x,
+        ...     lambda y: y,
+        ...     lambda x, y: (x, y),
+        ... ).to_list()
+        [(1, None), (2, 2), (2, 2), (None, 3)]
+        ```
+
+        Revisions
+            ~ v1.3.0: New.
+        '''
+
     @overload
     def group_by(self,
         key_selector: Callable[[TSource_co], TKey],
         value_selector: Callable[[TSource_co], TValue],
         __result_selector: Callable[[TKey, Enumerable[TValue]], TResult],
+        *,
+        spill_threshold: Optional[int] = None,
+        spill_dir: Optional[str] = None,
     ) -> Enumerable[TResult]:
         '''
         Groups the elements of the sequence according to specified key selector and value selector. Then
         it returns the result value using each grouping and its key.
 
+        If spill_threshold is given, once that many elements are held in memory, the values of the groups
+        formed so far are moved to temporary files in spill_dir (or the default temporary directory), split
+        into a fixed number of partitions. The keys stay in memory. After the sequence is exhausted, the
+        groups are rebuilt and returned one partition at a time, so only the values of one partition are
+        held in memory. In this case the order of groups is unspecified, and the values must be picklable;
+        the groups contain unpickled copies of them. The order of values in each group is preserved, and
+        each group has the first of its equal keys, as usual. The files are removed
+        once the enumeration finishes or is abandoned. Raises `InvalidOperationError` if spill_threshold
+        is less than 1, or if spill_dir is given without spill_threshold.
+
         Example
         ```py
         >>> pets_list = [
@@ -777,6 +1090,7 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
         ```
 
         Revisions
+            ~ v1.3.0: Added the spill_threshold and spill_dir parameters.
             ~ v0.2.1: Added preliminary support for unhashable keys.
         '''
 
@@ -784,9 +1098,13 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
     def group_by(self,
         key_selector: Callable[[TSource_co], TKey],
         value_selector: Callable[[TSource_co], TValue],
+        *,
+        spill_threshold: Optional[int] = None,
+        spill_dir: Optional[str] = None,
     ) -> Enumerable[Grouping[TKey, TValue]]:
         '''
         Groups the elements of the sequence according to specified key selector and value selector.
+        See the overload with a result selector for the spilling parameters.
 
         Example
         ```py
@@ -804,6 +1122,7 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
         ```
 
         Revisions
+            ~ v1.3.0: Added the spill_threshold and spill_dir parameters.
             ~ v0.2.1: Added preliminary support for unhashable keys.
         '''
 
@@ -811,10 +1130,14 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
     def group_by2(self,
         key_selector: Callable[[TSource_co], TKey],
         __result_selector: Callable[[TKey, Enumerable[TSource_co]], TResult],
+        *,
+        spill_threshold: Optional[int] = None,
+        spill_dir: Optional[str] = None,
     ) -> Enumerable[TResult]:
         '''
         Groups the elements of the sequence according to a specified key selector function and creates a
         result value using each grouping and its key.
+        See `group_by()` for the spilling parameters.
 
         Example
         ```py
@@ -832,15 +1155,20 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
         ```
 
         Revisions
+            ~ v1.3.0: Added the spill_threshold and spill_dir parameters.
             ~ v0.2.1: Added preliminary support for unhashable keys.
         '''
 
     @overload
     def group_by2(self,
         key_selector: Callable[[TSource_co], TKey],
+        *,
+        spill_threshold: Optional[int] = None,
+        spill_dir: Optional[str] = None,
     ) -> Enumerable[Grouping[TKey, TSource_co]]:
         '''
         Groups the elements of the sequence according to a specified key selector function.
+        See `group_by()` for the spilling parameters.
 
         Example
         ```py
@@ -857,6 +1185,7 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
         ```
 
         Revisions
+            ~ v1.3.0: Added the spill_threshold and spill_dir parameters.
             ~ v0.2.1: Added preliminary support for unhashable keys.
         '''
 
@@ -865,6 +1194,8 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
         outer_key_selector: Callable[[TSource_co], TKey],
         inner_key_selector: Callable[[TInner], TKey],
         result_selector: Callable[[TSource_co, Enumerable[TInner]], TResult],
+        *,
+        strategy: JoinStrategy = JoinStrategy.auto,
     ) -> Enumerable[TResult]:
         '''
         Correlates the elements of two sequences based on equality of keys and groups the results using the
@@ -872,6 +1203,9 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
 
         In normal cases, the iteration preserves order of elements in self (outer), and for each element in
         self, the order of matching elements from inner.
+
+        The strategy selects how the elements are matched. See `JoinStrategy`. Raises `InvalidOperationError`
+        if it is `JoinStrategy.hash_outer`.
         
         Unhashable keys are supported (where hashibility is determined by checking `typing.Hashable`). If any
         keys formed by key selectors involve such types, the order is unspecified.
@@ -916,6 +1250,7 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
         ```
 
         Revisions
+            ~ v1.3.0: Added the strategy parameter.
             ~ v0.2.1: Added preliminary support for unhashable keys.
         '''
 
@@ -958,12 +1293,19 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
         outer_key_selector: Callable[[TSource_co], TKey],
         inner_key_selector: Callable[[TInner], TKey],
         result_selector: Callable[[TSource_co, TInner], TResult],
+        *,
+        strategy: JoinStrategy = JoinStrategy.auto,
     ) -> Enumerable[TResult]:
         '''
         Correlates the elements of two sequences based on matching keys.
 
         In normal cases, the iteration preserves order of elements in self (outer), and for each element in
         self, the order of matching elements from inner.
+
+        The strategy selects which sequence is held in memory and which one is streamed. See `JoinStrategy`.
+        By default, a sort-merge join is used if both sequences are sorted by `order_by()` using the same
+        key selectors as the join, which is also the way to join on keys that support `<` but are not hashable.
+        Otherwise the inner sequence is held in memory.
         
         Unhashable keys are supported (where hashibility is determined by checking `typing.Hashable`). If any
         keys formed by key selectors involve such types, the order is unspecified.
@@ -988,10 +1330,63 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
         ('Weiss, Charlotte', 'Whiskers')
         ```
 
+        Example
+        ```py
+        >>> # holds the small table in memory while streaming the events
+        >>> Enumerable(users).join(
+        ...     read_events(),
+        ...     lambda user: user.id,
+        ...     lambda event: event.user_id,
+        ...     lambda user, event: (user.name, event.kind),
+        ...     strategy=JoinStrategy.hash_outer,
+        ... )
+        ```
+
         Revisions
+            ~ v1.3.0: Added the strategy parameter.
             ~ v0.2.1: Added preliminary support for unhashable keys.
         '''
 
+    def left_join(self,
+        inner: Iterable[TInner],
+        outer_key_selector: Callable[[TSource_co], TKey],
+        inner_key_selector: Callable[[TInner], TKey],
+        result_selector: Callable[[TSource_co, Optional[TInner]], TResult],
+        *,
+        strategy: JoinStrategy = JoinStrategy.auto,
+    ) -> Enumerable[TResult]:
+        '''
+        Correlates the elements of two sequences based on matching keys, like `join()`. In addition,
+        each element in self (outer) without matching elements is passed to the result selector with
+        `None`.
+
+        With `JoinStrategy.hash_outer`, the unmatched elements in self come after all matched ones.
+
+        Example
+        ```py
+        # Please refer to group_join() for definition of people and pets
+
+        >>> en = Enumerable(people).left_join(
+        ...     pets,
+        ...     lambda person: person,
+        ...     lambda pet: pet.owner,
+        ...     lambda person, pet: (person.name, pet.name if pet else None),
+        ... )
+
+        >>> for obj in en:
+        ...     print(obj)
+        ('Hedlund, Magnus', 'Daisy')
+        ('Adams, Terry', 'Barley')
+        ('Adams, Terry', 'Boots')
+        ('Adams, Terry', 'Roman')
+        ('Weiss, Charlotte', 'Whiskers')
+        ('Animal, No', None)
+        ```
+
+        Revisions
+            ~ v1.3.0: New.
+        '''
+
     @overload
     def last(self) -> TSource_co:
         '''
@@ -1230,6 +1625,8 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
     @overload
     def order_by(self,
         key_selector: Callable[[TSource_co], TSupportsLessThan],
+        *,
+        lazy: bool = False,
     ) -> OrderedEnumerable[TSource_co, TSupportsLessThan]:
         '''
         Sorts the elements of the sequence in ascending order according to a key.
@@ -1255,12 +1652,29 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
         ```
 
         Subsequent ordering is supported. See `OrderedEnumerable`.
+
+        If lazy is true, the elements are sorted incrementally while the result is enumerated, so the
+        first elements are available in linear time, and stopping early, e.g. in `take_while()`,
+        skips the rest of the sorting. Enumerating all elements this way is slower than the default
+        full sort.
+
+        Example
+        ```py
+        >>> scores = Enumerable(big_list).order_by_descending(lambda p: p.score, lazy=True)
+        >>> scores.take_while(lambda p: p.score >= 90).to_list()
+        ```
+
+        Revisions
+            ~ v1.3.0: `len()` of the result no longer sorts the sequence, and the result supports indexing in
+              constant time once sorted. Added the lazy parameter.
         '''
 
     @overload
     def order_by(self,
         key_selector: Callable[[TSource_co], TKey],
         __comparer: Callable[[TKey, TKey], int],
+        *,
+        lazy: bool = False,
     ) -> OrderedEnumerable[TSource_co, TKey]:
         '''
         Sorts the elements of the sequence in ascending order by using a specified comparer.
@@ -1276,14 +1690,21 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
         ...     .to_list()
         ['Boots', 'Roman', 'Barley']
         ```
+
+        Revisions
+            ~ v1.3.0: `len()` of the result no longer sorts the sequence, and the result supports indexing in
+              constant time once sorted. Added the lazy parameter.
         '''
 
     @overload
     def order_by_descending(self,
         key_selector: Callable[[TSource_co], TSupportsLessThan],
+        *,
+        lazy: bool = False,
     ) -> OrderedEnumerable[TSource_co, TSupportsLessThan]:
         '''
-        Sorts the elements of the sequence in descending order according to a key.
+        Sorts the elements of the sequence in descending order according to a key. See `order_by()`
+        for the lazy parameter.
 
         Example
         ```py
@@ -1291,18 +1712,28 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
         >>> Enumerable(ints).order_by_descending(lambda e: e).to_list()
         [8, 5, 4, 2]
         ```
+
+        Revisions
+            ~ v1.3.0: `len()` of the result no longer sorts the sequence, and the result supports indexing in
+              constant time once sorted. Added the lazy parameter.
         '''
 
     @overload
     def order_by_descending(self,
         key_selector: Callable[[TSource_co], TKey],
         __comparer: Callable[[TKey, TKey], int],
+        *,
+        lazy: bool = False,
     ) -> OrderedEnumerable[TSource_co, TKey]:
         '''
         Sorts the elements of the sequence in descending order by using a specified comparer.
 
         Such comparer takes two values and return positive ints when lhs > rhs, negative ints
         if lhs < rhs, and 0 if they are equal.
+
+        Revisions
+            ~ v1.3.0: `len()` of the result no longer sorts the sequence, and the result supports indexing in
+              constant time once sorted. Added the lazy parameter.
         '''
 
     def prepend(self, element: TSource_co) -> Enumerable[TSource_co]:  # type: ignore
@@ -1316,6 +1747,10 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
         >>> Enumerable(ints).prepend(-1).to_list()
         [-1, 1, 3, 5, 7, 9]
         ```
+
+        Revisions
+            ~ v1.3.0: If the wrapped iterable is a list, tuple or range, the result is a lazy view that
+              supports `len()` and indexing in constant time.
         '''
 
     # count: Optional[int] is nonstandard behavior
@@ -1365,6 +1800,10 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
         >>> Enumerable(gen()).reverse().to_list()
         [100, 10, 1]
         ```
+
+        Revisions
+            ~ v1.3.0: If the wrapped iterable is a list, tuple or range, the result is a lazy view instead of
+              a reversed copy.
         '''
 
     def select(self, selector: Callable[[TSource_co], TResult]) -> Enumerable[TResult]:
@@ -1377,6 +1816,11 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
         >>> Enumerable(ints).select(lambda e: '*' * e).to_list()
         ['*', '***', '*****', '*******', '*********']
         ```
+
+        Revisions
+            ~ v1.3.0: If the wrapped iterable is a list, tuple or range, the result is a lazy view that
+              supports `len()` and indexing in constant time, and the selector is only called on the accessed
+              elements.
         '''
 
     def select2(self, selector: Callable[[TSource_co, int], TResult]) -> Enumerable[TResult]:
@@ -1389,6 +1833,43 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
         >>> Enumerable(ints).select2(lambda e, i: e * (i + 1)).to_list()
         [1, 6, 15, 28, 45]
         ```
+
+        Revisions
+            ~ v1.3.0: If the wrapped iterable is a list, tuple or range, the result is a lazy view that
+              supports `len()` and indexing in constant time, and the selector is only called on the accessed
+              elements.
+        '''
+
+    def select_batch(self,
+        selector: Callable[[List[TSource_co]], Iterable[TResult]],
+        *,
+        batch_size: int = 1024,
+    ) -> Enumerable[TResult]:
+        '''
+        Projects the elements of the sequence in batches. The elements are split into lists of
+        batch_size elements (the last one may be shorter), and the selector is called with each
+        list. It returns an iterable of the results, which are concatenated into the resulting
+        sequence. This suits selectors that have a high per-call cost but can process many values
+        at once, e.g. bulk database queries or vectorized computations.
+
+        The batches are read lazily, so at most batch_size elements are held at once. Raises
+        `InvalidOperationError` if batch_size is less than 1.
+
+        Example
+        ```py
+        >>> def lookup_names(ids):
+        ...     print(f'querying {ids}')
+        ...     return [f'user{i}' for i in ids]
+
+        >>> Enumerable.range(0, 5).select_batch(lookup_names, batch_size=2).to_list()
+        querying [0, 1]
+        querying [2, 3]
+        querying [4]
+        ['user0', 'user1', 'user2', 'user3', 'user4']
+        ```
+
+        Revisions
+            ~ v1.3.0: New.
         '''
 
     @overload
@@ -1596,6 +2077,10 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
         >>> Enumerable(grades).order_by_descending(lambda g: g).skip(3).to_list()
         [82, 70, 59, 56]
         ```
+
+        Revisions
+            ~ v1.3.0: The result is a lazy view that supports `len()` and indexing in constant time if the
+              wrapped iterable is a list, tuple or range.
         '''
 
     def skip_last(self, count: int) -> Enumerable[TSource_co]:
@@ -1609,6 +2094,10 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
         >>> Enumerable(grades).order_by_descending(lambda g: g).skip_last(3).to_list()
         [98, 92, 85, 82]
         ```
+
+        Revisions
+            ~ v1.3.0: The result is a lazy view that supports `len()` and indexing in constant time if the
+              wrapped iterable is a list, tuple or range.
         '''
 
     def skip_while(self, predicate: Callable[[TSource_co], bool]) -> Enumerable[TSource_co]:
@@ -1639,6 +2128,37 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
         ```
         '''
 
+    @overload
+    def stats(self) -> Stats[TSource_co]:
+        '''
+        Computes the count, sum, minimum, maximum and average of the sequence in one enumeration.
+        The elements must support `+` and `<`, and `/` by an int for the average. Accessing the
+        minimum, maximum or average of an empty sequence raises `InvalidOperationError`.
+
+        This is preferred over calling `count()`, `sum()`, `min()`, `max()` and `average()` one by
+        one if enumerating the sequence is expensive. See also `aggregate_many()`.
+
+        Example
+        ```py
+        >>> stats = Enumerable([3, 1, 4, 1, 5]).stats()
+        >>> stats.count, stats.sum, stats.min, stats.max, stats.average
+        (5, 14, 1, 5, 2.8)
+        ```
+
+        Revisions
+            ~ v1.3.0: New.
+        '''
+
+    @overload
+    def stats(self, __selector: Callable[[TSource_co], TValue]) -> Stats[TValue]:
+        '''
+        Computes the count, sum, minimum, maximum and average of the values selected by the
+        selector in one enumeration.
+
+        Revisions
+            ~ v1.3.0: New.
+        '''
+
     # returning 0 conforms the builtin sum() function
     @overload
     def sum(self: Enumerable[TSupportsAdd]) -> Union[TSupportsAdd, int]:
@@ -1707,6 +2227,10 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
         >>> Enumerable(grades).take(3).to_list()
         [98, 92, 85]
         ```
+
+        Revisions
+            ~ v1.3.0: The result is a lazy view that supports `len()` and indexing in constant time if the
+              wrapped iterable is a list, tuple or range.
         '''
 
     @overload
@@ -1742,6 +2266,10 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
         >>> Enumerable(grades).take_last(3).to_list()
         [70, 59, 56]
         ```
+
+        Revisions
+            ~ v1.3.0: The result is a lazy view that supports `len()` and indexing in constant time if the
+              wrapped iterable is a list, tuple or range.
         '''
 
     def take_while(self, predicate: Callable[[TSource_co], bool]) -> Enumerable[TSource_co]:
@@ -1906,6 +2434,10 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
         >>> Enumerable(ints).zip(dims).to_list()
         [(1, 'x'), (2, 'y'), (3, 'z'), (4, 't')]
         ```
+
+        Revisions
+            ~ v1.3.0: If all iterables are lists, tuples or ranges, the result is a lazy view that supports
+              `len()` and indexing in constant time.
         '''
 
     @overload
@@ -1916,6 +2448,8 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
         '''
         Revisions
             ~ v0.1.1: New.
+            ~ v1.3.0: If all iterables are lists, tuples or ranges, the result is a lazy view that supports
+              `len()` and indexing in constant time.
         '''
 
     @overload
@@ -1927,6 +2461,8 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
         '''
         Revisions
             ~ v0.1.1: New.
+            ~ v1.3.0: If all iterables are lists, tuples or ranges, the result is a lazy view that supports
+              `len()` and indexing in constant time.
         '''
 
     @overload
@@ -1939,6 +2475,8 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
         '''
         Revisions
             ~ v0.1.1: New.
+            ~ v1.3.0: If all iterables are lists, tuples or ranges, the result is a lazy view that supports
+              `len()` and indexing in constant time.
         '''
 
     @overload
@@ -1953,6 +2491,8 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
         '''
         Revisions
             ~ v0.1.1: New.
+            ~ v1.3.0: If all iterables are lists, tuples or ranges, the result is a lazy view that supports
+              `len()` and indexing in constant time.
         '''
 
     @overload
@@ -2032,10 +2572,16 @@ class Enumerable(Sequence[TSource_co], Generic[TSource_co]):
         Produces a subsequence defined by the given slice notation.
 
         This method always uses a generic list slicing method regardless the implementation of the
-        wrapped iterable.
+        wrapped iterable. Elements are enumerated lazily and held in memory only as far as negative
+        indices require: at most the last `-start` or `-stop` elements, or for a negative step, the
+        elements between the bounds. A negative step from the end down to a nonnegative or omitted
+        stop holds that whole tail.
 
         This method currently is identical to `take()` when it takes a slice.
 
+        Revisions
+            ~ v1.3.0: Slices no longer copy the whole sequence when they have negative indices.
+
         Example
         ```py
         >>> def gen():
@@ -0,0 +1,242 @@
+from __future__ import annotations
+from itertools import chain, count, dropwhile, islice, takewhile
+from typing import Any, Deque, Iterable, Iterator, Optional, Sequence, Tuple
+
+from .enumerable import Enumerable
+from .instrumentation import note_materialized
+from .sequence_view import ConcatView, SelectView, ZipView, is_random_access, slice_view
+from .util import batches
+
+from .more_typing import (
+    TSource_co,
+)
+
+
+# a stage is (kind, argument). the kinds and their arguments are
+# - 'select', 'select2', 'where', 'take_while', 'skip_while': the selector or predicate
+# - 'select_batch': a (selector, batch_size) pair
+# - 'select_many': the collection selector
+# - 'slice': a (start, stop) pair of nonnegative indices where stop may be None
+# - 'every': a positive step
+# - 'take_last', 'skip_last': a positive count
+# - 'reverse': None
+# - 'zip': a tuple of the other iterables
+# - 'concat': the second iterable
+# - 'prepend', 'append': the element
+_Stage = Tuple[str, Any]
+
+
+class FusedEnumerable(Enumerable[TSource_co]):
+    '''
+    ```py
+    from types_linq.fused_enumerable import FusedEnumerable
+    ```
+
+    Enumerable that records a chain of streaming operators (`select()`, `select2()`,
+    `select_batch()`, `select_many()`, `where()`, `skip()`, `take()`, `skip_while()`,
+    `take_while()`, `every()`, `skip_last()`, `take_last()`, `reverse()`, `zip()`, `concat()`,
+    `prepend()` and `append()`) applied to a source, and fuses them into a single loop when
+    enumerated. If the source wraps a list, tuple, range or other random-access builtin sequence,
+    given directly rather than through a factory or an operator that does work when enumerated,
+    the leading operators except `select_batch()`, `select_many()`, `where()`, `skip_while()` and
+    `take_while()` produce lazy views over it instead, so that `len()` and indexing of the result
+    run in constant time and only evaluate the accessed elements.
+
+    Users should not construct instances of this class directly. Instances are returned from the
+    operators listed above.
+
+    Revisions
+        ~ v1.3.0: New.
+    '''
+
+    _source: Enumerable[Any]
+    _stages: Tuple[_Stage, ...]
+
+    def __init__(self, source: Enumerable[Any], stages: Tuple[_Stage, ...]):
+        super().__init__(self._compile)
+        self._source = source
+        self._stages = stages
+
+    def _fuse(self, kind: str, arg: Any) -> Enumerable[Any]:
+        stages = self._stages
+        last_kind, last_arg = stages[-1]
+        if kind == 'slice' and last_kind == 'slice':
+            # adjacent skip() and take() calls compose into one slice
+            arg = _compose_slices(last_arg, arg)
+            stages = stages[:-1]
+            if not stages:
+                # let the source see the whole slice, e.g. OrderedEnumerable only selects the
+                # leading elements of skip().take() instead of sorting all of them
+                return self._source._fuse(kind, arg)
+        elif kind == 'every' and last_kind == 'every':
+            arg *= last_arg
+            stages = stages[:-1]
+        return FusedEnumerable(self._source, (*stages, (kind, arg)))
+
+    def _compile(self) -> Iterable[Any]:
+        iterable = _obtain(self._source)
+        stages = iter(self._stages)
+        if is_random_access(iterable):
+            seq: Sequence[Any] = iterable  # type: ignore
+            for kind, arg in stages:
+                # other operands are enumerated once at most. do not obtain them again if the
+                # stage cannot produce a view
+                if kind == 'concat':
+                    arg = _obtain(arg)
+                elif kind == 'zip':
+                    arg = tuple(_obtain(it) for it in arg)
+                view = _view(seq, kind, arg)
+                if view is None:
+                    # continue with the remaining stages on an iterator
+                    return _chain(iter(seq), kind, arg, stages)
+                seq = view
+            return seq
+        if self._stages[0][0] == 'reverse' and isinstance(iterable, Sequence) \
+            and not isinstance(iterable, Enumerable):
+            # e.g. a deque, which reversed() enumerates without copying it. other reversibles
+            # may define __reversed__() differently from __iter__(), and are copied
+            next(stages)
+            return _chain(reversed(iterable), None, None, stages)
+        # an enumerable is only enumerated once the first element is needed
+        return _chain(chain.from_iterable((iterable,)), None, None, stages)
+
+
+def _obtain(iterable: Iterable[Any]) -> Iterable[Any]:
+    # the iterable of an enumerable, as far as obtaining it runs no upstream work such as
+    # building the lookup of group_by(). views can only be made over what is obtained here
+    while isinstance(iterable, Enumerable) and _is_cheap(iterable):
+        iterable = iterable._get_iterable()
+    return iterable
+
+
+def _is_cheap(en: Enumerable[Any]) -> bool:
+    if isinstance(en, FusedEnumerable):
+        # compiling only obtains the source if it is cheap too
+        return True
+    return en._has_iterable and type(en)._get_iterable is Enumerable._get_iterable
+
+
+def _view(seq: Sequence[Any], kind: str, arg: Any) -> Optional[Sequence[Any]]:
+    if kind == 'select':
+        return SelectView(seq, arg, False)
+    elif kind == 'select2':
+        return SelectView(seq, arg, True)
+    elif kind == 'slice':
+        return slice_view(seq, slice(*arg))
+    elif kind == 'every':
+        return slice_view(seq, slice(None, None, arg))
+    elif kind == 'take_last':
+        return slice_view(seq, slice(-arg, None))
+    elif kind == 'skip_last':
+        return slice_view(seq, slice(None, -arg))
+    elif kind == 'reverse':
+        return slice_view(seq, slice(None, None, -1))
+    elif kind == 'zip':
+        if all(is_random_access(it) for it in arg):
+            return ZipView((seq, *arg))
+    elif kind == 'concat':
+        if is_random_access(arg):
+            return ConcatView(seq, arg)
+    elif kind == 'prepend':
+        return ConcatView((arg,), seq)
+    elif kind == 'append':
+        return ConcatView(seq, (arg,))
+    return None
+
+
+def _chain(
+    it: Iterator[Any],
+    kind: Optional[str],
+    arg: Any,
+    rest: Iterator[_Stage],
+) -> Iterator[Any]:
+    # the stages are chained using builtin iterators so that enumerating the result does not
+    # resume one generator frame per stage for each element
+    if kind is not None:
+        it = _apply(it, kind, arg)
+    for kind, arg in rest:
+        it = _apply(it, kind, arg)
+    return it
+
+
+def _apply(it: Iterator[Any], kind: str, arg: Any) -> Iterator[Any]:
+    if kind == 'select':
+        return map(arg, it)
+    elif kind == 'select2':
+        return map(arg, it, count())
+    elif kind == 'select_batch':
+        selector, batch_size = arg
+        return chain.from_iterable(map(selector, batches(it, batch_size)))
+    elif kind == 'select_many':
+        return chain.from_iterable(map(arg, it))
+    elif kind == 'where':
+        return filter(arg, it)
+    elif kind == 'take_while':
+        return takewhile(arg, it)
+    elif kind == 'skip_while':
+        return dropwhile(arg, it)
+    elif kind == 'slice':
+        start, stop = arg
+        if start == 0 and stop is None:
+            return it
+        return islice(it, start, stop)
+    elif kind == 'every':
+        return islice(it, 0, None, arg)
+    elif kind == 'take_last':
+        return _take_last(it, arg)
+    elif kind == 'skip_last':
+        return _skip_last(it, arg)
+    elif kind == 'reverse':
+        return _reverse(it)
+    elif kind == 'zip':
+        return zip(it, *arg)
+    elif kind == 'concat':
+        return chain(it, arg)
+    elif kind == 'prepend':
+        return chain((arg,), it)
+    else:  # kind == 'append'
+        return chain(it, (arg,))
+
+
+def _reverse(it: Iterator[Any]) -> Iterator[Any]:
+    lst = [*it]
+    note_materialized(len(lst))
+    yield from reversed(lst)
+
+
+def _take_last(it: Iterator[Any], count: int) -> Iterator[Any]:
+    q = Deque(it, maxlen=count)
+    note_materialized(len(q))
+    yield from q
+
+
+def _skip_last(it: Iterator[Any], count: int) -> Iterator[Any]:
+    q = Deque()
+    for elem in it:
+        if len(q) == count:
+            note_materialized(count)
+            while True:
+                yield q.pop()
+                q.appendleft(elem)
+                try:
+                    elem = next(it)
+                except StopIteration:
+                    return
+        else:
+            q.appendleft(elem)
+    # there are at most count elements
+    note_materialized(len(q))
+
+
+def _compose_slices(
+    first: Tuple[int, Optional[int]],
+    second: Tuple[int, Optional[int]],
+) -> Tuple[int, Optional[int]]:
+    start1, stop1 = first
+    start2, stop2 = second
+    start = start1 + start2
+    stop = None if stop2 is None else start1 + stop2
+    if stop1 is not None:
+        start = min(start, stop1)
+        stop = stop1 if stop is None else min(stop, stop1)
+    return start, stop
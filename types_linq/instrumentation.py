@@ -0,0 +1,597 @@
+from __future__ import annotations
+from contextvars import ContextVar, Token
+from functools import wraps
+from inspect import isfunction
+import threading
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .enumerable import Enumerable
+from .sequence_view import SelectView, SliceView, is_random_access
+from .types_linq_error import InvalidOperationError
+from .util import identity
+
+
+class OperatorStats:
+    '''
+    ```py
+    from types_linq.instrumentation import OperatorStats
+    ```
+
+    Holds what an `Instrumentation` recorded about one operator call, or about an enumerable that
+    an instrumented operator reads from.
+
+    Users should not construct instances of this class directly. Use `Instrumentation.operators`
+    instead.
+
+    Revisions
+        ~ v1.3.0: New.
+    '''
+
+    _id: int
+    _name: str
+    _label: str
+    _inputs: Tuple[OperatorStats, ...]
+    _enumerations: int
+    _elements_out: int
+    _selector_calls: int
+    _selector_time: float
+    _library_time: float
+    _materialized: Optional[int]
+    _instrumentation: Instrumentation
+
+    def __init__(self,
+        id: int,
+        name: str,
+        inputs: Tuple[OperatorStats, ...],
+        instrumentation: Instrumentation,
+    ):
+        self._id = id
+        self._name = name
+        self._label = f'{name}#{id}'
+        self._inputs = inputs
+        self._enumerations = 0
+        self._elements_out = 0
+        self._selector_calls = 0
+        self._selector_time = 0.0
+        self._library_time = 0.0
+        self._materialized = None
+        self._instrumentation = instrumentation
+
+    @property
+    def id(self) -> int:
+        '''
+        Gets the number of the operator call, in the order of the calls.
+        '''
+        return self._id
+
+    @property
+    def name(self) -> str:
+        '''
+        Gets the name of the operator, or the type name of an enumerable that is read by an
+        operator but was not returned by one.
+        '''
+        return self._name
+
+    @property
+    def inputs(self) -> Sequence[OperatorStats]:
+        '''
+        Gets the enumerables the operator was called on and with, such as the second sequence of
+        `concat()`.
+        '''
+        return self._inputs
+
+    @property
+    def enumerations(self) -> int:
+        '''
+        Gets the number of times the result of the operator was enumerated.
+        '''
+        return self._enumerations
+
+    @property
+    def elements_in(self) -> Optional[int]:
+        '''
+        Gets the number of elements produced by the inputs, or `None` if there is no input.
+        '''
+        if not self._inputs:
+            return None
+        return sum(node._elements_out for node in self._inputs)
+
+    @property
+    def elements_out(self) -> int:
+        '''
+        Gets the number of elements produced by enumerating the result. If the operator does not
+        return an enumerable, this is the length of a returned list, tuple, set or dict, 0 if it
+        returns `None`, and 1 otherwise.
+        '''
+        return self._elements_out
+
+    @property
+    def selector_calls(self) -> int:
+        '''
+        Gets the number of calls to the functions passed to the operator.
+        '''
+        return self._selector_calls
+
+    @property
+    def selector_time(self) -> float:
+        '''
+        Gets the seconds spent in the functions passed to the operator.
+        '''
+        return self._selector_time
+
+    @property
+    def library_time(self) -> float:
+        '''
+        Gets the seconds spent in the operator itself, not counting its selectors and inputs.
+        '''
+        return self._library_time
+
+    @property
+    def materialized(self) -> Optional[int]:
+        '''
+        Gets the largest number of elements the operator held at once in a buffer, such as the
+        list it sorts or the lookup it groups into, or in the list, tuple, set or dict it returns.
+        `None` if it buffers nothing.
+        '''
+        return self._materialized
+
+
+class Instrumentation:
+    '''
+    ```py
+    from types_linq.instrumentation import Instrumentation
+    ```
+
+    Context manager that records, for each operator called on an enumerable inside the `with`
+    block, the number of elements it reads and produces, the time spent in the functions passed
+    to it and in the operator itself, and the size of the buffers it fills.
+
+    Queries are recorded as far as they are built and enumerated inside the block, in the context
+    that entered it: the same thread, and the asyncio tasks created inside the block. When blocks
+    are nested, the innermost one records. The instrumented queries return the same results, but
+    run slower because their operators are not fused into one loop. The selectors of
+    `ParallelEnumerable` operators that run in another process are not timed, and its chained
+    operators are recorded without the elements that pass between them.
+
+    Note that the instrumentation is global: while any block is active, the methods of
+    `Enumerable` and its subclasses are replaced by recording wrappers in the whole process. The
+    wrappers are installed when the first block is entered and removed when the last one exits.
+    Queries of other threads are not recorded, but pay for a check in each operator call.
+
+    Example
+    ```py
+    >>> from types_linq.instrumentation import Instrumentation
+    >>> with Instrumentation() as instrumentation:
+    ...     Enumerable(range(10)).where(lambda x: x % 2 == 0).select(lambda x: x * x).to_list()
+    >>> for op in instrumentation.operators:
+    ...     print(op.name, op.elements_in, op.elements_out, op.selector_calls)
+    Enumerable None 10 0
+    where 10 5 10
+    select 5 5 5
+    to_list 5 5 0
+    ```
+
+    Revisions
+        ~ v1.3.0: New.
+    '''
+
+    _operators: List[OperatorStats]
+    _folded: Dict[Tuple[str, ...], float]
+    _lock: threading.Lock
+    _active: bool
+    _token: Token[Tuple[Instrumentation, ...]]
+
+    def __init__(self):
+        self._operators = []
+        self._folded = {}
+        self._lock = threading.Lock()
+        self._active = False
+
+    def __enter__(self) -> Instrumentation:
+        if self._active:
+            raise InvalidOperationError('Instrumentation is already active')
+        self._active = True
+        _install()
+        self._token = _active.set((*_active.get(), self))
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        _active.reset(self._token)
+        self._active = False
+        _uninstall(self)
+
+    @property
+    def operators(self) -> Sequence[OperatorStats]:
+        '''
+        Gets the recorded operators in the order they were called. The enumerables they read from
+        come before them.
+        '''
+        return self._operators
+
+    def to_dict(self) -> Dict[str, Any]:
+        '''
+        Returns the recorded operators as a dict of builtin values, which can be saved as JSON.
+        The inputs of each operator are given by their ids.
+        '''
+        return {'operators': [{
+            'id': op.id,
+            'name': op.name,
+            'inputs': [node.id for node in op.inputs],
+            'enumerations': op.enumerations,
+            'elements_in': op.elements_in,
+            'elements_out': op.elements_out,
+            'selector_calls': op.selector_calls,
+            'selector_time': op.selector_time,
+            'library_time': op.library_time,
+            'materialized': op.materialized,
+        } for op in self._operators]}
+
+    def to_folded(self) -> str:
+        '''
+        Returns the recorded time in the folded stack format read by flame graph tools, one line
+        per call path with its exclusive time in microseconds. The path goes from the consuming
+        operator to the operators it pulled elements from, written as `name#id`, and ends with
+        the name of a selector for the time spent in it.
+
+        Example
+        ```py
+        >>> print(instrumentation.to_folded())
+        to_list#3 12
+        to_list#3;select#2 4
+        to_list#3;select#2;<lambda> 3
+        ...
+        ```
+        '''
+        return '\n'.join(f'{";".join(path)} {round(seconds * 1e6)}'
+            for path, seconds in self._folded.items())
+
+    def _add(self, name: str, inputs: Tuple[OperatorStats, ...]) -> OperatorStats:
+        node = OperatorStats(len(self._operators), name, inputs, self)
+        self._operators.append(node)
+        return node
+
+    def _input(self, en: Enumerable[Any]) -> OperatorStats:
+        # the node of an enumerable an operator reads from
+        entry = _nodes.get(id(en))
+        if entry is None:
+            node = self._add(type(en).__name__, ())
+            _nodes[id(en)] = en, node
+            return node
+        return entry[1]
+
+    def _wrap(self, node: OperatorStats, arg: Any) -> Any:
+        if callable(arg) and not isinstance(arg, (type, Enumerable, _Selector)):
+            return _Selector(node, arg)
+        return arg
+
+    def _call(self,
+        name: str,
+        func: Callable[..., Any],
+        receiver: Optional[Enumerable[Any]],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        inputs = [self._input(receiver)] if receiver is not None else []
+        inputs.extend(self._input(arg) for arg in args if isinstance(arg, Enumerable))
+        node = self._add(name, tuple(inputs))
+        args = tuple(self._wrap(node, arg) for arg in args)
+        kwargs = {key: self._wrap(node, value) for key, value in kwargs.items()}
+
+        frame = _push(node, node._label, receiver)
+        try:
+            if receiver is None:
+                result = func(*args, **kwargs)
+            else:
+                result = func(receiver, *args, **kwargs)
+        finally:
+            _pop(frame, _LIBRARY)
+
+        if isinstance(result, Enumerable):
+            if id(result) not in _nodes:
+                _nodes[id(result)] = result, node
+        elif isinstance(result, (list, tuple, set, frozenset, dict)):
+            node._elements_out = len(result)
+            self._materialize(node, len(result))
+        elif result is not None:
+            node._elements_out = 1
+        return result
+
+    def _record(self, frame: _Frame, exclusive: float, kind: int) -> None:
+        node = frame.node
+        with self._lock:
+            if kind == _SELECTOR:
+                node._selector_calls += 1
+                node._selector_time += exclusive
+            else:
+                node._library_time += exclusive
+                if kind == _ELEMENT:
+                    node._elements_out += 1
+                elif kind == _OPEN:
+                    node._enumerations += 1
+            self._folded[frame.path] = self._folded.get(frame.path, 0.0) + exclusive
+
+    def _materialize(self, node: OperatorStats, size: int) -> None:
+        with self._lock:
+            if node._materialized is None or size > node._materialized:
+                node._materialized = size
+
+
+# kinds of frames
+_LIBRARY = 0
+_OPEN = 1  # obtaining the iterable of an instrumented enumerable
+_ELEMENT = 2  # producing an element of an instrumented enumerable
+_SELECTOR = 3
+
+
+class _Frame:
+    # the time being spent in a node, in a selector of it, or in the library for it
+
+    __slots__ = ('node', 'path', 'receiver', 'start', 'child')
+
+    def __init__(self, node: OperatorStats, path: Tuple[str, ...], receiver: Any):
+        self.node = node
+        self.path = path
+        self.receiver = receiver
+        self.child = 0.0
+
+
+_local = threading.local()
+
+
+def _frames() -> List[_Frame]:
+    try:
+        return _local.frames
+    except AttributeError:
+        frames = _local.frames = []
+        return frames
+
+
+def _push(node: OperatorStats, label: str, receiver: Any) -> _Frame:
+    frames = _frames()
+    path = (*frames[-1].path, label) if frames else (label,)
+    frame = _Frame(node, path, receiver)
+    frames.append(frame)
+    frame.start = perf_counter()
+    return frame
+
+
+def _pop(frame: _Frame, kind: int) -> None:
+    elapsed = perf_counter() - frame.start
+    frames = _frames()
+    frames.pop()
+    if frames:
+        frames[-1].child += elapsed
+    frame.node._instrumentation._record(frame, elapsed - frame.child, kind)
+
+
+class _Selector:
+    # a function passed to an instrumented operator
+
+    __slots__ = ('_node', '_func', '_label')
+
+    def __init__(self, node: OperatorStats, func: Callable[..., Any]):
+        self._node = node
+        self._func = func
+        self._label = getattr(func, '__qualname__', type(func).__name__)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        if not self._node._instrumentation._active:
+            return self._func(*args, **kwargs)
+        frame = _push(self._node, self._label, None)
+        try:
+            return self._func(*args, **kwargs)
+        finally:
+            _pop(frame, _SELECTOR)
+
+    def __reduce__(self) -> Any:
+        # a process executor receives the function itself
+        return identity, (self._func,)
+
+
+class _CountingIterator(Iterator[Any]):
+
+    __slots__ = ('_node', '_it')
+
+    def __init__(self, node: OperatorStats, it: Iterator[Any]):
+        self._node = node
+        self._it = it
+
+    def __next__(self) -> Any:
+        frame = _push(self._node, self._node._label, None)
+        try:
+            value = next(self._it)
+        except BaseException:
+            _pop(frame, _LIBRARY)
+            raise
+        _pop(frame, _ELEMENT)
+        return value
+
+
+class _CountingIterable:
+    # the iterable of an instrumented enumerable. it can be enumerated again like the iterable
+    # it wraps, and each enumeration is counted
+
+    def __init__(self, node: OperatorStats, iterable: Iterable[Any]):
+        self._node = node
+        self._iterable = iterable
+
+    def __iter__(self) -> Iterator[Any]:
+        node = self._node
+        frame = _push(node, node._label, None)
+        kind = _LIBRARY
+        try:
+            it = iter(self._iterable)
+            kind = _OPEN
+        finally:
+            _pop(frame, kind)
+        return _CountingIterator(node, it)
+
+
+class _CountingSequence(_CountingIterable, Sequence[Any]):
+    # keeps the len() and indexing of a sequence. an accessed element counts as produced
+
+    _iterable: Sequence[Any]
+
+    def __len__(self) -> int:
+        return len(self._iterable)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:  # type: ignore[override]
+        if isinstance(index, slice):
+            return SliceView(self, range(len(self))[index])
+        node = self._node
+        frame = _push(node, node._label, None)
+        kind = _LIBRARY
+        try:
+            value = self._iterable[index]
+            kind = _ELEMENT
+        finally:
+            _pop(frame, kind)
+        return value
+
+
+class _CountingView(_CountingSequence, SelectView[Any]):
+    # a random-access sequence. a SelectView, so that operators still produce views over it
+    pass
+
+
+# instrumented enumerables and their nodes, while an instrumentation is active. the enumerables
+# are kept alive so that their ids are not reused
+_nodes: Dict[int, Tuple[Enumerable[Any], OperatorStats]] = {}
+
+_lock = threading.Lock()
+_installs = 0
+_patches: List[Tuple[type, str, Any]] = []
+
+
+# the instrumentations entered in the current context, innermost last. other threads and
+# asyncio tasks created outside the block do not see them
+_active: ContextVar[Tuple[Instrumentation, ...]] = ContextVar('types_linq_instrumentation', default=())
+
+
+def _current() -> Optional[Instrumentation]:
+    active = _active.get()
+    return active[-1] if active else None
+
+
+def _wrap_operator(name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+    @wraps(func)
+    def operator(self: Any, *args: Any, **kwargs: Any) -> Any:
+        instrumentation = _current()
+        if instrumentation is None:
+            return func(self, *args, **kwargs)
+        frames = _frames()
+        if frames and frames[-1].receiver is self and frames[-1].node._name == name:
+            # an override calling the base method
+            return func(self, *args, **kwargs)
+        return instrumentation._call(name, func, self, args, kwargs)
+    return operator
+
+
+def _wrap_static(name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+    @wraps(func)
+    def operator(*args: Any, **kwargs: Any) -> Any:
+        instrumentation = _current()
+        if instrumentation is None:
+            return func(*args, **kwargs)
+        return instrumentation._call(name, func, None, args, kwargs)
+    return staticmethod(operator)  # type: ignore
+
+
+def _wrap_get_iterable(func: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    @wraps(func)
+    def _get_iterable(self: Any) -> Any:
+        entry = _nodes.get(id(self))
+        if entry is None:
+            return func(self)
+        node = entry[1]
+        frames = _frames()
+        if frames and frames[-1].node is node:
+            # an override calling the base method, or a generator of the enumerable
+            return func(self)
+        frame = _push(node, node._label, None)
+        try:
+            iterable = func(self)
+        finally:
+            _pop(frame, _LIBRARY)
+        if is_random_access(iterable):
+            return _CountingView(node, iterable)
+        elif isinstance(iterable, Sequence):
+            return _CountingSequence(node, iterable)
+        return _CountingIterable(node, iterable)
+    return _get_iterable
+
+
+def _wrap_fuse(func: Callable[..., Any]) -> Callable[..., Any]:
+    @wraps(func)
+    def _fuse(self: Any, kind: str, arg: Any) -> Any:
+        if id(self) in _nodes:
+            # keep instrumented operators apart
+            return Enumerable._fuse(self, kind, arg)
+        return func(self, kind, arg)
+    return _fuse
+
+
+def _install() -> None:
+    global _installs
+    from .cached_enumerable import CachedEnumerable
+    from .fused_enumerable import FusedEnumerable
+    from .grouping import Grouping
+    from .lookup import Lookup
+    from .numeric_enumerable import NumericEnumerable
+    from .ordered_enumerable import OrderedEnumerable
+    from .parallel_enumerable import ParallelEnumerable
+    from .more import MoreEnumerable
+    from .more.extrema_enumerable import ExtremaEnumerable
+
+    with _lock:
+        _installs += 1
+        if _installs > 1:
+            return
+        classes = (Enumerable, CachedEnumerable, FusedEnumerable, Grouping, Lookup,
+            NumericEnumerable, OrderedEnumerable, ParallelEnumerable, MoreEnumerable,
+            ExtremaEnumerable)
+        for cls in classes:
+            for name, attr in list(vars(cls).items()):
+                if name == '_get_iterable':
+                    new = _wrap_get_iterable(attr)
+                elif name == '_fuse' and cls is FusedEnumerable:
+                    new = _wrap_fuse(attr)
+                elif name.startswith('_') and name != '__getitem__':
+                    continue
+                elif isinstance(attr, staticmethod):
+                    new = _wrap_static(name, attr.__func__)
+                elif isfunction(attr):
+                    new = _wrap_operator(name, attr)
+                else:
+                    continue
+                _patches.append((cls, name, attr))
+                setattr(cls, name, new)
+
+
+def _uninstall(instrumentation: Instrumentation) -> None:
+    global _installs
+    with _lock:
+        for key, (_, node) in list(_nodes.items()):
+            if node._instrumentation is instrumentation:
+                del _nodes[key]
+        _installs -= 1
+        if _installs > 0:
+            return
+        for cls, name, attr in reversed(_patches):
+            setattr(cls, name, attr)
+        _patches.clear()
+
+
+def note_materialized(size: int) -> None:
+    # records that the running operator holds size elements in a buffer
+    if _installs:
+        frames = getattr(_local, 'frames', None)
+        if frames:
+            node = frames[-1].node
+            node._instrumentation._materialize(node, size)
+
+
+def is_instrumenting() -> bool:
+    # whether it is worth computing the size of a buffer for note_materialized()
+    return _installs > 0
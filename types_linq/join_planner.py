@@ -0,0 +1,181 @@
+from __future__ import annotations
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
+
+from .enumerable import Enumerable
+from .join_strategy import JoinStrategy
+from .lookup import Lookup
+from .ordered_enumerable import OrderedEnumerable
+from .types_linq_error import InvalidOperationError
+from .util import identity
+
+
+# marks unmatched inner elements in the results of join_groups()
+missing: Any = object()
+
+_no_elements: Enumerable[Any] = Enumerable(())
+
+
+def join_groups(
+    outer: Iterable[Any],
+    inner: Iterable[Any],
+    outer_key_selector: Callable[[Any], Any],
+    inner_key_selector: Callable[[Any], Any],
+    strategy: JoinStrategy,
+    unmatched_outer: bool,
+    unmatched_inner: bool,
+) -> Iterator[Tuple[Any, Iterable[Any]]]:
+    # yields (outer element, inner elements with the same key) pairs. unmatched outer elements
+    # are paired with empty sequences (hash_outer yields them only if unmatched_outer is true),
+    # and unmatched inner elements are paired with missing if unmatched_inner is true
+    if strategy == JoinStrategy.auto:
+        strategy, descending = _plan(outer, inner, outer_key_selector, inner_key_selector)
+    else:
+        descending = _ordered_key(outer)[1]
+    if strategy == JoinStrategy.hash_inner:
+        return _hash_inner_groups(outer, inner, outer_key_selector, inner_key_selector, unmatched_inner)
+    elif strategy == JoinStrategy.hash_outer:
+        return _hash_outer_groups(outer, inner, outer_key_selector, inner_key_selector,
+            unmatched_outer, unmatched_inner)
+    else:  # strategy == JoinStrategy.merge
+        return _merge_groups(outer, inner, outer_key_selector, inner_key_selector,
+            descending, unmatched_inner)
+
+
+def _ordered_key(iterable: Iterable[Any]) -> Tuple[Optional[Callable[[Any], Any]], bool]:
+    # the key selector and direction of the first ordering if the iterable is sorted by a key
+    if not isinstance(iterable, OrderedEnumerable):
+        return None, False
+    root = iterable._levels()[0]
+    if root._comparer is not None:
+        return None, False
+    return root._key_selector, root._descending
+
+
+def _plan(
+    outer: Iterable[Any],
+    inner: Iterable[Any],
+    outer_key_selector: Callable[[Any], Any],
+    inner_key_selector: Callable[[Any], Any],
+) -> Tuple[JoinStrategy, bool]:
+    outer_key, outer_descending = _ordered_key(outer)
+    inner_key, inner_descending = _ordered_key(inner)
+    if outer_key is outer_key_selector and inner_key is inner_key_selector \
+        and outer_descending == inner_descending:
+        return JoinStrategy.merge, outer_descending
+    # building the outer sequence would change the order of the results
+    return JoinStrategy.hash_inner, False
+
+
+def _hash_inner_groups(
+    outer: Iterable[Any],
+    inner: Iterable[Any],
+    outer_key_selector: Callable[[Any], Any],
+    inner_key_selector: Callable[[Any], Any],
+    unmatched_inner: bool,
+) -> Iterator[Tuple[Any, Iterable[Any]]]:
+    groupings = Lookup(inner, inner_key_selector, identity)._groupings
+    matched = set()
+    for outer_item in outer:
+        grouping = groupings.get(outer_key_selector(outer_item))
+        if grouping is None:
+            yield outer_item, _no_elements
+        else:
+            if unmatched_inner:
+                matched.add(id(grouping))
+            yield outer_item, grouping
+    if unmatched_inner:
+        for grouping in groupings.values():
+            if id(grouping) not in matched:
+                yield missing, grouping
+
+
+def _hash_outer_groups(
+    outer: Iterable[Any],
+    inner: Iterable[Any],
+    outer_key_selector: Callable[[Any], Any],
+    inner_key_selector: Callable[[Any], Any],
+    unmatched_outer: bool,
+    unmatched_inner: bool,
+) -> Iterator[Tuple[Any, Iterable[Any]]]:
+    groupings = Lookup(outer, outer_key_selector, identity)._groupings
+    matched = set()
+    for inner_item in inner:
+        grouping = groupings.get(inner_key_selector(inner_item))
+        if grouping is None:
+            if unmatched_inner:
+                yield missing, (inner_item,)
+        else:
+            if unmatched_outer:
+                matched.add(id(grouping))
+            for outer_item in grouping:
+                yield outer_item, (inner_item,)
+    if unmatched_outer:
+        for grouping in groupings.values():
+            if id(grouping) not in matched:
+                for outer_item in grouping:
+                    yield outer_item, _no_elements
+
+
+def _raise_unsorted() -> None:
+    raise InvalidOperationError('The sequence is not sorted by the join key')
+
+
+def _key_groups(
+    iterable: Iterable[Any],
+    key_selector: Callable[[Any], Any],
+    before: Callable[[Any, Any], bool],
+) -> Iterator[Tuple[Any, Enumerable[Any]]]:
+    # groups adjacent elements having equal keys
+    iterator = iter(iterable)
+    for elem in iterator:
+        key = key_selector(elem)
+        group = [elem]
+        for elem in iterator:
+            next_key = key_selector(elem)
+            if before(key, next_key):
+                yield key, Enumerable(group)
+                key = next_key
+                group = [elem]
+            elif before(next_key, key):
+                _raise_unsorted()
+            else:
+                group.append(elem)
+        yield key, Enumerable(group)
+
+
+def _merge_groups(
+    outer: Iterable[Any],
+    inner: Iterable[Any],
+    outer_key_selector: Callable[[Any], Any],
+    inner_key_selector: Callable[[Any], Any],
+    descending: bool,
+    unmatched_inner: bool,
+) -> Iterator[Tuple[Any, Iterable[Any]]]:
+    # only < is used to compare the keys, as in sorting
+    before: Callable[[Any, Any], bool] = \
+        (lambda x, y: y < x) if descending else (lambda x, y: x < y)
+    inner_groups = _key_groups(inner, inner_key_selector, before)
+    curr = next(inner_groups, None)
+    curr_matched = False
+    prev_key: Any = missing
+    for outer_item in outer:
+        key = outer_key_selector(outer_item)
+        if prev_key is not missing and before(key, prev_key):
+            _raise_unsorted()
+        prev_key = key
+        while curr is not None and before(curr[0], key):
+            if unmatched_inner and not curr_matched:
+                yield missing, curr[1]
+            curr = next(inner_groups, None)
+            curr_matched = False
+        if curr is not None and not before(key, curr[0]):
+            curr_matched = True
+            yield outer_item, curr[1]
+        else:
+            yield outer_item, _no_elements
+    if unmatched_inner:
+        while curr is not None:
+            if not curr_matched:
+                yield missing, curr[1]
+            curr = next(inner_groups, None)
+            curr_matched = False
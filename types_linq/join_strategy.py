@@ -0,0 +1,44 @@
+from enum import Enum, auto
+
+
+class JoinStrategy(Enum):
+    '''
+    ```py
+    from types_linq import JoinStrategy
+    ```
+
+    Enumeration to select how `Enumerable.join()` and similar methods match the elements of the
+    outer and the inner sequence. The sequence that is streamed is enumerated once and is never
+    held in memory as a whole.
+
+    Revisions
+        ~ v1.3.0: New.
+    '''
+    hash_inner = auto()
+    '''
+    Builds a lookup over the inner sequence and streams the outer sequence. The results are in the
+    order of the outer sequence.
+    '''
+
+    hash_outer = auto()
+    '''
+    Builds a lookup over the outer sequence and streams the inner sequence. The results are in the
+    order of the inner sequence, and for each inner element, the order of matching outer elements.
+    This is preferred if the outer sequence is small and the inner sequence is large or unbounded.
+    Not supported by `group_join()`.
+    '''
+
+    merge = auto()
+    '''
+    Streams both sequences, which must be sorted by their keys in the same direction, holding only
+    the inner elements of the current key in memory. The direction is descending if the outer
+    sequence is an `OrderedEnumerable` sorted in descending order, otherwise ascending. Raises
+    `InvalidOperationError` upon enumeration if any sequence is found unsorted.
+    '''
+
+    # defined last, since it shadows enum.auto() in the class body
+    auto = auto()
+    '''
+    Uses `merge` if both sequences are `OrderedEnumerable`s whose first ordering uses the same key
+    selectors as the join, in the same direction. Otherwise uses `hash_inner`.
+    '''
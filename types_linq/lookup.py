@@ -3,6 +3,7 @@ from typing import Callable, Iterable
 
 from .enumerable import Enumerable
 from .grouping import Grouping
+from .instrumentation import is_instrumenting, note_materialized
 from .util import ComposeMap
 
 from .more_typing import (
@@ -34,14 +35,18 @@ class Lookup(Enumerable[Grouping[TKey_co, TValue_co]]):
         key_selector: Callable[[TSource], TKey_co],
         value_selector: Callable[[TSource], TValue_co],
     ):
-        self._groupings = ComposeMap()
+        self._groupings = groupings = ComposeMap()
 
         for src in source:
             key = key_selector(src)
             elem = value_selector(src)
-            if key not in self._groupings:
-                self._groupings[key] = Grouping(key)
-            self._groupings[key]._append(elem)
+            # one lookup for each element whose key is seen before
+            grouping = groupings.get(key)
+            if grouping is None:
+                grouping = groupings[key] = Grouping(key)
+            grouping._append(elem)
+        if is_instrumenting():
+            note_materialized(sum(len(grouping) for grouping in groupings.values()))
 
         super().__init__(self._groupings.values())
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
-
-from typing import Any, Callable, Deque, Iterable, Iterator, List, Optional, TYPE_CHECKING, Tuple
+from itertools import accumulate, chain, cycle, repeat
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Optional, TYPE_CHECKING, Tuple, Union
 
 if TYPE_CHECKING:
     from .extrema_enumerable import ExtremaEnumerable
@@ -8,6 +8,7 @@ if TYPE_CHECKING:
 from .more_enums import RankMethods
 from .more_error import DirectedGraphNotAcyclicError
 from ..enumerable import Enumerable
+from ..grouping import Grouping
 from ..util import (
     ComposeMap,
     ComposeSet,
@@ -17,8 +18,10 @@ from ..util import (
 from ..more_typing import (
     TAccumulate,
     TKey,
+    TResult,
     TSource,
     TSource_co,
+    TValue,
 )
 
 
@@ -58,15 +61,15 @@ class MoreEnumerable(Enumerable[TSource_co]):
             elif count == 1:
                 return self
 
-        def inner(cnt=count):
+        if count is None:
+            return MoreEnumerable(lambda: cycle(self))
+
+        def inner(cnt: int = count):
             memo: List[TSource_co] = []
             for elem in self:
                 memo.append(elem)
                 yield elem
-            while cnt is None or cnt > 1:
-                yield from memo
-                if cnt is not None:
-                    cnt -= 1
+            yield from chain.from_iterable(repeat(memo, cnt - 1))
         return MoreEnumerable(inner)
 
     def enumerate(self, start: int = 0) -> MoreEnumerable[Tuple[int, TSource_co]]:
@@ -80,10 +83,8 @@ class MoreEnumerable(Enumerable[TSource_co]):
             s = ComposeSet(key_selector(s) for s in second)
             for elem in self:
                 key = key_selector(elem)
-                if key in s:
-                    continue
-                s.add(key)
-                yield elem
+                if s.try_add(key):
+                    yield elem
         return MoreEnumerable(inner)
 
     def flatten(self, *args: Callable[[Iterable[Any]], bool]) -> MoreEnumerable[Any]:
@@ -121,6 +122,45 @@ class MoreEnumerable(Enumerable[TSource_co]):
         for i, elem in enumerate(self):
             action(elem, i)
 
+    def group_adjacent(self,
+        key_selector: Callable[[TSource_co], TKey],
+        value_selector: Callable[[TSource_co], TValue],
+        *args: Callable[[TKey, Enumerable[TValue]], TResult],
+    ) -> Union[MoreEnumerable[TResult], MoreEnumerable[Grouping[TKey, TValue]]]:
+        if len(args) == 0:
+            result_selector: Any = None
+        else:  # len(args) == 1
+            result_selector = args[0]
+
+        def inner():
+            # like run_length_encode(), a group ends where the key changes. only the current
+            # group is held in memory
+            iterator = iter(self)
+            try:
+                elem = next(iterator)
+            except StopIteration:
+                return
+            key = key_selector(elem)
+            grouping: Grouping[Any, Any] = Grouping(key)
+            grouping._append(value_selector(elem))
+            for elem in iterator:
+                next_key = key_selector(elem)
+                if next_key != key:
+                    yield grouping if result_selector is None \
+                        else result_selector(key, grouping)
+                    key = next_key
+                    grouping = Grouping(key)
+                grouping._append(value_selector(elem))
+            yield grouping if result_selector is None \
+                else result_selector(key, grouping)
+        return MoreEnumerable(inner)
+
+    def group_adjacent2(self,
+        key_selector: Callable[[TSource_co], TKey],
+        *args: Callable[[TKey, Enumerable[TSource_co]], TResult],
+    ) -> Union[MoreEnumerable[TResult], MoreEnumerable[Grouping[TKey, TSource_co]]]:
+        return self.group_adjacent(key_selector, identity, *args)
+
     def interleave(self, *iters: Iterable[TSource_co]) -> MoreEnumerable[TSource_co]:
         def inner():
             its = [iter(self)]
@@ -256,21 +296,12 @@ class MoreEnumerable(Enumerable[TSource_co]):
     def scan(self, *args) -> Any:
         if len(args) == 2:
             seed, transformation = args
+            return MoreEnumerable(lambda: accumulate(
+                chain((seed,), self), transformation,
+            ))
         else:  # len(args) == 1
             transformation = args[0]
-        def inner():
-            it = iter(self)
-            nonlocal seed
-            if len(args) == 1:
-                try:
-                    seed = next(it)
-                except StopIteration:
-                    return
-            yield seed
-            for elem in it:
-                seed = transformation(seed, elem)
-                yield seed
-        return MoreEnumerable(inner)
+            return MoreEnumerable(lambda: accumulate(self, transformation))
 
     def scan_right(self, *args) -> Any:
         if len(args) == 2:
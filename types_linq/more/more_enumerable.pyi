@@ -1,6 +1,7 @@
 from typing import Any, Callable, Iterable, Optional, Tuple, overload
 
 from ..enumerable import Enumerable
+from ..grouping import Grouping
 from .extrema_enumerable import ExtremaEnumerable
 from .more_enums import RankMethods
 from ..more_typing import (
@@ -10,6 +11,7 @@ from ..more_typing import (
     TSource,
     TSource_co,
     TSupportsLessThan,
+    TValue,
 )
 
 
@@ -205,6 +207,77 @@ class MoreEnumerable(Enumerable[TSource_co]):
         the logic of the function. The return values are discarded.
         '''
 
+    @overload
+    def group_adjacent(self,
+        key_selector: Callable[[TSource_co], TKey],
+        value_selector: Callable[[TSource_co], TValue],
+        __result_selector: Callable[[TKey, Enumerable[TValue]], TResult],
+    ) -> MoreEnumerable[TResult]:
+        '''
+        Groups the adjacent elements of the sequence that have equal keys according to specified key
+        selector and value selector. Then it returns the result value using each grouping and its key.
+
+        Unlike `group_by()`, a grouping is returned as soon as the key changes, so only the current
+        grouping is held in memory. Keys are compared with `==` to the key of the previous element;
+        the same key can appear in several groupings if the sequence is not sorted by it.
+
+        Revisions
+            ~ v1.3.0: New.
+        '''
+
+    @overload
+    def group_adjacent(self,
+        key_selector: Callable[[TSource_co], TKey],
+        value_selector: Callable[[TSource_co], TValue],
+    ) -> MoreEnumerable[Grouping[TKey, TValue]]:
+        '''
+        Groups the adjacent elements of the sequence that have equal keys according to specified key
+        selector and value selector. A grouping is returned as soon as the key changes.
+
+        Example
+        ```py
+        >>> readings = [('mon', 3), ('mon', 5), ('tue', 2), ('mon', 1)]
+        >>> MoreEnumerable(readings).group_adjacent(lambda r: r[0], lambda r: r[1]) \\
+        ...     .select(lambda g: (g.key, g.to_list())).to_list()
+        [('mon', [3, 5]), ('tue', [2]), ('mon', [1])]
+        ```
+
+        Revisions
+            ~ v1.3.0: New.
+        '''
+
+    @overload
+    def group_adjacent2(self,
+        key_selector: Callable[[TSource_co], TKey],
+        __result_selector: Callable[[TKey, Enumerable[TSource_co]], TResult],
+    ) -> MoreEnumerable[TResult]:
+        '''
+        Groups the adjacent elements of the sequence that have equal keys according to a specified
+        key selector function and creates a result value using each grouping and its key. A grouping
+        is returned as soon as the key changes.
+
+        Example
+        ```py
+        >>> MoreEnumerable('aabccca').group_adjacent2(str.upper, lambda k, g: k * g.count()).to_list()
+        ['AA', 'B', 'CCC', 'A']
+        ```
+
+        Revisions
+            ~ v1.3.0: New.
+        '''
+
+    @overload
+    def group_adjacent2(self,
+        key_selector: Callable[[TSource_co], TKey],
+    ) -> MoreEnumerable[Grouping[TKey, TSource_co]]:
+        '''
+        Groups the adjacent elements of the sequence that have equal keys according to a specified
+        key selector function. A grouping is returned as soon as the key changes.
+
+        Revisions
+            ~ v1.3.0: New.
+        '''
+
     def interleave(self, *iters: Iterable[TSource_co]) -> MoreEnumerable[TSource_co]:
         '''
         Interleaves the elements of two or more sequences into a single sequence, skipping sequences if they
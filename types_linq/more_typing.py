@@ -17,6 +17,15 @@ else:
 TAccumulate = TypeVar('TAccumulate')
 'A generic type parameter.'
 
+TAccumulate2 = TypeVar('TAccumulate2')
+'A generic type parameter.'
+
+TAccumulate3 = TypeVar('TAccumulate3')
+'A generic type parameter.'
+
+TAccumulate4 = TypeVar('TAccumulate4')
+'A generic type parameter.'
+
 TAverage_co = TypeVar('TAverage_co', covariant=True)
 'A generic covariant type parameter.'
 
@@ -0,0 +1,139 @@
+from __future__ import annotations
+import array
+import builtins
+from typing import Any, Callable, Tuple
+
+from .enumerable import Enumerable
+
+from .more_typing import (
+    TSource_co,
+)
+
+np: Any
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover
+    np = None
+
+
+# array.array type codes that are vectorized. integer arrays are not, because NumPy integer
+# arithmetic wraps around where Python integers do not
+_float_typecodes = 'fd'
+
+_empty: Any = object()
+
+
+def _accumulator(arr: Any) -> Any:
+    # floats are summed in double precision like Python floats, also if the array holds float32.
+    # None keeps the NumPy default for integers
+    return np.float64 if arr.dtype.kind == 'f' else None
+
+
+class NumericEnumerable(Enumerable[TSource_co]):
+
+    def _array(self) -> Tuple[Any, bool]:
+        # the elements as a one-dimensional NumPy array if vectorized operations can be used on
+        # them, and whether the results should stay NumPy arrays and scalars
+        if np is None:
+            return None, False
+        values: Any = self._get_iterable()
+        if isinstance(values, np.ndarray):
+            if values.ndim == 1 and values.dtype.kind in 'biuf':
+                return values, True
+        elif isinstance(values, array.array) and values.typecode in _float_typecodes:
+            return np.asarray(values), False
+        return None, False
+
+    @staticmethod
+    def _from_array(res: Any, keep: bool) -> Any:
+        # converts the result of a vectorized operation back to Python values unless the source is
+        # a NumPy array. float arrays become array.array again so that later operations on them
+        # are vectorized too
+        if keep:
+            return res
+        if isinstance(res, np.ndarray):
+            typecode: str = res.dtype.char
+            if typecode in _float_typecodes:
+                values = array.array(typecode)
+                values.frombytes(res.tobytes())
+                return values
+            return res.tolist()
+        return res.item()
+
+    def _vectorized(self, func: Callable[[Any], Any], is_mask: bool) -> Any:
+        # calls func on the whole array. returns None if the result cannot be used in place of
+        # calling func on each element
+        arr, keep = self._array()
+        if arr is None:
+            return None
+        try:
+            # e.g. a division by zero, which raises on Python numbers, makes NumPy warn and
+            # return inf. raise FloatingPointError instead, so that the elements raise as usual
+            with np.errstate(all='raise'):
+                res = func(arr)
+        except Exception:
+            return None
+        if not isinstance(res, np.ndarray) or res.shape != arr.shape:
+            return None
+        if is_mask:
+            return self._from_array(arr[res], keep) if res.dtype.kind == 'b' else None
+        return self._from_array(res, keep)
+
+    def as_numeric(self) -> NumericEnumerable[TSource_co]:  # pyright: ignore[reportIncompatibleMethodOverride]
+        return self
+
+    def average(self, *args: Callable[[TSource_co], Any]) -> Any:
+        if len(args) == 1:
+            return self.select(args[0]).average()
+        arr, keep = self._array()
+        if arr is None:
+            return super().average()  # type: ignore
+        if arr.size == 0:
+            self._raise_empty_sequence()
+        return self._from_array(arr.mean(dtype=_accumulator(arr)), keep)
+
+    def _minmax(self, arr_func: str, builtin_func: Callable[..., Any]) -> Any:
+        arr, keep = self._array()
+        if arr is None:
+            res = builtin_func(self, default=_empty)
+            if res is _empty:
+                self._raise_empty_sequence()
+            return res
+        if arr.size == 0:
+            self._raise_empty_sequence()
+        return self._from_array(getattr(arr, arr_func)(), keep)
+
+    def max(self, *args: Callable[[TSource_co], Any]) -> Any:
+        if len(args) == 1:
+            return self.select(args[0]).max()
+        return self._minmax('max', builtins.max)
+
+    def min(self, *args: Callable[[TSource_co], Any]) -> Any:
+        if len(args) == 1:
+            return self.select(args[0]).min()
+        return self._minmax('min', builtins.min)
+
+    def select(self, selector: Callable[[TSource_co], Any]) -> NumericEnumerable[Any]:
+        def inner():
+            res = self._vectorized(selector, is_mask=False)
+            if res is None:
+                return Enumerable.select(self, selector)
+            return res
+        return NumericEnumerable(inner)
+
+    def sum(self, *args: Callable[[TSource_co], Any]) -> Any:
+        if len(args) == 1:
+            return self.select(args[0]).sum()
+        arr, keep = self._array()
+        if arr is None:
+            # not builtins.sum(), which starts from 0 and cannot add e.g. timedelta objects
+            return super().sum()  # type: ignore
+        return self._from_array(arr.sum(dtype=_accumulator(arr)), keep)
+
+    def where(self, predicate: Callable[[TSource_co], bool]) -> NumericEnumerable[TSource_co]:
+        def inner():
+            res = self._vectorized(predicate, is_mask=True)
+            if res is None:
+                return Enumerable.where(self, predicate)
+            return res
+        return NumericEnumerable(inner)
@@ -0,0 +1,136 @@
+from typing import Callable, Union, overload
+
+from .enumerable import Enumerable
+from .more_typing import (
+    SupportsAverage,
+    TResult,
+    TSource_co,
+    TSupportsAdd,
+    TSupportsLessThan,
+)
+
+
+class NumericEnumerable(Enumerable[TSource_co]):
+    '''
+    ```py
+    from types_linq.numeric_enumerable import NumericEnumerable
+    ```
+
+    Enumerable that evaluates its `select()` and `where()` calls, and its `sum()`, `min()`, `max()`
+    and `average()` methods, using vectorized NumPy operations when the source is a one-dimensional
+    NumPy array, or an `array.array` of floats. Other query methods run as usual.
+
+    NumPy is optional. If it is not installed, or the source is not an array, the methods fall back
+    to the generic implementation, except that `min()` and `max()` use the builtin functions
+    which are faster than the generic loops.
+
+    A selector or predicate is called once with the whole array. Its result is used if it is an
+    array of the same shape (for `where()`, an array of bools). Otherwise, e.g. if it raises an
+    exception or uses `if` on its argument, it is called on each element again. Floating-point
+    errors such as a division by zero raise in the call with the whole array, instead of making
+    NumPy warn. So selectors and predicates should be free of side effects, and behave on arrays
+    as they do on elements.
+    When the source is an `array.array`, the results are converted back to Python values. Integer
+    `array.array`s are not vectorized, because NumPy integer arithmetic can overflow. When the source
+    is a NumPy array, the results are NumPy scalars and arrays, with NumPy overflow semantics.
+    `sum()` and `average()` add floats in double precision, also for `float32` arrays, but may
+    differ in rounding from the generic implementation.
+
+    Users should not construct instances of this class directly. Use `Enumerable.as_numeric()` instead.
+
+    Revisions
+        ~ v1.3.0: New.
+    '''
+
+    def __init__(self, *args): ...
+
+    def as_numeric(self) -> NumericEnumerable[TSource_co]:
+        '''
+        Returns itself.
+        '''
+
+    @overload
+    def average(self: Enumerable[SupportsAverage[TResult]]) -> TResult:
+        '''
+        Computes the average value of the sequence, using `numpy.mean()` if possible. Raises
+        `InvalidOperationError` if there is no value.
+        '''
+
+    @overload
+    def average(self, __selector: Callable[[TSource_co], SupportsAverage[TResult]]) -> TResult:
+        '''
+        Computes the average value of the sequence using the selector, which is vectorized as in
+        `select()`. Raises `InvalidOperationError` if there is no value.
+        '''
+
+    @overload
+    def max(self: Enumerable[TSupportsLessThan]) -> TSupportsLessThan:
+        '''
+        Returns the maximum value in the sequence, using `numpy.ndarray.max()` or the builtin `max()`.
+        Raises `InvalidOperationError` if there is no value.
+        '''
+
+    @overload
+    def max(self, __result_selector: Callable[[TSource_co], TSupportsLessThan]) -> TSupportsLessThan:
+        '''
+        Invokes a transform function on each element of the sequence, which is vectorized as in
+        `select()`, and returns the maximum of the resulting values. Raises `InvalidOperationError`
+        if there is no value.
+        '''
+
+    @overload
+    def min(self: Enumerable[TSupportsLessThan]) -> TSupportsLessThan:
+        '''
+        Returns the minimum value in the sequence, using `numpy.ndarray.min()` or the builtin `min()`.
+        Raises `InvalidOperationError` if there is no value.
+        '''
+
+    @overload
+    def min(self, __result_selector: Callable[[TSource_co], TSupportsLessThan]) -> TSupportsLessThan:
+        '''
+        Invokes a transform function on each element of the sequence, which is vectorized as in
+        `select()`, and returns the minimum of the resulting values. Raises `InvalidOperationError`
+        if there is no value.
+        '''
+
+    def select(self, selector: Callable[[TSource_co], TResult]) -> NumericEnumerable[TResult]:
+        '''
+        Projects each element of the sequence into a new form. If the source is an array, the
+        selector is called with the whole array, so arithmetic selectors such as `lambda x: x * 2 + 1`
+        run in NumPy.
+
+        Example
+        ```py
+        >>> import numpy as np
+        >>> print(Enumerable(np.arange(5)).as_numeric().select(lambda x: x * x).sum())
+        30
+        ```
+        '''
+
+    @overload
+    def sum(self: Enumerable[TSupportsAdd]) -> Union[TSupportsAdd, int]:
+        '''
+        Computes the sum of the sequence, or `0` if the sequence is empty, using
+        `numpy.ndarray.sum()` if possible.
+        '''
+
+    @overload
+    def sum(self, __selector: Callable[[TSource_co], TSupportsAdd]) -> Union[TSupportsAdd, int]:
+        '''
+        Computes the sum of the sequence using the selector, which is vectorized as in `select()`.
+        Returns `0` if the sequence is empty.
+        '''
+
+    def where(self, predicate: Callable[[TSource_co], bool]) -> NumericEnumerable[TSource_co]:
+        '''
+        Filters the sequence of values based on a predicate. If the source is an array, the predicate
+        is called with the whole array, so comparisons such as `lambda x: x > 0` produce a boolean
+        mask in NumPy.
+
+        Example
+        ```py
+        >>> import numpy as np
+        >>> print(Enumerable(np.array([3, -1, 4, -1, 5])).as_numeric().where(lambda x: x > 0).sum())
+        12
+        ```
+        '''
@@ -1,7 +1,10 @@
 from __future__ import annotations
-from typing import Any, Callable, Generic, Iterable, Iterator, Optional
+from functools import cmp_to_key
+import heapq
+from typing import Any, Callable, Generic, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 from .enumerable import Enumerable
+from .instrumentation import note_materialized
 
 from .more_typing import (
     TSource_co,
@@ -16,6 +19,7 @@ class OrderedEnumerable(Enumerable[TSource_co], Generic[TSource_co, TKey]):
     _key_selector: Callable[[TSource_co], TKey]
     _comparer: Optional[Callable[[TKey, TKey], int]]
     _descending: bool
+    _lazy: bool
 
     def __init__(self,
         source: Callable[[], Iterable[TSource_co]],  # pass along
@@ -23,32 +27,149 @@ class OrderedEnumerable(Enumerable[TSource_co], Generic[TSource_co, TKey]):
         key_selector: Callable[[TSource_co], TKey],
         comparer: Optional[Callable[[TKey, TKey], int]],
         descending: bool,
+        lazy: bool,
     ):
         super().__init__(source)
         self._parent = parent
         self._key_selector = key_selector
         self._comparer = comparer
         self._descending = descending
+        self._lazy = lazy
 
-    def _get_iterable(self) -> Iterator[TSource_co]:
-        lst = [elem for elem in super()._get_iterable()]
+    def _levels(self) -> List[OrderedEnumerable[TSource_co, Any]]:
+        levels: List[OrderedEnumerable[TSource_co, Any]] = []
         curr = self
         while curr is not None:
-            comparer = curr._comparer
-            if comparer is None:
-                # comparer-less overload for order_by(), etc. ensures TSource_co must support __lt__()
-                key = curr._key_selector  # type: ignore
-            else:
-                selector = curr._key_selector
-                class key:
-                    def __init__(self, elem):
-                        self.elem = elem
-                    def __lt__(self, __o: key):
-                        return comparer(selector(self.elem), selector(__o.elem)) < 0  # type: ignore
-                    # it is OK to omit __eq__() because python sort only uses __lt__()
-            lst.sort(key=key, reverse=curr._descending)
+            levels.append(curr)
             curr = curr._parent
-        yield from lst
+        levels.reverse()
+        return levels
+
+    def _sort_keys(self, lst: List[TSource_co]) -> Tuple[Sequence[Any], bool]:
+        # composite keys of the elements, and whether they are sorted in descending order. levels
+        # whose direction differs from the first level have their keys inverted
+        levels = self._levels()
+        reverse = levels[0]._descending
+        columns = [_key_column(lst, level, level._descending != reverse) for level in levels]
+        keys = columns[0] if len(columns) == 1 else [*zip(*columns)]
+        return keys, reverse
+
+    def _get_iterable(self) -> Iterable[TSource_co]:
+        # all levels share the unsorted source
+        lst = [elem for elem in super()._get_iterable()]
+        note_materialized(len(lst))
+        if self._lazy:
+            return self._lazy_sort(lst)
+        return self._sort(lst)
+
+    def _sort(self, lst: List[TSource_co]) -> List[TSource_co]:
+        if self._parent is None and self._comparer is None:
+            # comparer-less overload for order_by(), etc. ensures TSource_co must support __lt__()
+            lst.sort(key=self._key_selector, reverse=self._descending)  # type: ignore
+            return lst
+
+        # sort once by composite keys
+        keys, reverse = self._sort_keys(lst)
+        indices = sorted(range(len(lst)), key=keys.__getitem__, reverse=reverse)
+        # the sorted list makes len() and indexing available to subsequent operators
+        return [lst[i] for i in indices]
+
+    def _lazy_sort(self, lst: List[TSource_co]) -> Iterator[TSource_co]:
+        # yields batches of the next elements selected from the remaining ones. the batches grow
+        # geometrically until the remaining elements are few enough to be sorted at once
+        keys, reverse = self._sort_keys(lst)
+        key = keys.__getitem__
+        select = heapq.nlargest if reverse else heapq.nsmallest
+        remaining: Sequence[int] = range(len(lst))
+        batch = _lazy_sort_first_batch
+        while batch * _partial_sort_ratio < len(remaining):
+            selected = select(batch, remaining, key=key)
+            for i in selected:
+                yield lst[i]
+            # the remaining indices stay in encounter order to keep the selection stable
+            selected_set = set(selected)
+            remaining = [i for i in remaining if i not in selected_set]
+            batch *= 8
+        for i in sorted(remaining, key=key, reverse=reverse):
+            yield lst[i]
+
+    def _select(self, count: int, last: bool) -> List[TSource_co]:
+        # returns the first (or last) count elements of the sorted sequence without sorting it
+        # as a whole
+        lst = [elem for elem in super()._get_iterable()]
+        note_materialized(len(lst))
+        if count * _partial_sort_ratio >= len(lst):
+            # a full sort is faster if a large part of the sequence is needed
+            lst = self._sort(lst)
+            return lst[max(len(lst) - count, 0):] if last else lst[:count]
+        keys, reverse = self._sort_keys(lst)
+        indices: Iterable[int] = range(len(lst))
+        if last:
+            # the last elements in a stable order are the first elements when both the order
+            # and the sequence are reversed
+            indices = reversed(indices)  # type: ignore
+            reverse = not reverse
+        # like sorted(), heapq.nsmallest() and nlargest() keep equal elements in encounter order
+        select = heapq.nlargest if reverse else heapq.nsmallest
+        selected = select(count, indices, key=keys.__getitem__)
+        if last:
+            selected.reverse()
+        return [lst[i] for i in selected]
+
+    def _fuse(self, kind: str, arg: Any) -> Enumerable[Any]:
+        if kind == 'slice' and arg[1] is not None:
+            # take() only needs the leading elements
+            stop = arg[1]
+            return Enumerable(lambda: self._select(stop, last=False))._fuse(kind, arg)
+        elif kind == 'take_last':
+            return Enumerable(lambda: self._select(arg, last=True))
+        return super()._fuse(kind, arg)
+
+    def _getitem_impl(self,
+        index: Union[int, slice],
+        fallback: bool,
+    ) -> Union[TSource_co, Enumerable[TSource_co]]:
+        if isinstance(index, int):
+            if index >= 0:
+                lst = self._select(index + 1, last=False)
+                if len(lst) <= index:
+                    self._raise_not_enough_elements()
+                return lst[index]
+            else:
+                lst = self._select(-index, last=True)
+                if len(lst) < -index:
+                    self._raise_not_enough_elements()
+                return lst[0]
+
+        else:  # isinstance(index, slice)
+            start, stop, step = index.start, index.stop, index.step
+            if stop is not None and stop >= 0 and (start is None or start >= 0) \
+                and (step is None or step > 0):
+                # the slice only involves the leading elements
+                return Enumerable(self._select(stop, last=False))._getitem_impl(index, fallback)
+            return super()._getitem_impl(index, fallback)
+
+    def last(self, *args: Callable[[TSource_co], bool]) -> TSource_co:
+        if len(args) == 0:
+            lst = self._select(1, last=True)
+            if not lst:
+                self._raise_empty_sequence()
+            return lst[0]
+
+        else:  # len(args) == 1
+            return super().last(*args)
+
+    def last2(self, *args):
+        if len(args) == 1:
+            lst = self._select(1, last=True)
+            return lst[0] if lst else args[0]
+
+        else:  # len(args) == 2
+            return super().last2(*args)
+
+    def _len_impl(self, fallback: bool) -> int:
+        # sorting does not change the number of elements, so count the unsorted source
+        return Enumerable(Enumerable._get_iterable(self))._len_impl(fallback)
 
     def create_ordered_enumerable(self,
         key_selector: Callable[[TSource_co], TKey2],
@@ -56,11 +177,12 @@ class OrderedEnumerable(Enumerable[TSource_co], Generic[TSource_co, TKey]):
         descending: bool,
     ) -> OrderedEnumerable[TSource_co, TKey2]:
         return OrderedEnumerable(
-            self._get_iterable,
+            super()._get_iterable,
             self,
             key_selector,
             comparer,
             descending,
+            self._lazy,
         )
 
     def then_by(self,
@@ -90,3 +212,67 @@ class OrderedEnumerable(Enumerable[TSource_co], Generic[TSource_co, TKey]):
             comparer,
             True,
         )
+
+
+# partial selection is used if fewer than 1/_partial_sort_ratio of the elements are needed
+_partial_sort_ratio = 32
+
+# the number of elements selected before others when lazily sorting
+_lazy_sort_first_batch = 64
+
+
+# builtin types whose == agrees with <, so that tuples of them compare as the keys would
+_plain_key_types = {int, float, str, bytes, bool}
+
+
+def _key_column(lst: List[Any], level: OrderedEnumerable[Any, Any], invert: bool) -> List[Any]:
+    # calls the key selector of the level once for each element
+    keys = [*map(level._key_selector, lst)]
+    comparer = level._comparer
+    if comparer is not None:
+        if invert:
+            comparer = _flip(comparer)
+        return [*map(cmp_to_key(comparer), keys)]
+    types = {type(key) for key in keys}
+    if not types <= _plain_key_types:
+        # tuples check == before <. other keys are only known to support <
+        keys = [*map(_LtKey, keys)]
+        if invert:
+            keys = [*map(_Inverted, keys)]
+    elif invert:
+        if types <= {int, float}:
+            return [-key for key in keys]
+        # replace the keys with their negated ranks among the distinct keys
+        ranks = {key: -i for i, key in enumerate(sorted(set(keys)))}
+        keys = [*map(ranks.__getitem__, keys)]
+    return keys
+
+
+def _flip(comparer: Callable[[Any, Any], int]) -> Callable[[Any, Any], int]:
+    return lambda x, y: comparer(y, x)
+
+
+class _LtKey:
+    __slots__ = ('key',)
+
+    def __init__(self, key: Any):
+        self.key = key
+
+    def __lt__(self, other: _LtKey) -> bool:
+        return self.key < other.key
+
+    def __eq__(self, other: _LtKey) -> bool:  # type: ignore[override]
+        return not (self.key < other.key or other.key < self.key)
+
+
+class _Inverted:
+    __slots__ = ('key',)
+
+    def __init__(self, key: Any):
+        self.key = key
+
+    def __lt__(self, other: _Inverted) -> bool:
+        return other.key < self.key
+
+    def __eq__(self, other: _Inverted) -> bool:  # type: ignore[override]
+        return self.key == other.key
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Callable, Generic, Optional, overload
+from typing import Any, Callable, Generic, List, Optional, overload
 
 from .enumerable import Enumerable
 from .more_typing import (
@@ -18,11 +18,25 @@ class OrderedEnumerable(Enumerable[TSource_co], Generic[TSource_co, TKey]):
 
     Represents a sorted Enumerable sequence that is sorted by some key.
 
+    If only a few leading or trailing elements are requested, using `take()`, `take_last()`,
+    `first()`, `first2()`, `last()`, `last2()`, `element_at()` or indexing with an integer or a
+    slice of nonnegative bounds, the elements are selected using a heap instead of sorting the whole
+    sequence. The result is the same as that of the full stable sort.
+
     Users should not construct instances of this class directly. Use `Enumerable.order_by()` instead.
+
+    Revisions
+        ~ v1.3.0: Partial sorting for operations that only need the leading or trailing elements.
     '''
 
+    _key_selector: Callable[[TSource_co], TKey]  # internal
+    _comparer: Optional[Callable[[TKey, TKey], int]]  # internal
+    _descending: bool  # internal
+
     def __init__(self, *args): ...
 
+    def _levels(self) -> List[OrderedEnumerable[TSource_co, Any]]: ...  # internal
+
     def create_ordered_enumerable(self,
         key_selector: Callable[[TSource_co], TKey2],
         comparer: Optional[Callable[[TKey2, TKey2], int]],
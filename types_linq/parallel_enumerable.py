@@ -0,0 +1,217 @@
+from __future__ import annotations
+from concurrent.futures import Executor, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from itertools import chain
+import os
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Optional, Tuple
+
+from .enumerable import Enumerable
+from .types_linq_error import InvalidOperationError
+from .util import batches, return_second
+
+from .more_typing import (
+    TSource_co,
+)
+
+
+# an operation is (kind, argument) applied to the elements of every chunk in a worker. the kinds
+# and their arguments are
+# - 'select', 'where': the selector or predicate
+# - 'select_many': a (collection_selector, result_selector) pair
+_Op = Tuple[str, Any]
+
+
+class ParallelEnumerable(Enumerable[TSource_co]):
+
+    _source: Iterable[Any]
+    _ops: Tuple[_Op, ...]
+    _executor: Optional[Executor]
+    _chunk_size: int
+    _ordered: bool
+
+    def __init__(self,
+        source: Iterable[Any],
+        ops: Tuple[_Op, ...],
+        executor: Optional[Executor],
+        chunk_size: int,
+        ordered: bool,
+    ):
+        if chunk_size < 1:
+            raise InvalidOperationError('chunk_size must be greater than 0')
+        super().__init__(self._enumerate)
+        self._source = source
+        self._ops = ops
+        self._executor = executor
+        self._chunk_size = chunk_size
+        self._ordered = ordered
+
+    def _with_op(self, kind: str, arg: Any) -> ParallelEnumerable[Any]:
+        return ParallelEnumerable(
+            self._source,
+            (*self._ops, (kind, arg)),
+            self._executor,
+            self._chunk_size,
+            self._ordered,
+        )
+
+    def _map_chunks(self, fn: Callable[..., Any], *args: Any) -> Iterator[Any]:
+        # yields fn(ops, chunk, *args) for each chunk of the source, computed in the executor
+        if self._executor is None:
+            with ThreadPoolExecutor() as executor:
+                yield from self._submit_chunks(executor, fn, args)
+        else:
+            yield from self._submit_chunks(self._executor, fn, args)
+
+    def _submit_chunks(self,
+        executor: Executor,
+        fn: Callable[..., Any],
+        args: Tuple[Any, ...],
+    ) -> Iterator[Any]:
+        chunks = batches(self._source, self._chunk_size)
+        # the source is pulled only as far as needed to keep the workers busy
+        max_pending = 2 * (os.cpu_count() or 1)
+        pending: Any = Deque() if self._ordered else set()
+        try:
+            if self._ordered:
+                for chunk in chunks:
+                    pending.append(executor.submit(fn, self._ops, chunk, *args))
+                    if len(pending) >= max_pending:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+            else:
+                for chunk in chunks:
+                    pending.add(executor.submit(fn, self._ops, chunk, *args))
+                    if len(pending) >= max_pending:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            yield future.result()
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+        finally:
+            # the enumeration is abandoned or a worker failed
+            for future in pending:
+                future.cancel()
+
+    def _enumerate(self) -> Iterator[Any]:
+        for lst in self._map_chunks(_run_chunk):
+            yield from lst
+
+    def aggregate(self, *args) -> Any:
+        if len(args) == 4:
+            seed, func, combiner, result_selector = args
+            partials = self._map_chunks(_aggregate_chunk, seed, func)
+            acc = next(partials, seed)
+            for partial in partials:
+                acc = combiner(acc, partial)
+            return result_selector(acc)
+
+        else:  # len(args) in (1, 2, 3)
+            return super().aggregate(*args)
+
+    def as_parallel(self, *,  # pyright: ignore[reportIncompatibleMethodOverride]
+        executor: Optional[Executor] = None,
+        chunk_size: int = 1024,
+        ordered: bool = True,
+    ) -> ParallelEnumerable[TSource_co]:
+        return ParallelEnumerable(self._source, self._ops, executor, chunk_size, ordered)
+
+    def count(self, *args: Callable[[TSource_co], bool]) -> int:
+        if len(args) == 0:
+            return sum(self._map_chunks(_count_chunk))
+
+        else:  # len(args) == 1
+            return self.where(args[0]).count()
+
+    def select(self, selector: Callable[[TSource_co], Any]) -> ParallelEnumerable[Any]:
+        return self._with_op('select', selector)
+
+    def select_many(self,  # pyright: ignore[reportIncompatibleMethodOverride]
+        collection_selector: Callable[[TSource_co], Iterable[Any]],
+        *args: Callable[[TSource_co, Any], Any],
+    ) -> ParallelEnumerable[Any]:
+        if len(args) == 0:
+            result_selector: Any = return_second
+        else:  # len(args) == 1
+            result_selector = args[0]
+        return self._with_op('select_many', (collection_selector, result_selector))
+
+    def sum(self, *args) -> Any:
+        if len(args) == 0:
+            # each partial list holds the sum of a nonempty chunk
+            partials = chain.from_iterable(self._map_chunks(_sum_chunk))
+            for sum_ in partials:
+                for partial in partials:
+                    sum_ += partial
+                return sum_
+            return 0
+
+        else:  # len(args) == 1
+            return self.select(args[0]).sum()
+
+    def to_list(self) -> List[TSource_co]:
+        lst: List[Any] = []
+        for chunk in self._map_chunks(_run_chunk):
+            lst.extend(chunk)
+        return lst
+
+    def where(self, predicate: Callable[[TSource_co], bool]) -> ParallelEnumerable[TSource_co]:
+        return self._with_op('where', predicate)
+
+
+# the following functions run in the workers. they are defined at the module level so that
+# process pools can pickle them
+
+
+def _apply_ops(ops: Tuple[_Op, ...], chunk: List[Any]) -> Iterator[Any]:
+    it: Iterator[Any] = iter(chunk)
+    for kind, arg in ops:
+        if kind == 'select':
+            it = map(arg, it)
+        elif kind == 'where':
+            it = filter(arg, it)
+        else:  # kind == 'select_many'
+            it = _select_many(it, *arg)
+    return it
+
+
+def _select_many(
+    it: Iterator[Any],
+    collection_selector: Callable[[Any], Iterable[Any]],
+    result_selector: Callable[[Any, Any], Any],
+) -> Iterator[Any]:
+    for elem in it:
+        for sub in collection_selector(elem):
+            yield result_selector(elem, sub)
+
+
+def _run_chunk(ops: Tuple[_Op, ...], chunk: List[Any]) -> List[Any]:
+    return [*_apply_ops(ops, chunk)]
+
+
+def _count_chunk(ops: Tuple[_Op, ...], chunk: List[Any]) -> int:
+    count = 0
+    for _ in _apply_ops(ops, chunk):
+        count += 1
+    return count
+
+
+def _sum_chunk(ops: Tuple[_Op, ...], chunk: List[Any]) -> List[Any]:
+    it = _apply_ops(ops, chunk)
+    for sum_ in it:
+        for elem in it:
+            sum_ += elem
+        return [sum_]
+    return []
+
+
+def _aggregate_chunk(
+    ops: Tuple[_Op, ...],
+    chunk: List[Any],
+    seed: Any,
+    func: Callable[[Any, Any], Any],
+) -> Any:
+    for elem in _apply_ops(ops, chunk):
+        seed = func(seed, elem)
+    return seed
@@ -0,0 +1,156 @@
+from concurrent.futures import Executor
+from typing import Callable, Iterable, List, Optional, Union, overload
+
+from .enumerable import Enumerable
+from .more_typing import (
+    TAccumulate,
+    TCollection,
+    TResult,
+    TSource_co,
+    TSupportsAdd,
+)
+
+
+class ParallelEnumerable(Enumerable[TSource_co]):
+    '''
+    ```py
+    from types_linq.parallel_enumerable import ParallelEnumerable
+    ```
+
+    Enumerable that evaluates its `select()`, `where()` and `select_many()` calls, and its `sum()`,
+    `count()`, `aggregate()` and `to_list()` methods, over chunks of the source concurrently using
+    a `concurrent.futures.Executor`. Other query methods run sequentially on the results.
+
+    Users should not construct instances of this class directly. Use `Enumerable.as_parallel()` instead.
+
+    Revisions
+        ~ v1.3.0: New.
+    '''
+
+    def __init__(self, *args): ...
+
+    @overload
+    def aggregate(self,
+        __seed: TAccumulate,
+        __func: Callable[[TAccumulate, TSource_co], TAccumulate],
+        __result_selector: Callable[[TAccumulate], TResult],
+    ) -> TResult:
+        '''
+        Applies an accumulator function over the sequence sequentially. The seed is used as the
+        initial accumulator value, and the result_selector is used to select the result value.
+        '''
+
+    @overload
+    def aggregate(self,
+        __seed: TAccumulate,
+        __func: Callable[[TAccumulate, TSource_co], TAccumulate],
+    ) -> TAccumulate:
+        '''
+        Applies an accumulator function over the sequence sequentially. The seed is used as the
+        initial accumulator value.
+        '''
+
+    @overload
+    def aggregate(self,
+        __func: Callable[[TSource_co, TSource_co], TSource_co],
+    ) -> TSource_co:
+        '''
+        Applies an accumulator function over the sequence sequentially. Raises
+        `InvalidOperationError` if there is no value in the sequence.
+        '''
+
+    @overload
+    def aggregate(self,
+        __seed: TAccumulate,
+        __func: Callable[[TAccumulate, TSource_co], TAccumulate],
+        __combiner: Callable[[TAccumulate, TAccumulate], TAccumulate],
+        __result_selector: Callable[[TAccumulate], TResult],
+    ) -> TResult:
+        '''
+        Applies an accumulator function over each chunk of the sequence in parallel, starting from
+        the seed. The partial results are then merged in order using the combiner, and the
+        result_selector is used to select the result value.
+
+        The seed is used as the initial value of every chunk, so it should not be mutated by func.
+
+        Example
+        ```py
+        >>> Enumerable.range(1, 10).as_parallel(chunk_size=3) \\
+        ...     .aggregate(0, lambda acc, e: acc + e * e, lambda a, b: a + b, str)
+        '385'
+        ```
+        '''
+
+    def as_parallel(self, *,
+        executor: Optional[Executor] = None,
+        chunk_size: int = 1024,
+        ordered: bool = True,
+    ) -> ParallelEnumerable[TSource_co]:
+        '''
+        Returns a ParallelEnumerable with the same pending operations using the new settings.
+
+        Raises `InvalidOperationError` if chunk_size is less than 1.
+        '''
+
+    @overload
+    def count(self) -> int:
+        '''
+        Returns the number of elements in the sequence. The chunks are counted in parallel.
+        '''
+
+    @overload
+    def count(self, __predicate: Callable[[TSource_co], bool]) -> int:
+        '''
+        Returns the number of elements that satisfy the condition. The predicate is evaluated in
+        parallel.
+        '''
+
+    def select(self, selector: Callable[[TSource_co], TResult]) -> ParallelEnumerable[TResult]:
+        '''
+        Projects each element of the sequence into a new form. The selector is evaluated in parallel.
+        '''
+
+    @overload
+    def select_many(self,
+        collection_selector: Callable[[TSource_co], Iterable[TCollection]],
+        __result_selector: Callable[[TSource_co, TCollection], TResult],
+    ) -> ParallelEnumerable[TResult]:
+        '''
+        Projects each element of the sequence into an iterable, flattens the resulting sequence
+        into one sequence, then calls result_selector on each element therein. The selectors are
+        evaluated in parallel.
+        '''
+
+    @overload
+    def select_many(self,
+        __selector: Callable[[TSource_co], Iterable[TResult]],
+    ) -> ParallelEnumerable[TResult]:
+        '''
+        Projects each element of the sequence to an iterable and flattens the resultant sequences.
+        The selector is evaluated in parallel.
+        '''
+
+    @overload
+    def sum(self: ParallelEnumerable[TSupportsAdd]) -> Union[TSupportsAdd, int]:
+        '''
+        Computes the sum of the sequence, or `0` if the sequence is empty. The chunks are summed in
+        parallel.
+        '''
+
+    @overload
+    def sum(self, __selector: Callable[[TSource_co], TSupportsAdd]) -> Union[TSupportsAdd, int]:
+        '''
+        Computes the sum of the sequence using the selector. Returns `0` if the sequence is empty.
+        The selector is evaluated and the chunks are summed in parallel.
+        '''
+
+    def to_list(self) -> List[TSource_co]:
+        '''
+        Enumerates all values and returns a list containing them. The pending operations are
+        evaluated in parallel.
+        '''
+
+    def where(self, predicate: Callable[[TSource_co], bool]) -> ParallelEnumerable[TSource_co]:
+        '''
+        Filters the sequence of values based on a predicate. The predicate is evaluated in parallel.
+        '''
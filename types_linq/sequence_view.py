@@ -0,0 +1,141 @@
+from __future__ import annotations
+from itertools import chain, count
+from typing import Any, Callable, Iterable, Iterator, Sequence, Tuple, Union
+
+from .more_typing import (
+    TValue,
+)
+
+
+class SliceView(Sequence[TValue]):
+    '''
+    A lazy view of the elements of a random-access sequence at a range of indices.
+    '''
+
+    _seq: Sequence[TValue]
+    _indices: range
+
+    def __init__(self, seq: Sequence[TValue], indices: range) -> None:
+        self._seq = seq
+        self._indices = indices
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:  # type: ignore[override]
+        if isinstance(index, slice):
+            return SliceView(self._seq, self._indices[index])
+        return self._seq[self._indices[index]]
+
+    def __iter__(self) -> Iterator[TValue]:
+        return map(self._seq.__getitem__, self._indices)
+
+    def __reversed__(self) -> Iterator[TValue]:
+        return map(self._seq.__getitem__, reversed(self._indices))
+
+
+class _IndexedView(Sequence[TValue]):
+    # subclasses implement __len__(), __iter__() and _at() which takes a nonnegative index less
+    # than the length
+    _at: Callable[[int], TValue]
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:  # type: ignore[override]
+        if isinstance(index, slice):
+            return SliceView(self, range(len(self))[index])
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError('view index out of range')
+        return self._at(index)
+
+
+class SelectView(_IndexedView[TValue]):
+    '''
+    A lazy view of a random-access sequence with a selector applied to each accessed element.
+    '''
+
+    _seq: Sequence[Any]
+    _selector: Callable[..., TValue]
+    _with_index: bool
+
+    def __init__(self, seq: Sequence[Any], selector: Callable[..., TValue], with_index: bool) -> None:
+        self._seq = seq
+        self._selector = selector
+        self._with_index = with_index
+
+    def __len__(self) -> int:
+        return len(self._seq)
+
+    def _at(self, index: int) -> TValue:
+        if self._with_index:
+            return self._selector(self._seq[index], index)
+        return self._selector(self._seq[index])
+
+    def __iter__(self) -> Iterator[TValue]:
+        if self._with_index:
+            return map(self._selector, self._seq, count())
+        return map(self._selector, self._seq)
+
+
+class ZipView(_IndexedView[Tuple[Any, ...]]):
+    '''
+    A lazy view of tuples of elements at the same positions of random-access sequences.
+    '''
+
+    _seqs: Tuple[Sequence[Any], ...]
+
+    def __init__(self, seqs: Tuple[Sequence[Any], ...]) -> None:
+        self._seqs = seqs
+
+    def __len__(self) -> int:
+        return min(len(seq) for seq in self._seqs)
+
+    def _at(self, index: int) -> Tuple[Any, ...]:
+        return tuple(seq[index] for seq in self._seqs)
+
+    def __iter__(self) -> Iterator[Tuple[Any, ...]]:
+        return zip(*self._seqs)
+
+
+class ConcatView(_IndexedView[TValue]):
+    '''
+    A lazy view of two random-access sequences placed one after another.
+    '''
+
+    _first: Sequence[TValue]
+    _second: Sequence[TValue]
+
+    def __init__(self, first: Sequence[TValue], second: Sequence[TValue]) -> None:
+        self._first = first
+        self._second = second
+
+    def __len__(self) -> int:
+        return len(self._first) + len(self._second)
+
+    def _at(self, index: int) -> TValue:
+        len_first = len(self._first)
+        if index < len_first:
+            return self._first[index]
+        return self._second[index - len_first]
+
+    def __iter__(self) -> Iterator[TValue]:
+        return chain(self._first, self._second)
+
+
+# builtin sequences whose __len__() and __getitem__() are known to run in constant time. other
+# Sequence implementations (deque, Enumerable itself, ...) may have to walk elements to index
+_random_access_types = (
+    list, tuple, range, str, bytes, bytearray,
+    SliceView, SelectView, ZipView, ConcatView,
+)
+
+
+def is_random_access(iterable: Iterable[Any]) -> bool:
+    return isinstance(iterable, _random_access_types)
+
+
+def slice_view(seq: Sequence[TValue], s: slice) -> Sequence[TValue]:
+    if isinstance(seq, (range, SliceView)):
+        return seq[s]  # type: ignore
+    return SliceView(seq, range(len(seq))[s])
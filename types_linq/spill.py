@@ -0,0 +1,96 @@
+from __future__ import annotations
+import pickle
+import tempfile
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from .grouping import Grouping
+from .util import ComposeMap
+
+
+# the number of temporary files the elements are partitioned into by the numbers of their keys
+_partition_count = 64
+
+
+def spilled_groupings(
+    source: Iterable[Any],
+    key_selector: Callable[[Any], Any],
+    value_selector: Callable[[Any], Any],
+    threshold: int,
+    spill_dir: Optional[str],
+) -> Iterator[Grouping[Any, Any]]:
+    # groups the elements in memory until threshold elements are buffered. then the buffered
+    # groups are moved to the partition files, and after the source is exhausted the groups are
+    # rebuilt one partition at a time
+    # the keys stay in memory, each numbered by its first appearance. the files only hold these
+    # numbers, so keys are never compared after a round trip through pickle, and the groups are
+    # rebuilt with the original key objects
+    # values are buffered in plain lists. groupings are only created when they are returned
+    ordinals: ComposeMap[Any, int] = ComposeMap()
+    keys: List[Any] = []
+    groups: Dict[int, List[Any]] = {}
+    buffered = 0
+    partitions: List[IO[bytes]] = []
+    try:
+        for src in source:
+            key = key_selector(src)
+            ordinal = ordinals.get(key)
+            if ordinal is None:
+                ordinal = ordinals[key] = len(keys)
+                keys.append(key)
+            values = groups.get(ordinal)
+            if values is None:
+                values = groups[ordinal] = []
+            values.append(value_selector(src))
+            buffered += 1
+            if buffered >= threshold:
+                if not partitions:
+                    partitions = [tempfile.TemporaryFile(dir=spill_dir) for _ in range(_partition_count)]
+                _spill(groups, partitions)
+                groups = {}
+                buffered = 0
+
+        if not partitions:
+            # everything fits in memory. the groups are in the usual order
+            yield from _to_groupings(groups, keys)
+            return
+        _spill(groups, partitions)
+        del groups
+
+        for file in partitions:
+            file.seek(0)
+            # new ordinals are added in increasing order, so the groups of a partition are in the
+            # order of their first elements
+            part: Dict[int, List[Any]] = {}
+            while True:
+                try:
+                    chunk = pickle.load(file)
+                except EOFError:
+                    break
+                for ordinal, values in chunk:
+                    existing = part.get(ordinal)
+                    if existing is None:
+                        part[ordinal] = values
+                    else:
+                        existing.extend(values)
+            file.close()
+            yield from _to_groupings(part, keys)
+    finally:
+        # the enumeration is finished or abandoned
+        for file in partitions:
+            file.close()
+
+
+def _to_groupings(groups: Dict[int, List[Any]], keys: List[Any]) -> Iterator[Grouping[Any, Any]]:
+    for ordinal, values in groups.items():
+        grouping: Grouping[Any, Any] = Grouping(keys[ordinal])
+        grouping._values.extend(values)
+        yield grouping
+
+
+def _spill(groups: Dict[int, List[Any]], partitions: List[IO[bytes]]) -> None:
+    chunks: List[List[Any]] = [[] for _ in partitions]
+    for ordinal, values in groups.items():
+        chunks[ordinal % len(partitions)].append((ordinal, values))
+    for file, chunk in zip(partitions, chunks):
+        if chunk:
+            pickle.dump(chunk, file, pickle.HIGHEST_PROTOCOL)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+from typing import Any, Generic, Union
+
+from .types_linq_error import InvalidOperationError
+
+from .more_typing import (
+    TValue_co,
+)
+
+
+class Stats(Generic[TValue_co]):
+    '''
+    ```py
+    from types_linq.stats import Stats
+    ```
+
+    Holds the count, sum, minimum, maximum and average of a sequence, computed in one enumeration.
+
+    Users should not construct instances of this class directly. Use `Enumerable.stats()` instead.
+
+    Revisions
+        ~ v1.3.0: New.
+    '''
+
+    _count: int
+    _sum: Union[TValue_co, int]
+    _min: TValue_co
+    _max: TValue_co
+
+    def __init__(self,
+        count: int,
+        sum: Union[TValue_co, int],
+        min: TValue_co,
+        max: TValue_co,
+    ):
+        self._count = count
+        self._sum = sum
+        self._min = min
+        self._max = max
+
+    def _check_not_empty(self) -> None:
+        if self._count == 0:
+            raise InvalidOperationError('Sequence is empty')
+
+    @property
+    def count(self) -> int:
+        '''
+        Gets the number of elements in the sequence.
+        '''
+        return self._count
+
+    @property
+    def sum(self) -> Union[TValue_co, int]:
+        '''
+        Gets the sum of the sequence, or `0` if the sequence is empty.
+        '''
+        return self._sum
+
+    @property
+    def min(self) -> TValue_co:
+        '''
+        Gets the minimum value in the sequence. Raises `InvalidOperationError` if the sequence is
+        empty.
+        '''
+        self._check_not_empty()
+        return self._min
+
+    @property
+    def max(self) -> TValue_co:
+        '''
+        Gets the maximum value in the sequence. Raises `InvalidOperationError` if the sequence is
+        empty.
+        '''
+        self._check_not_empty()
+        return self._max
+
+    @property
+    def average(self) -> Any:
+        '''
+        Gets the average value of the sequence, that is, `sum / count`. Raises
+        `InvalidOperationError` if the sequence is empty.
+        '''
+        self._check_not_empty()
+        return self._sum / self._count  # type: ignore
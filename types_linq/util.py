@@ -1,5 +1,7 @@
 from __future__ import annotations
-from typing import Any, Tuple, Iterator, Hashable, List, Dict, Iterable, Set, Optional, MutableMapping, MutableSet
+from collections import deque
+from itertools import islice
+from typing import Any, Callable, Deque, Tuple, Iterator, Hashable, List, Dict, Iterable, Set, Optional, MutableMapping, MutableSet
 
 from .more_typing import (
     TKey,
@@ -28,36 +30,170 @@ def default_gt(x: TSupportsLessThan, y: TSupportsLessThan) -> bool:
     return y < x
 
 
-class _ListMap(MutableMapping[TKey, TValue]):
+def batches(iterable: Iterable[TValue], size: int) -> Iterator[List[TValue]]:
+    '''
+    Splits the iterable into lists of size elements, except the last one which may be shorter.
+    The elements are moved by builtin iterators instead of one generator step each.
+    '''
+    iterator = iter(iterable)
+    return iter(lambda: [*islice(iterator, size)], [])
+
+
+def lazy_slice(iterable: Iterable[TValue], s: slice) -> Iterator[TValue]:
+    '''
+    Yields the elements of iterable[s] in the same order as slicing a list. Elements are buffered
+    only as far as the negative bounds require: the last -start or -stop elements if a bound is
+    negative, or the elements between the bounds if the step is negative. Slicing a sequence of
+    unknown length backwards from the end down to a nonnegative bound still buffers its tail.
+    '''
+    start, stop, step = s.start, s.stop, s.step
+    if step is None:
+        step = 1
+    elif step == 0:
+        raise ValueError('slice step cannot be zero')
+    it = iter(iterable)
+
+    if step > 0:
+        if start is None:
+            start = 0
+        if start >= 0:
+            if stop is None or stop >= 0:
+                yield from islice(it, start, stop, step)
+            else:
+                yield from islice(_drop_last(islice(it, start, None), -stop), 0, None, step)
+            return
+        if stop is None:
+            yield from islice(deque(it, maxlen=-start), 0, None, step)
+        elif stop < 0:
+            tail = deque(it, maxlen=-start)
+            yield from islice(tail, 0, max(len(tail) + stop, 0), step)
+        else:
+            # keeps the last -start of the first stop elements, then counts the rest
+            tail: Deque[TValue] = deque(maxlen=-start)
+            head_len = 0
+            for head_len, elem in enumerate(islice(it, stop), 1):
+                tail.append(elem)
+            total = head_len + sum(1 for _ in it)
+            first = max(total + start, 0) - (head_len - len(tail))
+            yield from islice(tail, first, None, step)
+        return
+
+    if start is not None and start >= 0:
+        lo = 0 if stop is None or stop < 0 else stop + 1
+        buf = [*islice(it, lo, start + 1)]
+        if stop is not None and stop < 0:
+            # the elements up to stop from the end are excluded
+            total = lo + len(buf) + sum(1 for _ in it)
+            del buf[:max(total + stop + 1, 0)]
+        yield from islice(reversed(buf), 0, None, -step)
+    elif stop is not None and stop < 0:
+        # only the last -stop - 1 elements are in the range
+        tail = deque(it, maxlen=-stop - 1)
+        first = len(tail) - 1 if start is None else len(tail) + start
+        if first >= 0:
+            yield from islice(reversed(tail), len(tail) - 1 - first, None, -step)
+    else:
+        # the end of the sequence is unknown until it is exhausted
+        lo = 0 if stop is None else stop + 1
+        buf = [*islice(it, lo, None)]
+        first = len(buf) - 1 if start is None else len(buf) + start
+        if first >= 0:
+            yield from islice(reversed(buf), len(buf) - 1 - first, None, -step)
+
+
+def _drop_last(it: Iterator[TValue], count: int) -> Iterator[TValue]:
+    q = deque(islice(it, count), maxlen=count)
+    if len(q) < count:
+        return
+    for elem in it:
+        yield q[0]
+        q.append(elem)
+
+
+def _freeze(x: Any) -> Any:
+    # converts builtin unhashable containers to hashable values that are equal whenever the
+    # originals are equal
+    if isinstance(x, (list, tuple)):
+        return tuple(_freeze(e) for e in x)
+    if isinstance(x, dict):
+        return frozenset((k, _freeze(v)) for k, v in x.items())
+    if isinstance(x, set):
+        return frozenset(x)
+    if isinstance(x, bytearray):
+        return bytes(x)
+    return x
+
+
+def freeze_hash(x: Any) -> int:
+    '''
+    The default key hasher for unhashable keys. Lists, tuples, dicts, sets and bytearrays are
+    hashed by their contents. Raises `TypeError` for other unhashable objects.
+    '''
+    return hash(_freeze(x))
+
+
+class _BucketMap(MutableMapping[TKey, TValue]):
+    # stores keys that are not hashable. the keys are put into buckets by key_hasher and are only
+    # compared with == to the keys in the same bucket. key_hasher must return equal values for
+    # equal keys. keys on which it raises TypeError share one bucket
+
+    _key_hasher: Callable[[Any], Hashable]
+    _buckets: Dict[Hashable, List[int]]
+    # id -> (key, value). ids increase so that the entries are kept in insertion order
+    _entries: Dict[int, Tuple[TKey, TValue]]
+    _next_id: int
+
+    def __init__(self, key_hasher: Callable[[Any], Hashable]) -> None:
+        self._key_hasher = key_hasher
+        self._buckets = {}
+        self._entries = {}
+        self._next_id = 0
+
+    def _bucket_of(self, key: object) -> Hashable:
+        try:
+            return self._key_hasher(key)
+        except TypeError:
+            return None
+
+    def _find(self, ids: List[int], key: object) -> int:
+        for pos, id_ in enumerate(ids):
+            if self._entries[id_][0] == key:
+                return pos
+        return -1
 
-    def __init__(self) -> None:
-        self._lst: List[Tuple[TKey, TValue]] = list()
-    
     def __setitem__(self, key: TKey, value: TValue) -> None:
-        for i in range(0, len(self._lst)):
-            if self._lst[i][0] == key:
-                self._lst[i] = (self._lst[i][0], value)
-                return
-        self._lst.append((key, value))
-    
+        ids = self._buckets.setdefault(self._bucket_of(key), [])
+        pos = self._find(ids, key)
+        if pos < 0:
+            ids.append(self._next_id)
+            self._entries[self._next_id] = (key, value)
+            self._next_id += 1
+        else:
+            id_ = ids[pos]
+            self._entries[id_] = (self._entries[id_][0], value)
+
     def __getitem__(self, key: TKey) -> TValue:
-        for k, v in self._lst:
-            if k == key:
-                return v
-        raise KeyError(key)
+        ids = self._buckets.get(self._bucket_of(key), [])
+        pos = self._find(ids, key)
+        if pos < 0:
+            raise KeyError(key)
+        return self._entries[ids[pos]][1]
 
     def __delitem__(self, key: TKey) -> None:
-        for i in range(0, len(self._lst)):
-            if self._lst[i][0] == key:
-                del self._lst[i]
-                return
-        raise KeyError(key)
+        bucket = self._bucket_of(key)
+        ids = self._buckets.get(bucket, [])
+        pos = self._find(ids, key)
+        if pos < 0:
+            raise KeyError(key)
+        del self._entries[ids.pop(pos)]
+        if not ids:
+            del self._buckets[bucket]
 
     def __iter__(self) -> Iterator[TKey]:
-        return map(lambda e: e[0], self._lst)
+        return map(lambda e: e[0], self._entries.values())
 
     def __len__(self) -> int:
-        return len(self._lst)
+        return len(self._entries)
 
 
 # Wrap Map to Set
@@ -87,28 +223,43 @@ class _SetWrapper(MutableSet[TValue]):
         return self._map.__iter__()
 
 
+# caches whether the instances of a type are never hashable (its __hash__ is None, e.g. list and
+# dict), which avoids isinstance(x, Hashable) going through the ABC machinery on every call. other
+# instances may still fail to hash (e.g. a tuple containing a list), so their hash is attempted
+_unhashable_types: Dict[type, bool] = {}
+
+
+def _is_unhashable_type(tp: type) -> bool:
+    res = _unhashable_types.get(tp)
+    if res is None:
+        res = _unhashable_types[tp] = getattr(tp, '__hash__', None) is None
+    return res
+
+
 class ComposeSet(MutableSet[TValue]):
     '''
-    A set which support hashable and unhashable type
+    A set which support hashable and unhashable type. Unhashable values are grouped by key_hasher
     '''
     _set: Set[TValue]
     _cmp_set: MutableSet[TValue]
 
-    def __init__(self, iter: Optional[Iterable[TValue]] = None):
+    def __init__(self,
+        iter: Optional[Iterable[TValue]] = None,
+        key_hasher: Callable[[Any], Hashable] = freeze_hash,
+    ):
         self._set = set()
-        self._cmp_set = _SetWrapper(_ListMap())
+        self._cmp_set = _SetWrapper(_BucketMap(key_hasher))
         if iter:
             for item in iter:
                 self.add(item)
 
-    def _get_set(self, x: object) -> MutableSet[TValue]:
-        if isinstance(x, Hashable):
-            return self._set
-        else:
-            return self._cmp_set
-
     def __contains__(self, x: object) -> bool:
-        return x in self._get_set(x)
+        if not _is_unhashable_type(type(x)):
+            try:
+                return x in self._set
+            except TypeError:
+                pass
+        return x in self._cmp_set
 
     def __len__(self) -> int:
         return len(self._set) + len(self._cmp_set)
@@ -118,42 +269,98 @@ class ComposeSet(MutableSet[TValue]):
         yield from self._cmp_set
 
     def add(self, value: TValue) -> None:
-        return self._get_set(value).add(value)
+        if not _is_unhashable_type(type(value)):
+            try:
+                return self._set.add(value)
+            except TypeError:
+                pass
+        return self._cmp_set.add(value)
 
     def discard(self, value: TValue) -> None:
-        return self._get_set(value).discard(value)
+        if not _is_unhashable_type(type(value)):
+            try:
+                return self._set.discard(value)
+            except TypeError:
+                pass
+        return self._cmp_set.discard(value)
+
+    def try_add(self, value: TValue) -> bool:
+        '''
+        Adds the value if it is not in the set. Returns whether it is added. This looks up the
+        value once for hashable values.
+        '''
+        if not _is_unhashable_type(type(value)):
+            s = self._set
+            len_ = len(s)
+            try:
+                s.add(value)
+                return len(s) != len_
+            except TypeError:
+                pass
+        if value in self._cmp_set:
+            return False
+        self._cmp_set.add(value)
+        return True
 
 
 class ComposeMap(MutableMapping[TKey, TValue]):
     '''
-    A map which support hashable and unhashable key type
+    A map which support hashable and unhashable key type. Unhashable keys are grouped by key_hasher
     '''
     _map: Dict[TKey, TValue]
     _cmp_map: MutableMapping[TKey, TValue]
 
-    def __init__(self, iter: Optional[Iterable[Tuple[TKey, TValue]]] = None) -> None:
+    def __init__(self,
+        iter: Optional[Iterable[Tuple[TKey, TValue]]] = None,
+        key_hasher: Callable[[Any], Hashable] = freeze_hash,
+    ) -> None:
         self._map = dict()
-        self._cmp_map = _ListMap()
+        self._cmp_map = _BucketMap(key_hasher)
         if iter:
             for k, v in iter:
                 self[k] = v
 
-    def _get_map(self, x: object) -> MutableMapping[TKey, TValue]:
-        # TODO: this test is not perfectly sufficient.
-        # counterexample: x is namedtuple('t', ['x'])([])
-        if isinstance(x, Hashable):
-            return self._map
-        else:
-            return self._cmp_map
-
     def __setitem__(self, key: TKey, value: TValue):
-        self._get_map(key).__setitem__(key, value)
-    
+        if not _is_unhashable_type(type(key)):
+            try:
+                self._map[key] = value
+                return
+            except TypeError:
+                pass
+        self._cmp_map[key] = value
+
     def __getitem__(self, key: TKey) -> TValue:
-        return self._get_map(key).__getitem__(key)
+        if not _is_unhashable_type(type(key)):
+            try:
+                return self._map[key]
+            except TypeError:
+                pass
+        return self._cmp_map[key]
 
     def __delitem__(self, key: TKey) -> None:
-        return self._get_map(key).__delitem__(key)
+        if not _is_unhashable_type(type(key)):
+            try:
+                del self._map[key]
+                return
+            except TypeError:
+                pass
+        del self._cmp_map[key]
+
+    def __contains__(self, key: object) -> bool:
+        if not _is_unhashable_type(type(key)):
+            try:
+                return key in self._map
+            except TypeError:
+                pass
+        return key in self._cmp_map
+
+    def get(self, key: TKey, default: Any = None) -> Any:
+        if not _is_unhashable_type(type(key)):
+            try:
+                return self._map.get(key, default)
+            except TypeError:
+                pass
+        return self._cmp_map.get(key, default)
 
     def __iter__(self) -> Iterator[TKey]:
         # notice on iteration order: